@@ -66,6 +66,7 @@ from cirq._version import (
 from cirq.circuits import (
     Circuit,
     CircuitDag,
+    FusedPointOptimizer,
     InsertStrategy,
     PointOptimizationSummary,
     PointOptimizer,
@@ -134,8 +135,10 @@ from cirq.linalg import (
     is_unitary,
     kak_canonicalize_vector,
     kak_decomposition,
+    kak_decomposition_batch,
     kak_vector,
     KakDecomposition,
+    KakDecompositionBatch,
     kron,
     kron_bases,
     kron_factor_4x4_to_2x2s,
@@ -283,6 +286,7 @@ from cirq.ops import (
 )
 
 from cirq.optimizers import (
+    CompilationCache,
     compute_cphase_exponents_for_fsim_decomposition,
     ConvertToCzAndSingleGates,
     decompose_cphase_into_two_fsim,
@@ -299,6 +303,9 @@ from cirq.optimizers import (
     merge_single_qubit_gates_into_phxz,
     MergeInteractions,
     MergeSingleQubitGates,
+    optimize_batch,
+    optimize_partitioned,
+    qubit_partitions,
     single_qubit_matrix_to_gates,
     single_qubit_matrix_to_pauli_rotations,
     single_qubit_matrix_to_phased_x_z,
@@ -369,6 +376,8 @@ from cirq.sim import (
 )
 
 from cirq.study import (
+    CompiledParameters,
+    CountsTrialResult,
     ExpressionMap,
     flatten,
     flatten_with_params,
@@ -381,8 +390,10 @@ from cirq.study import (
     plot_state_histogram,
     Points,
     Product,
+    shard_sweep,
     Sweep,
     Sweepable,
+    SweepSlice,
     to_resolvers,
     to_sweep,
     to_sweeps,
@@ -418,6 +429,7 @@ from cirq.protocols import (
     apply_channel,
     apply_mixture,
     apply_unitaries,
+    apply_unitaries_batch,
     apply_unitary,
     ApplyChannelArgs,
     ApplyMixtureArgs,
@@ -458,6 +470,7 @@ from cirq.protocols import (
     quil,
     QuilFormatter,
     read_json,
+    read_json_iter,
     resolve_parameters,
     SupportsActOn,
     SupportsApplyChannel,
@@ -484,6 +497,7 @@ from cirq.protocols import (
     SupportsTraceDistanceBound,
     SupportsUnitary,
     to_json,
+    to_json_iter,
     obj_to_dict_helper,
     trace_distance_bound,
     trace_distance_from_angle_list,
@@ -512,6 +526,7 @@ from cirq.work import (
     PauliSumCollector,
     Sampler,
     Collector,
+    ShardedSampler,
     ZerosSampler,
 )
 
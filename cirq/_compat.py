@@ -13,6 +13,7 @@
 # limitations under the License.
 
 """Workarounds for compatibility issues between versions and libraries."""
+import asyncio
 import functools
 import warnings
 from typing import Any, Callable, Optional, Dict, Tuple
@@ -82,6 +83,17 @@ def proper_eq(a: Any, b: Any) -> bool:
     return a == b
 
 
+def get_running_loop() -> asyncio.AbstractEventLoop:
+    """Returns the event loop running the current coroutine.
+
+    This is `asyncio.get_running_loop`, which is new in Python 3.7. In Python
+    3.6, `asyncio.get_event_loop` returns the running loop when it is called
+    from a coroutine.
+    """
+    get_loop = getattr(asyncio, 'get_running_loop', asyncio.get_event_loop)
+    return get_loop()
+
+
 def deprecated(*, deadline: str, fix: str,
                name: Optional[str] = None) -> Callable[[Callable], Callable]:
     """Marks a function as deprecated.
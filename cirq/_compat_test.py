@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import types
 
 import numpy as np
@@ -20,7 +21,7 @@ import sympy
 
 import cirq.testing
 from cirq._compat import (proper_repr, deprecated, deprecated_parameter,
-                          proper_eq, wrap_module)
+                          proper_eq, wrap_module, get_running_loop)
 
 
 def test_proper_repr():
@@ -71,6 +72,18 @@ def test_proper_eq():
     assert not proper_eq(pd.Index([1, 2, 3]), pd.Index([1, 4, 3]))
 
 
+def test_get_running_loop():
+
+    async def running_loop():
+        return get_running_loop()
+
+    loop = asyncio.new_event_loop()
+    try:
+        assert loop.run_until_complete(running_loop()) is loop
+    finally:
+        loop.close()
+
+
 def test_deprecated_with_name():
 
     @deprecated(deadline='vNever', fix='Roll some dice.', name='test_func')
@@ -33,6 +33,7 @@ from cirq.circuits.insert_strategy import (
     InsertStrategy,)
 
 from cirq.circuits.optimization_pass import (
+    FusedPointOptimizer,
     PointOptimizer,
     PointOptimizationSummary,
 )
@@ -19,6 +19,8 @@ Operations. Each Operation is a Gate that acts on some Qubits, for a given
 Moment the Operations must all act on distinct Qubits.
 """
 from collections import defaultdict
+import concurrent.futures
+import functools
 from fractions import Fraction
 from itertools import groupby
 import math
@@ -29,6 +31,8 @@ from typing import (Any, Callable, cast, Dict, FrozenSet, Iterable, Iterator,
 
 import re
 import numpy as np
+import scipy.sparse
+import scipy.sparse.linalg
 
 from cirq import devices, ops, protocols, qis
 from cirq.circuits._bucket_priority_queue import BucketPriorityQueue
@@ -880,10 +884,7 @@ class Circuit:
         """
         if not 0 <= moment_index < len(self._moments):
             return None
-        for op in self._moments[moment_index].operations:
-            if qubit in op.qubits:
-                return op
-        return None
+        return self._moments[moment_index].operation_at(qubit)
 
     def findall_operations(self, predicate: Callable[['cirq.Operation'], bool]
                           ) -> Iterable[Tuple[int, 'cirq.Operation']]:
@@ -1232,8 +1233,8 @@ class Circuit:
         for op_index, moment_index in enumerate(insertion_indices):
             moment_to_ops[moment_index].append(operations[op_index])
         for moment_index, new_ops in moment_to_ops.items():
-            self._moments[moment_index] = ops.Moment(
-                self._moments[moment_index].operations + tuple(new_ops))
+            self._moments[moment_index] = self._moments[
+                moment_index].with_operations(new_ops)
 
     def zip(*circuits):
         """Combines operations from circuits in a moment-by-moment fashion.
@@ -1569,16 +1570,8 @@ class Circuit:
                 unitary matrix, e.g. gates parameterized by a Symbol.
         """
 
-        if not ignore_terminal_measurements and any(
-                protocols.is_measurement(op)
-                for op in self.all_operations()):
-            raise ValueError('Circuit contains a measurement.')
-
-        if not self.are_all_measurements_terminal():
-            raise ValueError('Circuit contains a non-terminal measurement.')
-
-        qs = ops.QubitOrder.as_qubit_order(qubit_order).order_for(
-            self.all_qubits().union(qubits_that_should_be_present))
+        qs = self._unitary_qubits(qubit_order, qubits_that_should_be_present,
+                                  ignore_terminal_measurements)
 
         # Force qubits to have dimension at least 2 for backwards compatibility.
         qid_shape = self.qid_shape(qubit_order=qs)
@@ -1589,6 +1582,145 @@ class Circuit:
         result = _apply_unitary_circuit(self, state, qs, dtype)
         return result.reshape((side_len, side_len))
 
+    def unitary_operator(
+            self,
+            qubit_order: 'cirq.QubitOrderOrList' = ops.QubitOrder.DEFAULT,
+            qubits_that_should_be_present: Iterable['cirq.Qid'] = (),
+            ignore_terminal_measurements: bool = True,
+            dtype: Type[np.number] = np.complex128
+    ) -> scipy.sparse.linalg.LinearOperator:
+        """Returns the circuit's unitary as a lazy scipy LinearOperator.
+
+        The matrix is never stored. Instead, multiplying the operator with a
+        vector (or with a matrix, column by column) applies the circuit's
+        operations to it, so memory use only grows with the size of the
+        vectors. This makes it possible to e.g. use `scipy.sparse.linalg`
+        solvers on circuits with too many qubits for `unitary`.
+
+        Args:
+            qubit_order: Determines how qubits are ordered when passing matrices
+                into np.kron.
+            qubits_that_should_be_present: Qubits that may or may not appear
+                in operations within the circuit, but that should be included
+                regardless when generating the matrix.
+            ignore_terminal_measurements: When set, measurements at the end of
+                the circuit are ignored instead of causing the method to
+                fail.
+            dtype: The numpy dtype used when applying the operations.
+
+        Returns:
+            A `scipy.sparse.linalg.LinearOperator` equivalent to
+            `self.unitary(...)` with the same arguments. Its adjoint applies
+            the inverses of the operations in reverse order.
+
+        Raises:
+            ValueError: The circuit contains measurement gates that are not
+                ignored.
+            TypeError: The circuit contains gates that don't have a known
+                unitary matrix, e.g. gates parameterized by a Symbol.
+        """
+        qs = self._unitary_qubits(qubit_order, qubits_that_should_be_present,
+                                  ignore_terminal_measurements)
+        return _CircuitOperator(_unitary_operations(self), qs,
+                                self.qid_shape(qubit_order=qs), dtype)
+
+    def sparse_unitary(
+            self,
+            qubit_order: 'cirq.QubitOrderOrList' = ops.QubitOrder.DEFAULT,
+            qubits_that_should_be_present: Iterable['cirq.Qid'] = (),
+            ignore_terminal_measurements: bool = True,
+            dtype: Type[np.number] = np.complex128,
+            *,
+            atol: float = 1e-8,
+            block_size: Optional[int] = None,
+            max_workers: Optional[int] = None,
+            executor: Optional[concurrent.futures.Executor] = None
+    ) -> scipy.sparse.csr_matrix:
+        """Converts the circuit into a sparse unitary matrix, if possible.
+
+        Circuits whose unitary has a single nonzero entry in each row and
+        column, like circuits made of permutations (e.g. reversible
+        arithmetic) and diagonal gates, are recognized by applying them to a
+        few vectors. Their matrix is then built directly, which only takes as
+        much time and memory as simulating the circuit a few times.
+
+        Other circuits are applied to blocks of columns of the identity matrix
+        and the entries within `atol` of zero are dropped from each block.
+        The blocks can be computed by a pool of worker processes.
+
+        Args:
+            qubit_order: Determines how qubits are ordered when passing matrices
+                into np.kron.
+            qubits_that_should_be_present: Qubits that may or may not appear
+                in operations within the circuit, but that should be included
+                regardless when generating the matrix.
+            ignore_terminal_measurements: When set, measurements at the end of
+                the circuit are ignored instead of causing the method to
+                fail.
+            dtype: The numpy dtype for the returned unitary.
+            atol: Entries whose magnitude is at most this value are treated as
+                zero.
+            block_size: The number of columns to compute at once when the
+                unitary isn't a permuted diagonal. Larger blocks are faster
+                but a block needs as much memory as that many state vectors.
+                Defaults to as many columns as fit in 2**20 amplitudes.
+            max_workers: The number of worker processes to start for
+                computing the blocks when no executor is given. Defaults to
+                computing the blocks one after the other in this process.
+            executor: An executor to compute the blocks with, e.g. a shared
+                `concurrent.futures.ProcessPoolExecutor`.
+
+        Returns:
+            A `scipy.sparse.csr_matrix` approximately equal to
+            `self.unitary(...)` with the same arguments.
+
+        Raises:
+            ValueError: The circuit contains measurement gates that are not
+                ignored.
+            TypeError: The circuit contains gates that don't have a known
+                unitary matrix, e.g. gates parameterized by a Symbol.
+        """
+        qs = self._unitary_qubits(qubit_order, qubits_that_should_be_present,
+                                  ignore_terminal_measurements)
+        operator = _CircuitOperator(_unitary_operations(self), qs,
+                                    self.qid_shape(qubit_order=qs),
+                                    np.complex128)
+        side_len = operator.shape[0]
+
+        matrix = _permuted_diagonal(operator, atol)
+        if matrix is not None:
+            return matrix.astype(dtype)
+
+        if block_size is None:
+            block_size = max(1, 2**20 // side_len)
+        starts = range(0, side_len, block_size)
+        stops = [min(start + block_size, side_len) for start in starts]
+        block = functools.partial(_sparse_unitary_columns, operator, atol)
+        if executor is not None:
+            blocks = list(executor.map(block, starts, stops))
+        elif max_workers is None or max_workers == 1 or len(starts) < 2:
+            blocks = [block(start, stop) for start, stop in zip(starts, stops)]
+        else:
+            with concurrent.futures.ProcessPoolExecutor(max_workers) as pool:
+                blocks = list(pool.map(block, starts, stops))
+        return scipy.sparse.hstack(blocks, format='csr', dtype=dtype)
+
+    def _unitary_qubits(self, qubit_order: 'cirq.QubitOrderOrList',
+                        qubits_that_should_be_present: Iterable['cirq.Qid'],
+                        ignore_terminal_measurements: bool
+                       ) -> Tuple['cirq.Qid', ...]:
+        """Checks the measurements and returns the qubits of the unitary."""
+        if not ignore_terminal_measurements and any(
+                protocols.is_measurement(op)
+                for op in self.all_operations()):
+            raise ValueError('Circuit contains a measurement.')
+
+        if not self.are_all_measurements_terminal():
+            raise ValueError('Circuit contains a non-terminal measurement.')
+
+        return ops.QubitOrder.as_qubit_order(qubit_order).order_for(
+            self.all_qubits().union(qubits_that_should_be_present))
+
     def final_state_vector(
             self,
             initial_state: 'cirq.STATE_VECTOR_LIKE' = 0,
@@ -1650,15 +1782,8 @@ class Circuit:
                 unitary matrix, e.g. gates parameterized by a Symbol.
         """
 
-        if not ignore_terminal_measurements and any(
-                protocols.is_measurement(op) for op in self.all_operations()):
-            raise ValueError('Circuit contains a measurement.')
-
-        if not self.are_all_measurements_terminal():
-            raise ValueError('Circuit contains a non-terminal measurement.')
-
-        qs = ops.QubitOrder.as_qubit_order(qubit_order).order_for(
-            self.all_qubits().union(qubits_that_should_be_present))
+        qs = self._unitary_qubits(qubit_order, qubits_that_should_be_present,
+                                  ignore_terminal_measurements)
 
         # Force qubits to have dimension at least 2 for backwards compatibility.
         qid_shape = self.qid_shape(qubit_order=qs)
@@ -2160,21 +2285,99 @@ def _apply_unitary_circuit(circuit: Circuit, state: np.ndarray,
         The left-multiplied state tensor.
     """
     buffer = np.empty_like(state)
+    return protocols.apply_unitaries(
+        _unitary_operations(circuit), qubits,
+        protocols.ApplyUnitaryArgs(state, buffer, range(len(qubits))))
+
+
+def _unitary_operations(circuit: Circuit) -> List['cirq.Operation']:
+    """Decomposes a circuit into operations with known unitary effects.
+
+    Measurements are dropped.
+
+    Raises:
+        TypeError: The circuit contains operations without a known matrix or
+            decomposition.
+    """
 
     def on_stuck(bad_op):
         return TypeError(
             'Operation without a known matrix or decomposition: {!r}'.format(
                 bad_op))
 
-    unitary_ops = protocols.decompose(
+    return protocols.decompose(
         circuit.all_operations(),
         keep=protocols.has_unitary,
         intercepting_decomposer=_decompose_measurement_inversions,
         on_stuck_raise=on_stuck)
 
-    return protocols.apply_unitaries(
-        unitary_ops, qubits,
-        protocols.ApplyUnitaryArgs(state, buffer, range(len(qubits))))
+
+class _CircuitOperator(scipy.sparse.linalg.LinearOperator):
+    """Applies a list of unitary operations to the vectors it multiplies."""
+
+    def __init__(self, operations: List['cirq.Operation'],
+                 qubits: Tuple['cirq.Qid', ...], qid_shape: Tuple[int, ...],
+                 dtype: Type[np.number]) -> None:
+        side_len = int(np.product(qid_shape, dtype=int))
+        super().__init__(dtype=np.dtype(dtype), shape=(side_len, side_len))
+        self._operations = operations
+        self._qubits = qubits
+        self._qid_shape = qid_shape
+
+    def _matmat(self, x: np.ndarray) -> np.ndarray:
+        state = np.array(x, dtype=self.dtype).reshape(self._qid_shape + (-1,))
+        result = protocols.apply_unitaries(
+            self._operations, self._qubits,
+            protocols.ApplyUnitaryArgs(state, np.empty_like(state),
+                                       range(len(self._qubits))))
+        return result.reshape((self.shape[0], -1))
+
+    def _adjoint(self) -> '_CircuitOperator':
+        return _CircuitOperator(protocols.inverse(self._operations),
+                                self._qubits, self._qid_shape, self.dtype)
+
+
+def _permuted_diagonal(operator: _CircuitOperator,
+                       atol: float) -> Optional[scipy.sparse.csr_matrix]:
+    """Returns the operator's matrix if it has one nonzero entry per row.
+
+    If the matrix has entry `p_i` in column `c_i` of each row `i`, multiplying
+    it with a vector of ones gives the `p_i`, and multiplying it with
+    `[1, 2, 3, ...]` gives the `p_i * (c_i + 1)`. The guessed matrix is then
+    checked against the product with a random vector.
+    """
+    side_len = operator.shape[0]
+    probe = np.empty((side_len, 3), dtype=np.complex128)
+    probe[:, 0] = 1
+    probe[:, 1] = np.arange(1, side_len + 1)
+    probe[:, 2] = np.random.RandomState(0).randn(side_len)
+    result = operator.matmat(probe)
+
+    phases = result[:, 0]
+    if np.any(np.abs(phases) < 0.5):
+        return None
+    columns = np.real(result[:, 1] / phases) - 1
+    rounded = np.round(columns)
+    if np.any(np.abs(columns - rounded) > 1e-3) or np.any(
+            rounded < 0) or np.any(rounded >= side_len):
+        return None
+
+    matrix = scipy.sparse.csr_matrix(
+        (phases, rounded.astype(np.int64), np.arange(side_len + 1)),
+        shape=operator.shape)
+    if not np.allclose(matrix @ probe[:, 2], result[:, 2], atol=atol):
+        return None
+    return matrix
+
+
+def _sparse_unitary_columns(operator: _CircuitOperator, atol: float,
+                            start: int, stop: int) -> scipy.sparse.csc_matrix:
+    """Computes the given columns of the operator's matrix."""
+    block = np.zeros((operator.shape[0], stop - start), dtype=operator.dtype)
+    block[np.arange(start, stop), np.arange(stop - start)] = 1
+    result = operator.matmat(block)
+    result[np.abs(result) <= atol] = 0
+    return scipy.sparse.csc_matrix(result)
 
 
 def _decompose_measurement_inversions(op: 'cirq.Operation') -> 'cirq.OP_TREE':
@@ -12,11 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Callable, Dict, Generic, Iterator, TypeVar, cast, \
-    TYPE_CHECKING
+from typing import (Any, Callable, Dict, Generic, Iterable, Iterator, List,
+                    Optional, Tuple, TypeVar, cast, TYPE_CHECKING)
 
 import functools
 import networkx
+import numpy as np
 
 from cirq import ops, devices
 from cirq.circuits import circuit
@@ -54,6 +55,15 @@ def _disjoint_qubits(op1: 'cirq.Operation', op2: 'cirq.Operation') -> bool:
     return not set(op1.qubits) & set(op2.qubits)
 
 
+def _bit_indices(mask: int, size: int) -> np.ndarray:
+    """Returns the positions of the set bits of a bit mask, in order."""
+    if not mask:
+        return np.zeros(0, dtype=np.int64)
+    bits = np.unpackbits(
+        np.frombuffer(mask.to_bytes((size + 7) // 8, 'big'), dtype=np.uint8))
+    return len(bits) - 1 - np.flatnonzero(bits)[::-1]
+
+
 class CircuitDag(networkx.DiGraph):
     """A representation of a Circuit as a directed acyclic graph.
 
@@ -65,6 +75,16 @@ class CircuitDag(networkx.DiGraph):
     the second.
 
     The graph is maximalist (transitive completion).
+
+    Alongside the networkx graph, nodes added with `append` are indexed by
+    integer ids in the order they were appended, which is a topological order.
+    Each id has a bit mask of its ancestors, the ids it was directly made to
+    depend on, and the ids acting on each qubit. These let `append` find the
+    predecessors of a new operation without testing it against every node, and
+    back `ordered_nodes`, `findall_nodes_until_blocked`, `layers` and
+    `critical_path`. Removing nodes keeps the index up to date, but any other
+    change made to the graph through the networkx API discards it, and the
+    methods fall back to working on the graph itself.
     """
 
     disjoint_qubits = staticmethod(_disjoint_qubits)
@@ -88,6 +108,19 @@ class CircuitDag(networkx.DiGraph):
                 another graph.
             device: Hardware that the circuit should be able to run on.
         """
+        self._indexed = True
+        # The appended nodes, indexed by id.
+        self._id_nodes: List[Unique[ops.Operation]] = []
+        self._node_ids: Dict[Unique[ops.Operation], int] = {}
+        # Bit masks of the ancestors of each id, and of the removed ids.
+        self._ancestors: List[int] = []
+        self._removed = 0
+        # The ids that each id was directly made to depend on.
+        self._direct: List[Tuple[int, ...]] = []
+        # The ids acting on each qubit, in order. Only kept while every
+        # operation was appended with the default predicate, which makes the
+        # last one on a qubit depend on all the others.
+        self._qubit_ids: Optional[Dict['cirq.Qid', List[int]]] = {}
         super().__init__(incoming_graph_data)
         self.can_reorder = can_reorder
         self.device = device
@@ -118,12 +151,107 @@ class CircuitDag(networkx.DiGraph):
 
     def append(self, op: 'cirq.Operation') -> None:
         new_node = self.make_node(op)
-        for node in list(self.nodes()):
-            if not self.can_reorder(node.val, op):
-                self.add_edge(node, new_node)
-                for pred in self.pred[node]:
-                    self.add_edge(pred, new_node)
-        self.add_node(new_node)
+        if not self._indexed:
+            for node in list(self.nodes()):
+                if not self.can_reorder(node.val, op):
+                    self.add_edge(node, new_node)
+                    for pred in self.pred[node]:
+                        self.add_edge(pred, new_node)
+            self.add_node(new_node)
+            return
+
+        new_id = len(self._id_nodes)
+        if self.can_reorder is _disjoint_qubits and self._qubit_ids is not None:
+            direct = set()
+            for q in op.qubits:
+                qubit_ids = self._qubit_ids.setdefault(q, [])
+                while qubit_ids and self._removed >> qubit_ids[-1] & 1:
+                    qubit_ids.pop()
+                if qubit_ids:
+                    direct.add(qubit_ids[-1])
+                qubit_ids.append(new_id)
+            covered = 0
+            for other in direct:
+                covered |= self._ancestors[other] | (1 << other)
+        else:
+            self._qubit_ids = None
+            direct = set()
+            covered = 0
+            for other in range(new_id - 1, -1, -1):
+                if (covered | self._removed) >> other & 1:
+                    continue
+                if not self.can_reorder(self._id_nodes[other].val, op):
+                    direct.add(other)
+                    covered |= self._ancestors[other] | (1 << other)
+        covered &= ~self._removed
+
+        id_nodes = self._id_nodes
+        networkx.DiGraph.add_node(self, new_node)
+        networkx.DiGraph.add_edges_from(
+            self, ((id_nodes[other], new_node)
+                   for other in _bit_indices(covered, new_id)))
+        id_nodes.append(new_node)
+        self._node_ids[new_node] = new_id
+        self._ancestors.append(covered)
+        self._direct.append(tuple(sorted(direct)))
+
+    def _discard_index(self) -> None:
+        self._indexed = False
+        self._id_nodes = []
+        self._node_ids = {}
+        self._ancestors = []
+        self._removed = 0
+        self._direct = []
+        self._qubit_ids = None
+
+    def _forget_removed(self, nodes: Iterable[Any]) -> None:
+        for node in nodes:
+            node_id = self._node_ids.pop(node, None)
+            if node_id is not None:
+                self._removed |= 1 << node_id
+
+    def add_node(self, node_for_adding, **attr):
+        self._discard_index()
+        super().add_node(node_for_adding, **attr)
+
+    def add_nodes_from(self, nodes_for_adding, **attr):
+        self._discard_index()
+        super().add_nodes_from(nodes_for_adding, **attr)
+
+    def add_edge(self, u_of_edge, v_of_edge, **attr):
+        self._discard_index()
+        super().add_edge(u_of_edge, v_of_edge, **attr)
+
+    def add_edges_from(self, ebunch_to_add, **attr):
+        self._discard_index()
+        super().add_edges_from(ebunch_to_add, **attr)
+
+    def remove_edge(self, u, v):
+        self._discard_index()
+        super().remove_edge(u, v)
+
+    def remove_edges_from(self, ebunch):
+        self._discard_index()
+        super().remove_edges_from(ebunch)
+
+    def remove_node(self, n):
+        super().remove_node(n)
+        self._forget_removed([n])
+
+    def remove_nodes_from(self, nodes):
+        nodes = list(nodes)
+        super().remove_nodes_from(nodes)
+        self._forget_removed(nodes)
+
+    def clear_edges(self):
+        self._discard_index()
+        super().clear_edges()
+
+    def clear(self):
+        super().clear()
+        self._discard_index()
+        self._indexed = True
+        self._qubit_ids = {}
 
     def __eq__(self, other):
         if not isinstance(other, type(self)):
@@ -144,6 +272,13 @@ class CircuitDag(networkx.DiGraph):
     __hash__ = None  # type: ignore
 
     def ordered_nodes(self) -> Iterator[Unique[ops.Operation]]:
+        if self._indexed:
+            removed = self._removed
+            yield from [
+                node for node_id, node in enumerate(self._id_nodes)
+                if not removed >> node_id & 1
+            ]
+            return
         if not self.nodes():
             return
         g = self.copy()
@@ -196,6 +331,18 @@ class CircuitDag(networkx.DiGraph):
             is_blocker: The predicate that indicates whether or not an
             operation is blocking.
         """
+        if self._indexed:
+            removed = self._removed
+            blocked = 0
+            for node_id, node in enumerate(self._id_nodes):
+                if removed >> node_id & 1:
+                    continue
+                if self._ancestors[node_id] & blocked or is_blocker(node.val):
+                    blocked |= 1 << node_id
+                    continue
+                yield node
+            return
+
         remaining_dag = self.copy()
 
         for node in self.ordered_nodes():
@@ -207,3 +354,77 @@ class CircuitDag(networkx.DiGraph):
                 remaining_dag.remove_node(node)
                 continue
             yield node
+
+    def _dependencies(
+            self
+    ) -> Tuple[List[Unique[ops.Operation]], List[Tuple[int, ...]], int]:
+        """Returns the direct dependencies between the nodes.
+
+        Returns:
+            The nodes in a topological order, the positions that each one
+            directly depends on, and a bit mask of the removed positions.
+        """
+        if self._indexed:
+            return self._id_nodes, self._direct, self._removed
+        nodes = list(networkx.topological_sort(self))
+        positions = {node: i for i, node in enumerate(nodes)}
+        return nodes, [
+            tuple(positions[pred] for pred in self.pred[node]) for node in nodes
+        ], 0
+
+    def layers(self) -> List[List[Unique[ops.Operation]]]:
+        """Groups the nodes by topological layer.
+
+        Nodes without predecessors are in the first layer, and every other node
+        is one layer after the latest of its predecessors.
+
+        Returns:
+            The layers, each holding its nodes in order.
+        """
+        nodes, direct, removed = self._dependencies()
+        depths = [0] * len(nodes)
+        layers: List[List[Unique[ops.Operation]]] = []
+        for node_id, preds in enumerate(direct):
+            depth = max((depths[pred] for pred in preds), default=0)
+            if removed >> node_id & 1:
+                depths[node_id] = depth
+                continue
+            depths[node_id] = depth + 1
+            if depth == len(layers):
+                layers.append([])
+            layers[depth].append(nodes[node_id])
+        return layers
+
+    def critical_path(
+            self, weight: Optional[Callable[['cirq.Operation'], float]] = None
+    ) -> List[Unique[ops.Operation]]:
+        """Finds the heaviest chain of dependent operations.
+
+        Args:
+            weight: The cost of each operation, e.g. its duration. Defaults to
+                counting operations.
+
+        Returns:
+            The nodes along the heaviest chain, in order.
+        """
+        nodes, direct, removed = self._dependencies()
+        totals = [0.0] * len(nodes)
+        via = [-1] * len(nodes)
+        end = -1
+        for node_id, preds in enumerate(direct):
+            for pred in preds:
+                if via[node_id] == -1 or totals[pred] > totals[via[node_id]]:
+                    via[node_id] = pred
+            total = totals[via[node_id]] if via[node_id] != -1 else 0.0
+            if not removed >> node_id & 1:
+                val = nodes[node_id].val
+                total += 1 if weight is None else weight(val)
+                if end == -1 or total > totals[end]:
+                    end = node_id
+            totals[node_id] = total
+        path = []
+        while end != -1:
+            if not removed >> end & 1:
+                path.append(nodes[end])
+            end = via[end]
+        return path[::-1]
@@ -277,3 +277,92 @@ def test_findall_nodes_until_blocked(circuit, is_blocker):
                                            for node in blocking_nodes))
     expected_nodes = set(all_nodes) - blocked_nodes
     assert sorted(found_nodes) == sorted(expected_nodes)
+
+
+def _edge_positions(dag):
+    positions = {node: i for i, node in enumerate(dag.nodes())}
+    return {(positions[a], positions[b]) for a, b in dag.edges()}
+
+
+@pytest.mark.parametrize('can_reorder', [
+    cirq.CircuitDag.disjoint_qubits,
+    lambda op1, op2: cirq.commutes(op1, op2, default=False),
+])
+def test_append_matches_scanning_every_node(can_reorder):
+    circuit = cirq.testing.random_circuit(6, 12, 0.6, random_state=1234)
+    dag = cirq.CircuitDag(can_reorder)
+    scanned = cirq.CircuitDag(can_reorder)
+    # Changing the graph with networkx discards the index.
+    scanned.add_nodes_from([])
+    for i, op in enumerate(circuit.all_operations()):
+        dag.append(op)
+        scanned.append(op)
+        if i % 7 == 6:
+            dag.remove_node(list(dag.nodes())[i // 2])
+            scanned.remove_node(list(scanned.nodes())[i // 2])
+    assert ([node.val for node in dag.nodes()
+            ] == [node.val for node in scanned.nodes()])
+    assert _edge_positions(dag) == _edge_positions(scanned)
+    assert networkx.dag.is_directed_acyclic_graph(dag)
+    assert not any(
+        dag.has_edge(b, a)
+        for a, b in itertools.combinations(dag.ordered_nodes(), 2))
+
+
+def test_changed_graph_falls_back_to_networkx():
+    q0, q1 = cirq.LineQubit.range(2)
+    dag = cirq.CircuitDag.from_ops(cirq.X(q0), cirq.Y(q1), cirq.CZ(q0, q1))
+    x, y, cz = dag.nodes()
+    dag.remove_edge(y, cz)
+    dag.append(cirq.Z(q1))
+    z = list(dag.nodes())[-1]
+    assert set(dag.pred[z]) == {x, y, cz}
+    assert set(dag.ordered_nodes()) == {x, y, cz, z}
+    assert set(
+        dag.findall_nodes_until_blocked(lambda op: op == cirq.CZ(q0, q1))) == {
+            x, y
+        }
+    assert [set(layer) for layer in dag.layers()] == [{x, y}, {cz}, {z}]
+    assert dag.critical_path() == [x, cz, z]
+
+
+def test_layers():
+    q0, q1, q2 = cirq.LineQubit.range(3)
+    dag = cirq.CircuitDag.from_ops(cirq.X(q0), cirq.CZ(q1, q2), cirq.Y(q1),
+                                   cirq.CZ(q0, q1), cirq.T(q2))
+    x, cz12, y, cz01, t = dag.nodes()
+    assert cirq.CircuitDag().layers() == []
+    assert dag.layers() == [[x, cz12], [y, t], [cz01]]
+    dag.remove_node(y)
+    assert dag.layers() == [[x, cz12], [cz01, t]]
+
+    circuit = cirq.testing.random_circuit(5, 10, 0.7, random_state=1234)
+    dag = cirq.CircuitDag.from_circuit(circuit)
+    layers = dag.layers()
+    assert sum(len(layer) for layer in layers) == len(dag)
+    assert len(layers) == len(
+        cirq.Circuit(circuit.all_operations(),
+                     strategy=cirq.InsertStrategy.EARLIEST))
+
+
+def test_critical_path():
+    q0, q1, q2 = cirq.LineQubit.range(3)
+    dag = cirq.CircuitDag.from_ops(cirq.X(q0), cirq.CZ(q1, q2), cirq.Y(q1),
+                                   cirq.CZ(q0, q1), cirq.T(q2), cirq.H(q2),
+                                   cirq.S(q2))
+    x, cz12, y, cz01, t, h, s = dag.nodes()
+    assert cirq.CircuitDag().critical_path() == []
+    assert dag.critical_path() == [cz12, t, h, s]
+    durations = {cirq.CZ: 3}
+    assert dag.critical_path(lambda op: durations.get(op.gate, 1)) == [
+        cz12, y, cz01
+    ]
+    dag.remove_node(t)
+    dag.remove_node(h)
+    assert dag.critical_path() == [cz12, y, cz01]
+
+    circuit = cirq.testing.random_circuit(5, 10, 0.7, random_state=1234)
+    dag = cirq.CircuitDag.from_circuit(circuit)
+    path = dag.critical_path()
+    assert len(path) == len(dag.layers())
+    assert all(dag.has_edge(a, b) for a, b in zip(path, path[1:]))
@@ -16,9 +16,11 @@ from typing import Tuple
 
 from collections import defaultdict
 from random import randint, random, sample, randrange
+import concurrent.futures
 import os
 import numpy as np
 import pytest
+import scipy.sparse
 import sympy
 
 import cirq
@@ -2285,6 +2287,97 @@ def test_composite_gate_to_unitary_matrix():
                                                     atol=1e-8)
 
 
+def test_unitary_operator():
+    a, b, c = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit(cirq.H(a), cirq.CNOT(a, c), cirq.T(b),
+                           cirq.measure(a, b, c))
+    u = circuit.unitary()
+    operator = circuit.unitary_operator()
+    assert operator.shape == (8, 8)
+    np.testing.assert_allclose(operator.matmat(np.eye(8)), u, atol=1e-8)
+    np.testing.assert_allclose(operator.matvec(np.arange(8)),
+                               u @ np.arange(8),
+                               atol=1e-8)
+    np.testing.assert_allclose(operator.H.matmat(u), np.eye(8), atol=1e-8)
+
+    d = cirq.LineQubit(3)
+    operator = circuit.unitary_operator(qubit_order=[c, b, a, d],
+                                        qubits_that_should_be_present=[d])
+    np.testing.assert_allclose(operator.matmat(np.eye(16)),
+                               circuit.unitary(qubit_order=[c, b, a, d]),
+                               atol=1e-8)
+
+    with pytest.raises(ValueError, match='measurement'):
+        _ = circuit.unitary_operator(ignore_terminal_measurements=False)
+
+
+class _Add(cirq.ArithmeticOperation):
+
+    def __init__(self, target, source):
+        self.target = target
+        self.source = source
+
+    def registers(self):
+        return self.target, self.source
+
+    def with_registers(self, *new_registers):
+        return _Add(*new_registers)
+
+    def apply(self, target, source):
+        return target + source
+
+
+def test_sparse_unitary_of_permuted_diagonal():
+    a, b, c, d = cirq.LineQubit.range(4)
+    circuit = cirq.Circuit(cirq.X(a), cirq.CCX(a, b, c), cirq.S(d),
+                           cirq.SWAP(b, d), cirq.CZ(a, b)**0.25)
+    matrix = circuit.sparse_unitary()
+    assert isinstance(matrix, scipy.sparse.csr_matrix)
+    assert matrix.nnz == 16
+    np.testing.assert_allclose(matrix.toarray(), circuit.unitary(), atol=1e-8)
+
+    # Reversible arithmetic on many qubits is as cheap as simulating it.
+    qubits = cirq.LineQubit.range(18)
+    circuit = cirq.Circuit(_Add(qubits[:9], qubits[9:]),
+                           cirq.Z.on_each(*qubits[::3]),
+                           _Add(qubits[9:], qubits[:9]))
+    matrix = circuit.sparse_unitary(dtype=np.complex64)
+    assert matrix.dtype == np.complex64
+    assert matrix.nnz == 2**18
+    for k in [0, 12345, 2**18 - 1]:
+        np.testing.assert_allclose(
+            matrix[:, k].toarray().ravel(),
+            circuit.final_state_vector(k, dtype=np.complex64),
+            atol=1e-6)
+
+
+def test_sparse_unitary_in_blocks():
+    a, b, c = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit(cirq.H(a), cirq.CNOT(a, c), cirq.T(b),
+                           cirq.measure(a, b, c))
+    u = circuit.unitary()
+    matrix = circuit.sparse_unitary()
+    assert matrix.nnz == 16
+    np.testing.assert_allclose(matrix.toarray(), u, atol=1e-8)
+    np.testing.assert_allclose(circuit.sparse_unitary(block_size=3).toarray(),
+                               u,
+                               atol=1e-8)
+    with concurrent.futures.ThreadPoolExecutor(2) as pool:
+        np.testing.assert_allclose(circuit.sparse_unitary(
+            block_size=3, executor=pool).toarray(),
+                                   u,
+                                   atol=1e-8)
+    np.testing.assert_allclose(circuit.sparse_unitary(
+        block_size=3, max_workers=2).toarray(),
+                               u,
+                               atol=1e-8)
+
+    with pytest.raises(ValueError, match='measurement'):
+        _ = circuit.sparse_unitary(ignore_terminal_measurements=False)
+    with pytest.raises(TypeError, match='without a known matrix'):
+        _ = cirq.Circuit(cirq.X(a)**sympy.Symbol('t')).sparse_unitary()
+
+
 def test_expanding_gate_symbols():
     class MultiTargetCZ(cirq.Gate):
 
@@ -13,10 +13,11 @@
 # limitations under the License.
 
 """Defines the OptimizationPass type."""
-from typing import (Dict, Callable, Iterable, Optional, Sequence, TYPE_CHECKING,
-                    Tuple, cast)
+from typing import (AbstractSet, Dict, Callable, Iterable, List, Optional,
+                    Sequence, Set, TYPE_CHECKING, Tuple, cast)
 
 import abc
+import heapq
 from collections import defaultdict
 
 from cirq import ops
@@ -79,13 +80,16 @@ class PointOptimizationSummary:
                 f'{self.clear_qubits!r}, {self.new_operations!r})')
 
 
+def _no_clean_up(op_list: Sequence['cirq.Operation']) -> ops.OP_TREE:
+    return op_list
+
+
 class PointOptimizer:
     """Makes circuit improvements focused on a specific location."""
 
     def __init__(self,
                  post_clean_up: Callable[[Sequence['cirq.Operation']], ops.
-                                         OP_TREE] = lambda op_list: op_list
-                ) -> None:
+                                         OP_TREE] = _no_clean_up) -> None:
         """
         Args:
             post_clean_up: This function is called on each set of optimized
@@ -132,31 +136,197 @@ class PointOptimizer:
                 if i >= len(circuit):
                     continue
                 # Skip if an optimization removed the op we're considering.
-                if op not in circuit[i].operations:
+                if not _contains(circuit[i], op):
                     continue
                 opt = self.optimization_at(circuit, i, op)
                 # Skip if the optimization did nothing.
                 if opt is None:
                     continue
 
-                # Clear target area, and insert new operations.
-                circuit.clear_operations_touching(
-                    opt.clear_qubits,
-                    [e for e in range(i, i + opt.clear_span)])
-                new_operations = self.post_clean_up(
-                    cast(Tuple[ops.Operation], opt.new_operations))
+                _apply_summary(circuit, i, opt, self.post_clean_up, frontier)
+            i += 1
 
-                flat_new_operations = tuple(ops.flatten_to_ops(new_operations))
 
-                new_qubits = set()
-                for flat_op in flat_new_operations:
-                    for q in flat_op.qubits:
-                        new_qubits.add(q)
+class FusedPointOptimizer:
+    """Runs several point optimizers together until none of them applies.
 
-                if not new_qubits.issubset(set(opt.clear_qubits)):
-                    raise ValueError(
-                        'New operations in PointOptimizer should not act on new'
-                        ' qubits.')
+    The first round behaves like running `PointOptimizer.optimize_circuit` once
+    with every operation offered to each optimizer in turn (the first
+    optimizer returning a summary wins). Instead of rescanning the whole
+    circuit afterwards, each applied rewrite records the (moment, qubit)
+    locations of the operations it inserted, plus the preceding operation on
+    each cleared qubit, in a worklist. Later rounds only revisit those
+    locations.
 
-                circuit.insert_at_frontier(flat_new_operations, i, frontier)
-            i += 1
+    This relies on optimizers only inspecting the focused operation and the
+    operations after it, which is true of the point optimizers in cirq.
+    Rewrites that reproduce the operations they cleared don't schedule any
+    revisits, so idempotent optimizers always reach a fixpoint.
+    """
+
+    def __init__(self,
+                 optimizers: Iterable[PointOptimizer],
+                 max_rounds: Optional[int] = None) -> None:
+        """
+        Args:
+            optimizers: The point optimizers to apply, in order of priority.
+            max_rounds: The maximum number of rounds to run. Defaults to
+                running until no rewrite changes the circuit.
+        """
+        self.optimizers = tuple(optimizers)
+        self.max_rounds = max_rounds
+
+    def __call__(self, circuit: Circuit):
+        return self.optimize_circuit(circuit)
+
+    def optimize_circuit(self, circuit: Circuit) -> None:
+        dirty: Dict[int, Set['cirq.Qid']] = {
+            i: set(moment.qubits)
+            for i, moment in enumerate(circuit)
+            if moment.operations
+        }
+        rounds = 0
+        while dirty and (self.max_rounds is None or rounds < self.max_rounds):
+            dirty = self._optimize_round(circuit, dirty)
+            rounds += 1
+
+    def _optimize_round(self, circuit: Circuit,
+                        dirty: Dict[int, Set['cirq.Qid']]
+                       ) -> Dict[int, Set['cirq.Qid']]:
+        """Revisits the dirty locations, returning those for the next round."""
+        frontier: Dict['cirq.Qid', int] = defaultdict(lambda: 0)
+        revisit: Dict[int, Set['cirq.Qid']] = defaultdict(set)
+        worklist = list(dirty)
+        heapq.heapify(worklist)
+        while worklist:
+            i = heapq.heappop(worklist)
+            qubits = dirty.pop(i, None)
+            if qubits is None or i >= len(circuit):
+                continue
+            for op in _touching(circuit[i], qubits):
+                if any(frontier[q] > i for q in op.qubits):
+                    continue
+                if i >= len(circuit) or not _contains(circuit[i], op):
+                    continue
+                for optimizer in self.optimizers:
+                    opt = optimizer.optimization_at(circuit, i, op)
+                    if opt is not None:
+                        break
+                else:
+                    continue
+
+                clear_qubits = frozenset(opt.clear_qubits)
+                cleared = [
+                    old_op for k in range(i, min(i + opt.clear_span,
+                                                 len(circuit)))
+                    for old_op in _touching(circuit[k], clear_qubits)
+                    if old_op.qubits
+                ]
+                new_ops, indices, (insert_index, n_new) = _apply_summary(
+                    circuit, i, opt, optimizer.post_clean_up, frontier)
+
+                if n_new:
+                    for pending in (dirty, revisit):
+                        _shift_keys(pending, insert_index, n_new)
+                    worklist = list(dirty)
+                    heapq.heapify(worklist)
+
+                if _same_operations(cleared, new_ops):
+                    continue
+                for new_op, k in zip(new_ops, indices):
+                    revisit[k].update(new_op.qubits)
+                for q in opt.clear_qubits:
+                    k = circuit.prev_moment_operating_on([q], i)
+                    if k is not None:
+                        revisit[k].add(q)
+        return revisit
+
+
+def _contains(moment: 'cirq.Moment', op: 'cirq.Operation') -> bool:
+    """Determines if the given operation is in the moment."""
+    if not op.qubits:
+        return op in moment.operations
+    return moment.operation_at(op.qubits[0]) == op
+
+
+def _touching(moment: 'cirq.Moment',
+              qubits: AbstractSet['cirq.Qid']) -> List['cirq.Operation']:
+    """Returns the moment's operations touching any of the given qubits.
+
+    Operations that act on no qubits are always included. The operations are
+    listed in the order they appear in the moment.
+    """
+    touched = {id(moment.operation_at(q)) for q in qubits & moment.qubits}
+    return [
+        op for op in moment.operations if not op.qubits or id(op) in touched
+    ]
+
+
+def _apply_summary(circuit: Circuit, index: int,
+                   opt: PointOptimizationSummary,
+                   post_clean_up: Callable[[Sequence['cirq.Operation']], ops.
+                                           OP_TREE],
+                   frontier: Dict['cirq.Qid', int]
+                  ) -> Tuple[Tuple['cirq.Operation', ...], Sequence[int],
+                             Tuple[int, int]]:
+    """Replaces the operations described by a summary with its new operations.
+
+    Returns:
+        The inserted operations, the moment index each one was inserted at,
+        and the (index, count) of empty moments inserted to make room for
+        them, as returned by `Circuit._push_frontier`.
+    """
+    # Clear target area, and insert new operations.
+    circuit.clear_operations_touching(
+        opt.clear_qubits, [e for e in range(index, index + opt.clear_span)])
+    new_operations = post_clean_up(
+        cast(Tuple[ops.Operation], opt.new_operations))
+
+    flat_new_operations = tuple(ops.flatten_to_ops(new_operations))
+
+    new_qubits = set()
+    for flat_op in flat_new_operations:
+        for q in flat_op.qubits:
+            new_qubits.add(q)
+
+    if not new_qubits.issubset(set(opt.clear_qubits)):
+        raise ValueError(
+            'New operations in PointOptimizer should not act on new'
+            ' qubits.')
+
+    if not flat_new_operations:
+        return flat_new_operations, [], (0, 0)
+    # Same as `Circuit.insert_at_frontier`, but keeping track of where the
+    # operations and any new moments ended up.
+    if any(frontier[q] > index for q in new_qubits):
+        raise ValueError('The frontier for qubits on which the operations'
+                         'to insert act cannot be after start.')
+    next_moments = circuit.next_moments_operating_on(new_qubits, index)
+    insertion_indices, _ = circuit._pick_inserted_ops_moment_indices(
+        flat_new_operations, index, frontier)
+    pushed = circuit._push_frontier(frontier, next_moments)
+    circuit._insert_operations(flat_new_operations, insertion_indices)
+    return flat_new_operations, insertion_indices, pushed
+
+
+def _shift_keys(locations: Dict[int, Set['cirq.Qid']], start: int,
+                shift: int) -> None:
+    """Moves the locations at or after `start` later by `shift` moments."""
+    moved = {k: v for k, v in locations.items() if k >= start}
+    for k in moved:
+        del locations[k]
+    for k, v in moved.items():
+        locations[k + shift] = v
+
+
+def _same_operations(old_ops: Sequence['cirq.Operation'],
+                     new_ops: Sequence['cirq.Operation']) -> bool:
+    """Determines if two lists hold the same operations, ignoring order."""
+    if len(old_ops) != len(new_ops):
+        return False
+    remaining = list(old_ops)
+    for op in new_ops:
+        if op not in remaining:
+            return False
+        remaining.remove(op)
+    return True
@@ -163,3 +163,137 @@ def test_point_optimizer_raises_on_gates_changing_qubits():
 def test_repr():
     assert repr(cirq.PointOptimizationSummary(clear_span=0, clear_qubits=[
     ], new_operations=[])) == 'cirq.PointOptimizationSummary(0, (), ())'
+
+
+class ZToX(cirq.PointOptimizer):
+    """Replaces Z gates with X gates."""
+
+    def optimization_at(self, circuit, index, op):
+        if op.gate != cirq.Z:
+            return None
+        return cirq.PointOptimizationSummary(clear_span=1,
+                                             clear_qubits=op.qubits,
+                                             new_operations=cirq.X(
+                                                 op.qubits[0]))
+
+
+class CancelAdjacentXs(cirq.PointOptimizer):
+    """Removes pairs of X gates that directly follow each other."""
+
+    def optimization_at(self, circuit, index, op):
+        if op.gate != cirq.X:
+            return None
+        n = circuit.next_moment_operating_on(op.qubits, index + 1)
+        if n is None or circuit.operation_at(op.qubits[0], n) != op:
+            return None
+        return cirq.PointOptimizationSummary(clear_span=n + 1 - index,
+                                             clear_qubits=op.qubits,
+                                             new_operations=[])
+
+
+class SplitZ(cirq.PointOptimizer):
+    """Replaces Z gates with two S gates."""
+
+    def optimization_at(self, circuit, index, op):
+        if op.gate != cirq.Z:
+            return None
+        q = op.qubits[0]
+        return cirq.PointOptimizationSummary(clear_span=1,
+                                             clear_qubits=op.qubits,
+                                             new_operations=[cirq.S(q)] * 2)
+
+
+class Unchanged(cirq.PointOptimizer):
+    """Replaces every operation with itself."""
+
+    def optimization_at(self, circuit, index, op):
+        return cirq.PointOptimizationSummary(clear_span=1,
+                                             clear_qubits=op.qubits,
+                                             new_operations=op)
+
+
+def test_fused_point_optimizer_single_round_matches_point_optimizer():
+    x = cirq.NamedQubit('x')
+    y = cirq.NamedQubit('y')
+    z = cirq.NamedQubit('z')
+    c = cirq.Circuit(
+        cirq.CZ(x, y),
+        cirq.Y(x),
+        cirq.Z(x),
+        cirq.X(y),
+        cirq.CNOT(y, z),
+        cirq.Z(y),
+        cirq.Z(x),
+        cirq.CNOT(y, z),
+        cirq.CNOT(z, y),
+    )
+    expected = c.copy()
+    ReplaceWithXGates()(expected)
+
+    cirq.FusedPointOptimizer([ReplaceWithXGates()], max_rounds=1)(c)
+    assert c == expected
+
+
+def test_fused_point_optimizer_reaches_fixpoint():
+    a, b = cirq.LineQubit.range(2)
+    c = cirq.Circuit(
+        cirq.X(a),
+        cirq.Z(a),
+        cirq.Z(a),
+        cirq.Z(a),
+        cirq.H(b),
+    )
+
+    # A single pass of each optimizer leaves work for the other.
+    sequential = c.copy()
+    CancelAdjacentXs()(sequential)
+    ZToX()(sequential)
+    assert len(list(sequential.all_operations())) == 5
+
+    fused = cirq.FusedPointOptimizer([CancelAdjacentXs(), ZToX()])
+    fused(c)
+    assert list(c.all_operations()) == [cirq.H(b)]
+
+    c = cirq.Circuit(cirq.X(a), cirq.Z(a), cirq.Z(a), cirq.Z(a))
+    cirq.FusedPointOptimizer([CancelAdjacentXs(), ZToX()], max_rounds=1)(c)
+    assert list(c.all_operations()) == [cirq.X(a)] * 4
+
+
+def test_fused_point_optimizer_tracks_inserted_moments():
+    a, b = cirq.LineQubit.range(2)
+    c = cirq.Circuit(
+        cirq.Z(a),
+        cirq.CZ(a, b),
+        cirq.Z(a),
+        cirq.Z(b),
+    )
+    cirq.FusedPointOptimizer([SplitZ(), CancelAdjacentXs()])(c)
+    cirq.testing.assert_has_diagram(
+        c, """
+0: ───S───S───@───S───S───
+              │
+1: ───────────@───S───S───
+""")
+
+
+def test_fused_point_optimizer_stops_on_unchanged_rewrites():
+    a, b = cirq.LineQubit.range(2)
+    c = cirq.Circuit(cirq.X(a), cirq.CZ(a, b), cirq.Y(b))
+    expected = c.copy()
+    cirq.FusedPointOptimizer([Unchanged()])(c)
+    assert c == expected
+
+
+def test_fused_point_optimizer_raises_on_gates_changing_qubits():
+
+    class EverythingIs42(cirq.PointOptimizer):
+
+        def optimization_at(self, circuit, index, op):
+            return cirq.PointOptimizationSummary(
+                clear_span=1,
+                clear_qubits=op.qubits,
+                new_operations=op.gate(cirq.LineQubit(42)))
+
+    c = cirq.Circuit(cirq.X(cirq.LineQubit(0)))
+    with pytest.raises(ValueError, match='new qubits'):
+        cirq.FusedPointOptimizer([EverythingIs42()]).optimize_circuit(c)
@@ -11,9 +11,9 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import List, TYPE_CHECKING, Union, Optional, cast
+from typing import List, Sequence, TYPE_CHECKING, Union, Optional, cast
 
-from cirq import work, circuits
+from cirq import circuits, study, work
 from cirq.google import engine, gate_sets
 
 if TYPE_CHECKING:
@@ -61,6 +61,29 @@ class QuantumEngineSampler(work.Sampler):
                                          gate_set=self._gate_set)
         return job.results()
 
+    def run_batch(
+            self,
+            programs: Sequence['cirq.Circuit'],
+            params_list: Optional[Sequence['cirq.Sweepable']] = None,
+            repetitions: int = 1,
+    ) -> List[List['cirq.TrialResult']]:
+        """Runs the circuits as a single batch job on the Quantum Engine."""
+        params_list = work.sampler._params_list(programs, params_list)
+        job = self._engine.run_batch(programs=list(programs),
+                                     params_list=list(params_list),
+                                     repetitions=repetitions,
+                                     processor_ids=self._processor_ids,
+                                     gate_set=self._gate_set)
+        # The engine returns the results of all the sweeps as a flat list.
+        results = job.results()
+        out = []
+        start = 0
+        for params in params_list:
+            size = len(list(study.to_resolvers(params)))
+            out.append(results[start:start + size])
+            start += size
+        return out
+
     @property
     def engine(self) -> 'cirq.google.Engine':
         return self._engine
@@ -50,6 +50,34 @@ def test_run_engine_program():
     engine.run_sweep.assert_not_called()
 
 
+def test_run_batch():
+    engine = mock.Mock()
+    sampler = cg.QuantumEngineSampler(engine=engine,
+                                      processor_id='tmp',
+                                      gate_set=cg.XMON)
+    a = cirq.Circuit()
+    b = cirq.Circuit(cirq.X(cirq.LineQubit(0)))
+    params = [cirq.ParamResolver({'a': 1}), cirq.ParamResolver({'a': 2})]
+    engine.run_batch.return_value.results.return_value = ['r0', 'r1', 'r2']
+    results = sampler.run_batch([a, b], [None, params], 5)
+    assert results == [['r0'], ['r1', 'r2']]
+    engine.run_batch.assert_called_with(gate_set=cg.XMON,
+                                        params_list=[None, params],
+                                        processor_ids=['tmp'],
+                                        programs=[a, b],
+                                        repetitions=5)
+
+    sampler.run_batch([a, b], repetitions=3)
+    engine.run_batch.assert_called_with(gate_set=cg.XMON,
+                                        params_list=[None, None],
+                                        processor_ids=['tmp'],
+                                        programs=[a, b],
+                                        repetitions=3)
+
+    with pytest.raises(ValueError, match='sweeps'):
+        sampler.run_batch([a, b], [None])
+
+
 def test_engine_sampler_engine_property():
     engine = mock.Mock()
     sampler = cg.QuantumEngineSampler(engine=engine,
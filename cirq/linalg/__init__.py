@@ -31,8 +31,10 @@ from cirq.linalg.decompositions import (
     deconstruct_single_qubit_matrix_into_angles,
     kak_canonicalize_vector,
     kak_decomposition,
+    kak_decomposition_batch,
     kak_vector,
     KakDecomposition,
+    KakDecompositionBatch,
     kron_factor_4x4_to_2x2s,
     map_eigenvalues,
     unitary_eig,
@@ -15,8 +15,8 @@
 
 """Utility methods for breaking matrices into useful pieces."""
 
-from typing import (Any, Callable, Iterable, List, Optional, Sequence, Set,
-                    Tuple, TYPE_CHECKING, TypeVar, Union)
+from typing import (Any, Callable, Iterable, Iterator, List, Optional,
+                    Sequence, Set, Tuple, TYPE_CHECKING, TypeVar, Union)
 
 import math
 import cmath
@@ -773,6 +773,33 @@ KAK_GAMMA = np.array([[1, 1, 1, 1],
 
 # yapf: enable
 
+# The eigenvalues of XX, YY and ZZ along the magic basis, as rows.
+_KAK_MAGIC_EIGENVALUES = np.real(
+    np.array([
+        np.diag(KAK_MAGIC_DAG @ np.kron(pauli, pauli) @ KAK_MAGIC)
+        for pauli in (np.array([[0, 1], [1, 0]]), np.array([[0, -1j], [1j, 0]]),
+                      np.array([[1, 0], [0, -1]]))
+    ]))
+
+# Special-unitary matrices flipping the X, Y, and Z axes respectively, and
+# matrices swapping the roles of the other two axes. See
+# `kak_canonicalize_vector`.
+_KAK_FLIPPERS = [
+    np.array([[0, 1], [1, 0]]) * 1j,
+    np.array([[0, -1j], [1j, 0]]) * 1j,
+    np.array([[1, 0], [0, -1]]) * 1j,
+]
+_KAK_FLIPPER_POWERS = [
+    np.array([np.linalg.matrix_power(f, p) for p in range(4)])
+    for f in _KAK_FLIPPERS
+]
+_KAK_SWAPPERS = [
+    np.array([[1, -1j], [1j, -1]]) * 1j * np.sqrt(0.5),
+    np.array([[1, 1], [1, -1]]) * 1j * np.sqrt(0.5),
+    np.array([[0, 1 - 1j], [1 + 1j, 0]]) * 1j * np.sqrt(0.5),
+]
+_BIDIAGONALIZE_ATTEMPTS = 5
+
 
 def kak_decomposition(unitary_object: Union[np.ndarray, 'cirq.SupportsUnitary'],
                       *,
@@ -850,6 +877,312 @@ def kak_decomposition(unitary_object: Union[np.ndarray, 'cirq.SupportsUnitary'],
         single_qubit_operations_after=(a1, a0))
 
 
+class KakDecompositionBatch:
+    """The KAK decompositions of several two-qubit operations, as arrays.
+
+    The k'th entry of the batch describes the operation
+
+        U_k = g_k · (a1_k ⊗ a0_k) · exp(i·(x_k·XX + y_k·YY + z_k·ZZ)) ·
+              (b1_k ⊗ b0_k)
+
+    like a `cirq.KakDecomposition` would. Each attribute holds the values of
+    all entries along its first axis.
+
+    Attributes:
+        global_phase: The g's, with shape (N,).
+        single_qubit_operations_before: The b's, with shape (N, 2, 2, 2).
+            `single_qubit_operations_before[k, 0]` acts on the first qubit.
+        interaction_coefficients: The (x, y, z)'s, with shape (N, 3).
+        single_qubit_operations_after: The a's, with shape (N, 2, 2, 2).
+            `single_qubit_operations_after[k, 0]` acts on the first qubit.
+    """
+
+    def __init__(self, *, global_phase: np.ndarray,
+                 single_qubit_operations_before: np.ndarray,
+                 interaction_coefficients: np.ndarray,
+                 single_qubit_operations_after: np.ndarray) -> None:
+        self.global_phase = global_phase
+        self.single_qubit_operations_before = single_qubit_operations_before
+        self.interaction_coefficients = interaction_coefficients
+        self.single_qubit_operations_after = single_qubit_operations_after
+
+    def __len__(self) -> int:
+        return len(self.global_phase)
+
+    def __getitem__(self, index: int) -> KakDecomposition:
+        before = self.single_qubit_operations_before[index]
+        after = self.single_qubit_operations_after[index]
+        return KakDecomposition(
+            global_phase=complex(self.global_phase[index]),
+            single_qubit_operations_before=(before[0], before[1]),
+            interaction_coefficients=tuple(
+                float(c) for c in self.interaction_coefficients[index]),
+            single_qubit_operations_after=(after[0], after[1]))
+
+    def __iter__(self) -> Iterator[KakDecomposition]:
+        return (self[k] for k in range(len(self)))
+
+    def unitaries(self) -> np.ndarray:
+        """Returns the two-qubit unitary matrices, with shape (N, 4, 4)."""
+        before = _kron_2x2s(self.single_qubit_operations_before)
+        after = _kron_2x2s(self.single_qubit_operations_after)
+        # XX, YY and ZZ are diagonal in the magic basis.
+        angles = self.interaction_coefficients @ _KAK_MAGIC_EIGENVALUES
+        interaction = np.einsum('ab,nb,bc->nac', KAK_MAGIC,
+                                np.exp(1j * angles), KAK_MAGIC_DAG)
+        return (self.global_phase[:, np.newaxis, np.newaxis] * after @
+                interaction @ before)
+
+    def __repr__(self) -> str:
+        return (
+            'cirq.KakDecompositionBatch(\n'
+            f'    global_phase={proper_repr(self.global_phase)},\n'
+            '    single_qubit_operations_before='
+            f'{proper_repr(self.single_qubit_operations_before)},\n'
+            '    interaction_coefficients='
+            f'{proper_repr(self.interaction_coefficients)},\n'
+            '    single_qubit_operations_after='
+            f'{proper_repr(self.single_qubit_operations_after)})')
+
+
+def kak_decomposition_batch(unitaries: Union[Iterable[np.ndarray], np.ndarray],
+                            *,
+                            rtol: float = 1e-5,
+                            atol: float = 1e-8,
+                            check_preconditions: bool = True
+                           ) -> KakDecompositionBatch:
+    """Decomposes many 2-qubit unitaries at once, like `cirq.kak_decomposition`.
+
+    The whole batch is processed with stacked numpy linear algebra instead of
+    one matrix at a time. The decompositions are canonicalized in the same way
+    as `cirq.kak_decomposition`, but the single-qubit operations may differ
+    from the ones it would find, since a unitary has many KAK decompositions.
+
+    Args:
+        unitaries: A sequence of 4x4 unitary matrices, or an array with shape
+            (N, 4, 4).
+        rtol: Per-matrix-entry relative tolerance on equality.
+        atol: Per-matrix-entry absolute tolerance on equality.
+        check_preconditions: If set, verifies that the input corresponds to
+            4x4 unitaries before decomposing.
+
+    Returns:
+        A `cirq.KakDecompositionBatch` whose k'th entry decomposes the k'th
+        unitary, with interaction coefficients satisfying:
+
+            0 ≤ abs(z2) ≤ y2 ≤ x2 ≤ π/4
+            if x2 = π/4, z2 >= 0
+
+    Raises:
+        ValueError: Bad matrices.
+
+    References:
+        'An Introduction to Cartan's KAK Decomposition for QC Programmers'
+        https://arxiv.org/abs/quant-ph/0507171
+    """
+    mats = np.asarray(unitaries if isinstance(unitaries, np.ndarray) else
+                      list(unitaries),
+                      dtype=np.complex128)
+    if mats.size == 0:
+        mats = mats.reshape((0, 4, 4))
+    if mats.ndim != 3 or mats.shape[1:] != (4, 4):
+        raise ValueError(f'Expected input unitaries to have shape (N, 4, 4), '
+                         f'but got {mats.shape}.')
+    if check_preconditions:
+        actual = np.einsum('...ba,...bc', mats.conj(), mats) - np.eye(4)
+        if not np.allclose(actual, np.zeros_like(actual), rtol, atol):
+            raise ValueError('Input must correspond to 4x4 unitary matrices. '
+                             f'Received input:\n{mats}')
+
+    # Diagonalize in magic basis.
+    magic = KAK_MAGIC_DAG @ mats @ KAK_MAGIC
+    left_t, d, right = _bidiagonalize_unitaries_with_special_orthogonals(
+        magic, rtol=rtol, atol=atol)
+
+    # Recover pieces.
+    a1, a0 = _so4s_to_magic_su2s(left_t)
+    b1, b0 = _so4s_to_magic_su2s(np.swapaxes(right, -1, -2))
+    w, x, y, z = KAK_GAMMA @ np.angle(d).T
+    g = np.exp(1j * w)
+
+    # Canonicalize.
+    phase, after, v, before = _kak_canonicalize_vectors(np.stack([x, y, z],
+                                                                 axis=-1),
+                                                        atol=1e-9)
+    return KakDecompositionBatch(
+        global_phase=g * phase,
+        single_qubit_operations_before=np.stack(
+            [before[0] @ b1, before[1] @ b0], axis=1),
+        interaction_coefficients=v,
+        single_qubit_operations_after=np.stack(
+            [a1 @ after[0], a0 @ after[1]], axis=1))
+
+
+def _kron_2x2s(pairs: np.ndarray) -> np.ndarray:
+    """Kronecker products of pairs of 2x2 matrices with shape (N, 2, 2, 2)."""
+    return np.einsum('nij,nkl->nikjl', pairs[:, 0],
+                     pairs[:, 1]).reshape((-1, 4, 4))
+
+
+def _bidiagonalize_unitaries_with_special_orthogonals(
+        mats: np.ndarray, *, rtol: float,
+        atol: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Finds special orthogonal L, R such that L @ mat @ R is diagonal.
+
+    Because mat is unitary, mat.T @ mat is a symmetric unitary matrix whose
+    real and imaginary parts commute, so a random real combination of them
+    is diagonalized by the R we're looking for. L then follows from R and the
+    eigenvalues. Matrices where this doesn't diagonalize (to within atol) are
+    retried with other combinations, and finally handled one at a time by
+    `cirq.bidiagonalize_unitary_with_special_orthogonals`.
+
+    Args:
+        mats: Unitary matrices, with shape (N, 4, 4).
+        rtol: Relative numeric error threshold.
+        atol: Absolute numeric error threshold.
+
+    Returns:
+        A triplet (L.T, d, R) of arrays with shapes (N, 4, 4), (N, 4) and
+        (N, 4, 4), such that L @ mats[k] @ R = diag(d[k]).
+    """
+    n = len(mats)
+    sym = np.einsum('nba,nbc->nac', mats, mats)
+    right = np.empty((n, 4, 4), dtype=np.float64)
+    left_t = np.empty((n, 4, 4), dtype=np.float64)
+    pending = np.arange(n)
+    prng = np.random.RandomState(1234)
+    for _ in range(_BIDIAGONALIZE_ATTEMPTS):
+        if not len(pending):
+            break
+        sub = sym[pending]
+        _, vecs = np.linalg.eigh(sub.real + prng.rand() * sub.imag)
+        diag = np.einsum('nba,nbc,ncd->nad', vecs, sub, vecs)
+        off_diagonal = diag * (1 - np.eye(4))
+        ok = np.all(np.abs(off_diagonal) <= atol, axis=(1, 2))
+        vecs = vecs[ok]
+        vecs[np.linalg.det(vecs) < 0, :, 0] *= -1
+        eigs = np.sqrt(np.einsum('nba,nbc,nca->na', vecs, sub[ok], vecs))
+        right[pending[ok]] = vecs
+        left_t[pending[ok]] = np.real(mats[pending[ok]] @ vecs /
+                                      eigs[:, np.newaxis, :])
+        pending = pending[~ok]
+
+    for k in pending:
+        left, _, right[k] = (
+            diagonalize.bidiagonalize_unitary_with_special_orthogonals(
+                mats[k], rtol=rtol, atol=atol, check_preconditions=False))
+        left_t[k] = left.T
+
+    left_t[np.linalg.det(left_t) < 0, :, 0] *= -1
+    d = np.einsum('nba,nbc,nca->na', left_t, mats, right)
+    return left_t, d, right
+
+
+def _so4s_to_magic_su2s(mats: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized `cirq.so4_to_magic_su2s`, for an (N, 4, 4) array."""
+    ab = MAGIC @ mats @ MAGIC_CONJ_T
+    n = len(ab)
+    rows = np.arange(n)
+
+    # Use the entry with the largest magnitude as a reference point.
+    a, b = np.divmod(np.argmax(np.abs(ab.reshape((n, 16))), axis=1), 4)
+
+    # Extract sub-factors touching the reference cell.
+    f1 = np.zeros((n, 2, 2), dtype=np.complex128)
+    f2 = np.zeros((n, 2, 2), dtype=np.complex128)
+    for i in range(2):
+        for j in range(2):
+            f1[rows, (a >> 1) ^ i, (b >> 1) ^ j] = ab[rows, a ^ (i << 1),
+                                                      b ^ (j << 1)]
+            f2[rows, (a & 1) ^ i, (b & 1) ^ j] = ab[rows, a ^ i, b ^ j]
+
+    # Rescale factors to have unit determinants.
+    for f in (f1, f2):
+        det = np.sqrt(np.linalg.det(f))
+        det[det == 0] = 1
+        f /= det[:, np.newaxis, np.newaxis]
+
+    # Fix the sign that the global factor would have.
+    g = ab[rows, a, b] / (f1[rows, a >> 1, b >> 1] * f2[rows, a & 1, b & 1])
+    f1[np.real(g) < 0] *= -1
+    return f1, f2
+
+
+def _kak_canonicalize_vectors(
+        vecs: np.ndarray, atol: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized `cirq.kak_canonicalize_vector`, for an (N, 3) array.
+
+    Returns:
+        A tuple (phase, after, vecs, before) of the global phases, the pairs of
+        single-qubit operations after and before the interactions (as arrays of
+        shape (2, N, 2, 2) ordered like in a `cirq.KakDecomposition`), and the
+        canonicalized interaction coefficients.
+    """
+    n = len(vecs)
+    v = np.array(vecs, dtype=np.float64)
+    phase = np.ones(n, dtype=np.complex128)
+    eye = np.broadcast_to(np.eye(2, dtype=np.complex128), (n, 2, 2))
+    left = [eye.copy(), eye.copy()]
+    right = [eye.copy(), eye.copy()]
+
+    # Shifting strength by ½π is equivalent to local ops (e.g. exp(i½π XX)∝XX).
+    def shift(k, steps):
+        v[:, k] += steps * np.pi / 2
+        phase[:] *= 1j**steps
+        flip = _KAK_FLIPPER_POWERS[k][steps % 4]
+        right[0] = flip @ right[0]
+        right[1] = flip @ right[1]
+
+    # Two negations is equivalent to temporarily flipping along the other axis.
+    def negate(k1, k2, mask):
+        v[mask, k1] *= -1
+        v[mask, k2] *= -1
+        phase[mask] *= -1
+        s = _KAK_FLIPPERS[3 - k1 - k2]  # The other axis' flipper.
+        left[1][mask] = left[1][mask] @ s
+        right[1][mask] = s @ right[1][mask]
+
+    # Swapping components is equivalent to temporarily swapping the two axes.
+    def swap(k1, k2, mask):
+        v[mask, k1], v[mask, k2] = v[mask, k2], v[mask, k1]
+        s = _KAK_SWAPPERS[3 - k1 - k2]  # The other axis' swapper.
+        left[0][mask] = left[0][mask] @ s
+        left[1][mask] = left[1][mask] @ s
+        right[0][mask] = s @ right[0][mask]
+        right[1][mask] = s @ right[1][mask]
+
+    # Shifts an axis strength into the range (-π/4, π/4].
+    def canonical_shift(k):
+        target = np.pi / 4 - np.mod(np.pi / 4 - v[:, k], np.pi / 2)
+        shift(k, np.round((target - v[:, k]) / (np.pi / 2)).astype(np.int64))
+
+    # Sorts axis strengths into descending order by absolute magnitude.
+    def sort():
+        swap(0, 1, np.abs(v[:, 0]) < np.abs(v[:, 1]))
+        swap(1, 2, np.abs(v[:, 1]) < np.abs(v[:, 2]))
+        swap(0, 1, np.abs(v[:, 0]) < np.abs(v[:, 1]))
+
+    # Get all strengths to (-¼π, ¼π] in descending order by absolute magnitude.
+    canonical_shift(0)
+    canonical_shift(1)
+    canonical_shift(2)
+    sort()
+
+    # Move all negativity into z.
+    negate(0, 2, v[:, 0] < 0)
+    negate(1, 2, v[:, 1] < 0)
+    canonical_shift(2)
+
+    # If x = π/4, force z to be positive
+    fix = (v[:, 0] > np.pi / 4 - atol) & (v[:, 2] < 0)
+    shift(0, -fix.astype(np.int64))
+    negate(0, 2, fix)
+
+    return (phase, np.array([left[1], left[0]]), v,
+            np.array([right[1], right[0]]))
+
+
 def kak_vector(unitary: Union[Iterable[np.ndarray], np.ndarray],
                *,
                rtol: float = 1e-5,
@@ -314,6 +314,64 @@ def test_kak_decomposition_invalid_object():
     np.testing.assert_allclose(cirq.unitary(nil), np.eye(4), atol=1e-8)
 
 
+_KAK_BATCH_TARGETS = np.array([
+    np.eye(4),
+    SWAP,
+    SWAP * 1j,
+    CZ,
+    CNOT,
+    SWAP @ CZ,
+    -np.eye(4),
+    cirq.unitary(cirq.ISWAP**0.5),
+    cirq.unitary(cirq.FSimGate(0.3, 0.2)),
+    cirq.kron(cirq.unitary(cirq.H), cirq.unitary(cirq.T)),
+] + [cirq.testing.random_unitary(4, random_state=k) for k in range(20)])
+
+
+def test_kak_decomposition_batch():
+    batch = cirq.kak_decomposition_batch(_KAK_BATCH_TARGETS)
+    assert len(batch) == len(_KAK_BATCH_TARGETS)
+    np.testing.assert_allclose(batch.unitaries(), _KAK_BATCH_TARGETS, atol=1e-8)
+    np.testing.assert_allclose(batch.interaction_coefficients,
+                               cirq.kak_vector(_KAK_BATCH_TARGETS),
+                               atol=1e-8)
+    for target, kak in zip(_KAK_BATCH_TARGETS, batch):
+        np.testing.assert_allclose(cirq.unitary(kak), target, atol=1e-8)
+        for single in (kak.single_qubit_operations_before +
+                       kak.single_qubit_operations_after):
+            assert cirq.is_special_unitary(single)
+        np.testing.assert_allclose(
+            kak.interaction_coefficients,
+            cirq.kak_decomposition(target).interaction_coefficients,
+            atol=1e-8)
+    assert repr(batch).startswith('cirq.KakDecompositionBatch(')
+
+
+def test_kak_decomposition_batch_fallback(monkeypatch):
+    monkeypatch.setattr(cirq.linalg.decompositions, '_BIDIAGONALIZE_ATTEMPTS',
+                        0)
+    batch = cirq.kak_decomposition_batch(list(_KAK_BATCH_TARGETS))
+    np.testing.assert_allclose(batch.unitaries(), _KAK_BATCH_TARGETS, atol=1e-8)
+
+
+def test_kak_decomposition_batch_empty():
+    batch = cirq.kak_decomposition_batch([])
+    assert len(batch) == 0
+    assert batch.unitaries().shape == (0, 4, 4)
+
+
+def test_kak_decomposition_batch_invalid():
+    with pytest.raises(ValueError, match='shape'):
+        _ = cirq.kak_decomposition_batch(np.eye(4))
+
+    with pytest.raises(ValueError, match='4x4 unitary matrices'):
+        _ = cirq.kak_decomposition_batch([np.eye(4), np.ones((4, 4))])
+
+    batch = cirq.kak_decomposition_batch([np.eye(4), CZ],
+                                         check_preconditions=False)
+    np.testing.assert_allclose(batch.unitaries(), [np.eye(4), CZ], atol=1e-8)
+
+
 def test_kak_decomposition_eq():
     eq = cirq.testing.EqualsTester()
 
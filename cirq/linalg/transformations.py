@@ -14,6 +14,7 @@
 
 """Utility methods for transforming matrices or vectors."""
 
+import functools
 from typing import Tuple, Optional, Sequence, List, Union, TypeVar
 
 import numpy as np
@@ -31,6 +32,11 @@ RaiseValueErrorIfNotProvided = np.array([])  # type: np.ndarray
 
 TDefault = TypeVar('TDefault')
 
+# Targets with at least this many entries are multiplied by matrices on two or
+# more axes with `np.tensordot`, which uses BLAS. For smaller targets, or a
+# single target axis, `np.einsum` is faster.
+_TENSORDOT_MIN_SIZE = 1024
+
 
 def reflection_matrix_pow(reflection_matrix: np.ndarray, exponent: float):
     """Raises a matrix with two opposing eigenvalues to a power.
@@ -128,8 +134,19 @@ def targeted_left_multiply(left_matrix: np.ndarray,
             right_target=old_effect,
             target_axes=[1, 4])
 
+    The left matrix can also be a stack of matrices with leading batch axes,
+    one for each of the leading axes of the target. Each entry along those
+    axes of the target is then multiplied by its own matrix. For example, if
+    `states` has shape (10, 2, 2) and `ops` has shape (10, 2, 2), then
+
+        cirq.targeted_left_multiply(ops, states, [2])
+
+    applies `ops[i]` to the second qubit of `states[i]` for each `i`.
+
     Args:
-        left_matrix: What to left-multiply the target tensor by.
+        left_matrix: What to left-multiply the target tensor by. Axes beyond
+            the two per target axis are batch axes matching the leading axes
+            of the target.
         right_target: A tensor to carefully broadcast a left-multiply over.
         target_axes: Which axes of the target are being operated on.
         out: The buffer to store the results in. If not specified or None, a new
@@ -143,26 +160,65 @@ def targeted_left_multiply(left_matrix: np.ndarray,
 
     k = len(target_axes)
     d = len(right_target.shape)
+    b = len(left_matrix.shape) - 2 * k
+    target_axes = [a + d if a < 0 else a for a in target_axes]
+    if b < 0 or any(a < b for a in target_axes):
+        raise ValueError('The batch axes of left_matrix must be leading axes '
+                         'of right_target that are not targeted.')
+
+    if b == 0 and k >= 2 and right_target.size >= _TENSORDOT_MIN_SIZE:
+        result = np.tensordot(left_matrix,
+                              right_target,
+                              axes=(range(k, 2 * k), target_axes))
+        # The target axes come first in the result, and are moved back into
+        # place while copying into the output.
+        result = np.moveaxis(result, range(k), target_axes)
+        if out is None:
+            return np.ascontiguousarray(result)
+        np.copyto(out, result)
+        return out
+
+    input_indices, data_indices, output_indices, optimize = (
+        _targeted_left_multiply_plan(k, d, b, tuple(target_axes)))
+    return np.einsum(left_matrix, input_indices,
+                     right_target, data_indices,
+                     output_indices,
+                     optimize=optimize,
+                     # This is workaround for a bug in numpy! Supposed to be
+                     # able to just say 'old=old'.
+                     **({'out': out} if out is not None else {}))
+
+
+@functools.lru_cache(maxsize=1024)
+def _targeted_left_multiply_plan(
+        k: int, d: int, b: int, target_axes: Tuple[int, ...]
+) -> Tuple[Tuple[int, ...], Tuple[int, ...], Tuple[int, ...], bool]:
+    """Returns the einsum operands of `targeted_left_multiply`.
+
+    Args:
+        k: The number of target axes.
+        d: The number of axes of the target tensor.
+        b: The number of batch axes of the left matrix.
+        target_axes: Which axes of the target are being operated on.
+
+    Returns:
+        The indices of the left matrix, of the target and of the output, and
+        whether einsum should optimize the contraction.
+    """
     work_indices = tuple(range(k))
     data_indices = tuple(range(k, k + d))
     used_data_indices = tuple(data_indices[q] for q in target_axes)
-    input_indices = work_indices + used_data_indices
+    input_indices = data_indices[:b] + work_indices + used_data_indices
     output_indices = list(data_indices)
     for w, t in zip(work_indices, target_axes):
         output_indices[t] = w
 
     all_indices = set(input_indices + data_indices + tuple(output_indices))
-
-    return np.einsum(left_matrix, input_indices,
-                     right_target, data_indices,
-                     output_indices,
-                     # We would prefer to omit 'optimize=' (it's faster),
-                     # but this is a workaround for a bug in numpy:
-                     #     https://github.com/numpy/numpy/issues/10926
-                     optimize=len(all_indices) >= 26,
-                     # And this is workaround for *another* bug!
-                     # Supposed to be able to just say 'old=old'.
-                     **({'out': out} if out is not None else {}))
+    # We would prefer to omit 'optimize=' (it's faster), but this is a
+    # workaround for a bug in numpy:
+    #     https://github.com/numpy/numpy/issues/10926
+    return (input_indices, data_indices, tuple(output_indices),
+            len(all_indices) >= 26)
 
 
 def targeted_conjugate_about(tensor: np.ndarray,
@@ -249,6 +305,12 @@ def apply_matrix_to_slices(target: np.ndarray,
                     slices=[1, 2]
                 )
 
+    The matrix can also be a stack of matrices with shape
+    `batch_shape + (N, N)`, where the leading axes of the target have shape
+    `batch_shape`. Each entry along those axes of the target is then
+    multiplied by its own matrix. The slices must keep the leading axes, e.g.
+    `(..., 0)`.
+
     Args:
         target: The input array with slices that need to be left-multiplied.
         matrix: The linear operation to apply to the subspace defined by the
@@ -267,8 +329,8 @@ def apply_matrix_to_slices(target: np.ndarray,
     # Validate arguments.
     if out is target:
         raise ValueError("Can't write output over the input.")
-    if matrix.shape != (len(slices), len(slices)):
-        raise ValueError("matrix.shape != (len(slices), len(slices))")
+    if matrix.shape[-2:] != (len(slices), len(slices)):
+        raise ValueError("matrix.shape[-2:] != (len(slices), len(slices))")
 
     # Fill in default values and prepare space.
     if out is None:
@@ -276,12 +338,20 @@ def apply_matrix_to_slices(target: np.ndarray,
     else:
         out[...] = target[...]
 
+    batch_shape = matrix.shape[:-2]
+    if batch_shape:
+        # Line the entries of the stack up with the leading axes of each slice.
+        slice_ndim = len(target[slices[0]].shape)
+        matrix = matrix.reshape(batch_shape + (1,) *
+                                (slice_ndim - len(batch_shape)) +
+                                matrix.shape[-2:])
+
     # Apply operation.
     for i, s_i in enumerate(slices):
-        out[s_i] *= matrix[i, i]
+        out[s_i] *= matrix[..., i, i]
         for j, s_j in enumerate(slices):
             if i != j:
-                out[s_i] += target[s_j] * matrix[i, j]
+                out[s_i] += target[s_j] * matrix[..., i, j]
 
     return out
 
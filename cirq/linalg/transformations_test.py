@@ -208,6 +208,68 @@ def test_targeted_left_multiply_out():
         atol=1e-8)
 
 
+@pytest.mark.parametrize('target_axes', [[3], [9, 2], [0, 11, 5]])
+def test_targeted_left_multiply_large_target(target_axes):
+    k = len(target_axes)
+    left = cirq.testing.random_unitary(2**k).reshape((2,) * 2 * k)
+    right = cirq.testing.random_superposition(2**12).reshape((2,) * 12)
+    expected = np.einsum(left,
+                         list(range(12, 12 + k)) + target_axes, right,
+                         list(range(12)),
+                         [12 + target_axes.index(i) if i in target_axes else i
+                          for i in range(12)])
+
+    result = cirq.targeted_left_multiply(left, right, target_axes)
+    assert result.flags.c_contiguous
+    np.testing.assert_allclose(result, expected, atol=1e-8)
+
+    out = np.empty_like(right)
+    result = cirq.targeted_left_multiply(left, right, target_axes, out=out)
+    assert result is out
+    np.testing.assert_allclose(out, expected, atol=1e-8)
+
+
+def test_targeted_left_multiply_batch():
+    states = np.array([cirq.testing.random_superposition(8) for _ in range(3)
+                      ]).reshape((3, 2, 2, 2))
+    ops = np.array([cirq.testing.random_unitary(4) for _ in range(3)])
+    result = cirq.targeted_left_multiply(left_matrix=ops.reshape(
+        (3, 2, 2, 2, 2)),
+                                         right_target=states,
+                                         target_axes=[3, 1])
+    for i in range(3):
+        np.testing.assert_allclose(
+            result[i],
+            cirq.targeted_left_multiply(ops[i].reshape((2, 2, 2, 2)),
+                                        states[i], [2, 0]),
+            atol=1e-8)
+
+    with pytest.raises(ValueError, match='batch axes'):
+        _ = cirq.targeted_left_multiply(left_matrix=ops.reshape(
+            (3, 2, 2, 2, 2)),
+                                        right_target=states,
+                                        target_axes=[0, 1])
+
+
+@pytest.mark.parametrize('size', [3, 12])
+def test_targeted_left_multiply_negative_axes(size):
+    left = cirq.testing.random_unitary(4).reshape((2, 2, 2, 2))
+    right = cirq.testing.random_superposition(2**size).reshape((2,) * size)
+    np.testing.assert_allclose(
+        cirq.targeted_left_multiply(left, right, [-1, 0]),
+        cirq.targeted_left_multiply(left, right, [size - 1, 0]),
+        atol=1e-8)
+
+    states = np.array([right, right])
+    ops = np.array([left, left.conj()])
+    result = cirq.targeted_left_multiply(ops, states, [-2, 1])
+    for i in range(2):
+        np.testing.assert_allclose(result[i],
+                                   cirq.targeted_left_multiply(
+                                       ops[i], right, [size - 2, 0]),
+                                   atol=1e-8)
+
+
 def test_targeted_conjugate_simple():
     a = np.array([[0, 1j], [0, 0]])
     # yapf: disable
@@ -671,3 +733,22 @@ def test_deprecated():
         # pylint: disable=unexpected-keyword-arg,no-value-for-parameter
         _ = cirq.partial_trace_of_state_vector_as_mixture(wavefunction=a,
                                                           keep_indices=[0])
+
+
+def test_apply_matrix_to_slices_batch():
+    target = np.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]])
+    matrices = np.array([np.eye(2), [[0, 1], [1, 0]], [[2, 0], [0, 3]]])
+    np.testing.assert_allclose(
+        cirq.apply_matrix_to_slices(target=target,
+                                    matrix=matrices,
+                                    slices=[(..., 0), (..., 1)]),
+        np.array([[1, 2], [4, 3], [10, 18]]))
+
+    # Batch axes followed by more axes.
+    target = np.arange(12.0).reshape((2, 3, 2))
+    matrices = np.array([[[0, 1], [1, 0]], np.eye(2)])
+    result = cirq.apply_matrix_to_slices(target=target,
+                                         matrix=matrices,
+                                         slices=[(..., 0), (..., 1)])
+    np.testing.assert_allclose(result[0], target[0][:, ::-1])
+    np.testing.assert_allclose(result[1], target[1])
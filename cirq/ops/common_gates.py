@@ -1035,6 +1035,8 @@ class CXPowGate(eigen_gate.EigenGate, gate_features.TwoQubitGate):
             return []
         return NotImplemented
 
+    _qubit_independent_decomposition_ = True
+
     def _decompose_(self, qubits):
         c, t = qubits
         yield YPowGate(exponent=-0.5).on(t)
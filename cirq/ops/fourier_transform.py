@@ -53,6 +53,8 @@ class QuantumFourierTransformGate(raw_types.Gate):
     def num_qubits(self) -> int:
         return self._num_qubits
 
+    _qubit_independent_decomposition_ = True
+
     def _decompose_(self, qubits):
         if len(qubits) == 0:
             return
@@ -107,6 +109,8 @@ class PhaseGradientGate(raw_types.Gate):
     def num_qubits(self) -> int:
         return self._num_qubits
 
+    _qubit_independent_decomposition_ = True
+
     def _decompose_(self, qubits):
         for i, q in enumerate(qubits):
             yield cirq.Z(q)**(self.exponent / 2**i)
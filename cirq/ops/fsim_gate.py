@@ -137,6 +137,8 @@ class FSimGate(gate_features.TwoQubitGate,
             out[ii] *= cmath.exp(-1j * self.phi)
         return out
 
+    _qubit_independent_decomposition_ = True
+
     def _decompose_(self, qubits) -> 'cirq.OP_TREE':
         a, b = qubits
         xx = cirq.XXPowGate(exponent=self.theta / np.pi, global_shift=-0.5)
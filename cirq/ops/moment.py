@@ -15,7 +15,8 @@
 """A simplified time-slice of operations within a sequenced circuit."""
 
 from typing import (Any, Callable, Dict, FrozenSet, Iterable, Iterator,
-                    overload, Tuple, TYPE_CHECKING, TypeVar, Union)
+                    Optional, overload, Sequence, Tuple, TYPE_CHECKING,
+                    TypeVar, Union)
 from cirq import protocols
 from cirq._compat import deprecated_parameter
 from cirq.ops import raw_types
@@ -61,6 +62,7 @@ class Moment:
         """
         from cirq.ops import op_tree
         self._operations = tuple(op_tree.flatten_to_ops(contents))
+        self._qubit_to_op: Optional[Dict['cirq.Qid', 'cirq.Operation']] = None
 
         # Check that operations don't overlap.
         affected_qubits = [q for op in self.operations for q in op.qubits]
@@ -69,6 +71,56 @@ class Moment:
             raise ValueError(
                 'Overlapping operations: {}'.format(self.operations))
 
+    @staticmethod
+    def from_ops(*ops: 'cirq.Operation') -> 'cirq.Moment':
+        """Constructs a moment from the given operations.
+
+        Unlike the constructor, this doesn't flatten its arguments as an
+        OP_TREE, which is faster when the operations are already at hand.
+
+        Args:
+            *ops: The operations applied within the moment.
+
+        Raises:
+            ValueError: A qubit appears more than once.
+        """
+        qubit_to_op: Dict['cirq.Qid', 'cirq.Operation'] = {}
+        for op in ops:
+            for q in op.qubits:
+                if q in qubit_to_op:
+                    raise ValueError('Overlapping operations: {}'.format(ops))
+                qubit_to_op[q] = op
+        return Moment._from_valid_ops(tuple(ops), frozenset(qubit_to_op),
+                                      qubit_to_op)
+
+    @classmethod
+    def _from_valid_ops(
+            cls,
+            operations: Tuple['cirq.Operation', ...],
+            qubits: FrozenSet['cirq.Qid'],
+            qubit_to_op: Optional[Dict['cirq.Qid', 'cirq.Operation']] = None
+    ) -> 'cirq.Moment':
+        """Constructs a moment without validating its operations.
+
+        The caller is responsible for ensuring that the operations don't
+        overlap, that `qubits` are exactly the qubits they act on and that
+        `qubit_to_op` (if given) maps each of those qubits to its operation.
+        """
+        # Use private variables to facilitate a quick copy
+        m = cls.__new__(cls)
+        m._operations = operations
+        m._qubits = qubits
+        m._qubit_to_op = qubit_to_op
+        return m
+
+    def _qubit_to_op_map(self) -> Dict['cirq.Qid', 'cirq.Operation']:
+        """Returns the mapping from qubits to the operation acting on them."""
+        if self._qubit_to_op is None:
+            self._qubit_to_op = {
+                q: op for op in self._operations for q in op.qubits
+            }
+        return self._qubit_to_op
+
     @property
     def operations(self) -> Tuple['cirq.Operation', ...]:
         return self._operations
@@ -109,12 +161,45 @@ class Moment:
         if any(q in self._qubits for q in operation.qubits):
             raise ValueError('Overlapping operations: {}'.format(operation))
 
-        # Use private variables to facilitate a quick copy
-        m = Moment()
-        m._operations = self.operations + (operation,)
-        m._qubits = frozenset(self._qubits.union(set(operation.qubits)))
+        qubit_to_op = None
+        if self._qubit_to_op is not None:
+            qubit_to_op = dict(self._qubit_to_op)
+            qubit_to_op.update((q, operation) for q in operation.qubits)
+        return Moment._from_valid_ops(self._operations + (operation,),
+                                      self._qubits.union(operation.qubits),
+                                      qubit_to_op)
 
-        return m
+    def with_operations(self, *contents: 'cirq.OP_TREE') -> 'cirq.Moment':
+        """Returns a new moment with the given contents added.
+
+        Args:
+            contents: New operations to add to this moment.
+
+        Returns:
+            The new moment.
+
+        Raises:
+            ValueError: If the contents given overlaps a current operation in
+                the moment, or with each other.
+        """
+        from cirq.ops import op_tree
+        new_ops = tuple(op_tree.flatten_to_ops(contents))
+        if not new_ops:
+            return self
+
+        new_qubits = set(self._qubits)
+        for op in new_ops:
+            for q in op.qubits:
+                if q in new_qubits:
+                    raise ValueError('Overlapping operations: {}'.format(op))
+                new_qubits.add(q)
+
+        qubit_to_op = None
+        if self._qubit_to_op is not None:
+            qubit_to_op = dict(self._qubit_to_op)
+            qubit_to_op.update((q, op) for op in new_ops for q in op.qubits)
+        return Moment._from_valid_ops(self._operations + new_ops,
+                                      frozenset(new_qubits), qubit_to_op)
 
     def without_operations_touching(self, qubits: Iterable['cirq.Qid']
                                    ) -> 'cirq.Moment':
@@ -129,9 +214,31 @@ class Moment:
         qubits = frozenset(qubits)
         if not self.operates_on(qubits):
             return self
-        return Moment(
-            operation for operation in self.operations
-            if qubits.isdisjoint(frozenset(operation.qubits)))
+        return self._subset(
+            [op for op in self.operations if qubits.isdisjoint(op.qubits)])
+
+    def _subset(self, operations: Sequence['cirq.Operation']) -> 'cirq.Moment':
+        """Returns a moment holding some of this moment's operations.
+
+        Any subset of a valid moment's operations is valid, so the result
+        skips the overlap checks of the constructor.
+        """
+        return Moment._from_valid_ops(
+            tuple(operations),
+            frozenset(q for op in operations for q in op.qubits))
+
+    def operation_at(self, qubit: raw_types.Qid) -> Optional['cirq.Operation']:
+        """Returns the operation on a certain qubit for the moment.
+
+        Args:
+            qubit: The qubit on which the returned Operation operates
+                on.
+
+        Returns:
+            The operation that operates on the qubit for that moment, or None
+            if there is no such operation.
+        """
+        return self._qubit_to_op_map().get(qubit)
 
     def _operation_touching(self, qubit: raw_types.Qid) -> 'cirq.Operation':
         """Returns the operation touching given qubit.
@@ -140,10 +247,10 @@ class Moment:
         Returns:
             The operation which touches `qubit`.
         """
-        for op in self.operations:
-            if qubit in op.qubits:
-                return op
-        raise KeyError("Moment doesn't act on given qubit")
+        op = self._qubit_to_op_map().get(qubit)
+        if op is None:
+            raise KeyError("Moment doesn't act on given qubit")
+        return op
 
     def __copy__(self):
         return type(self)(self.operations)
@@ -233,7 +340,7 @@ class Moment:
         if isinstance(other, raw_types.Operation):
             return self.with_operation(other)
         if isinstance(other, Moment):
-            return Moment(self.operations + other.operations)
+            return self.with_operations(other.operations)
         return NotImplemented
 
     # pylint: disable=function-redefined
@@ -249,8 +356,7 @@ class Moment:
         if isinstance(key, raw_types.Qid):
             return self._operation_touching(key)
         elif isinstance(key, Iterable):
-            qubits_to_keep = frozenset(key)
-            ops_to_keep = tuple(
-                op for op in self.operations
-                if not qubits_to_keep.isdisjoint(frozenset(op.qubits)))
-            return Moment(ops_to_keep)
+            qubit_to_op = self._qubit_to_op_map()
+            ids_to_keep = {id(qubit_to_op[q]) for q in key if q in qubit_to_op}
+            return self._subset(
+                [op for op in self.operations if id(op) in ids_to_keep])
@@ -140,6 +140,55 @@ def test_with_operation():
         _ = cirq.Moment([cirq.X(a)]).with_operation(cirq.X(a))
 
 
+def test_with_operations():
+    a, b, c, d = cirq.LineQubit.range(4)
+
+    assert cirq.Moment().with_operations(cirq.X(a)) == cirq.Moment(cirq.X(a))
+    assert cirq.Moment(cirq.X(a)).with_operations() == cirq.Moment(cirq.X(a))
+    assert (cirq.Moment(cirq.X(a)).with_operations(
+        cirq.CZ(b, c), [cirq.Y(d)]) == cirq.Moment(cirq.X(a), cirq.CZ(b, c),
+                                                   cirq.Y(d)))
+
+    with pytest.raises(ValueError, match='Overlap'):
+        _ = cirq.Moment(cirq.X(a)).with_operations(cirq.CZ(a, b))
+    with pytest.raises(ValueError, match='Overlap'):
+        _ = cirq.Moment(cirq.X(a)).with_operations(cirq.X(b), cirq.Y(b))
+
+
+def test_from_ops():
+    a, b = cirq.LineQubit.range(2)
+
+    assert cirq.Moment.from_ops() == cirq.Moment()
+    m = cirq.Moment.from_ops(cirq.X(a), cirq.Y(b))
+    assert m == cirq.Moment(cirq.X(a), cirq.Y(b))
+    assert m.qubits == {a, b}
+    assert m[b] == cirq.Y(b)
+
+    with pytest.raises(ValueError, match='Overlap'):
+        _ = cirq.Moment.from_ops(cirq.X(a), cirq.CZ(a, b))
+
+
+def test_operation_at():
+    a, b, c, d = cirq.LineQubit.range(4)
+    m = cirq.Moment(cirq.CZ(a, b))
+    assert m.operation_at(a) == cirq.CZ(a, b)
+    assert m.operation_at(b) == cirq.CZ(a, b)
+    assert m.operation_at(c) is None
+
+    # The qubit index is carried over to derived moments.
+    m2 = m.with_operation(cirq.X(c)).with_operations(cirq.Y(d))
+    assert m2.operation_at(a) == cirq.CZ(a, b)
+    assert m2.operation_at(c) == cirq.X(c)
+    assert m2.operation_at(d) == cirq.Y(d)
+    assert m.operation_at(c) is None
+
+    m3 = m2.without_operations_touching([b, d])
+    assert m3 == cirq.Moment(cirq.X(c))
+    assert m3.qubits == {c}
+    assert m3.operation_at(a) is None
+    assert m3.operation_at(c) == cirq.X(c)
+
+
 def test_without_operations_touching():
     a = cirq.NamedQubit('a')
     b = cirq.NamedQubit('b')
@@ -220,6 +220,8 @@ class ZZPowGate(eigen_gate.EigenGate,
     where w = e^{iπt} and '.' means '0'.
     """
 
+    _qubit_independent_decomposition_ = True
+
     def _decompose_(self, qubits):
         yield common_gates.ZPowGate(exponent=self.exponent)(qubits[0])
         yield common_gates.ZPowGate(exponent=self.exponent)(qubits[1])
@@ -125,6 +125,8 @@ class PhasedISwapPowGate(eigen_gate.EigenGate, gate_features.TwoQubitGate):
                                       out=args.available_buffer)
         return args.available_buffer
 
+    _qubit_independent_decomposition_ = True
+
     def _decompose_(self, qubits: Sequence['cirq.Qid']) -> 'cirq.OP_TREE':
         if len(qubits) != 2:
             raise ValueError(f'Expected two qubits, got {len(qubits)}')
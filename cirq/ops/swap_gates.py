@@ -56,6 +56,8 @@ class SwapPowGate(eigen_gate.EigenGate, gate_features.TwoQubitGate,
     `cirq.SWAP`, the swap gate, is an instance of this gate at exponent=1.
     """
 
+    _qubit_independent_decomposition_ = True
+
     def _decompose_(self, qubits):
         """See base class."""
         a, b = qubits
@@ -194,6 +196,8 @@ class ISwapPowGate(eigen_gate.EigenGate,
         ]
         # yapf: enable
 
+    _qubit_independent_decomposition_ = True
+
     def _decompose_(self, qubits):
         a, b = qubits
 
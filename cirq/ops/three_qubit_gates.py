@@ -372,6 +372,8 @@ class CCXPowGate(eigen_gate.EigenGate,
                 args.axes),
             default=NotImplemented)
 
+    _qubit_independent_decomposition_ = True
+
     def _decompose_(self, qubits):
         c1, c2, t = qubits
         yield common_gates.H(t)
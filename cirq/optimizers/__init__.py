@@ -19,6 +19,9 @@ from cirq.optimizers.cphase_to_fsim import (
     decompose_cphase_into_two_fsim,
 )
 
+from cirq.optimizers.compilation_cache import (
+    CompilationCache,)
+
 from cirq.optimizers.controlled_gate_decomposition import (
     decompose_multi_controlled_x, decompose_multi_controlled_rotation)
 
@@ -58,6 +61,12 @@ from cirq.optimizers.decompositions import (
     single_qubit_op_to_framed_phase_form,
 )
 
+from cirq.optimizers.partitioned import (
+    optimize_batch,
+    optimize_partitioned,
+    qubit_partitions,
+)
+
 from cirq.optimizers.stratify import (
     stratified_circuit,)
 from cirq.optimizers.synchronize_terminal_measurements import (
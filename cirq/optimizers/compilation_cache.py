@@ -0,0 +1,256 @@
+# Copyright 2020 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Reuses compiled circuits across circuits with the same structure."""
+
+import collections
+import hashlib
+import itertools
+import os
+import pathlib
+import tempfile
+from typing import (Callable, Dict, Optional, Tuple, TYPE_CHECKING, Union, cast)
+
+import sympy
+
+from cirq import circuits, ops, protocols, study
+from cirq.study import flatten_expressions
+
+if TYPE_CHECKING:
+    import cirq
+
+# The suffix of the template files. Only files with this suffix are ever
+# evicted from the cache directory.
+_FILE_SUFFIX = '.compiled.json'
+
+
+class CompilationCache:
+    """Caches the output of a circuit compiler by circuit structure.
+
+    Circuits are looked up by a fingerprint of their gates, qubits and device
+    in which every distinct parameter expression is replaced by a positional
+    symbol. Circuits that only differ in the names of their symbols, or in the
+    values later assigned to them, therefore share a single compiled template.
+    On a hit the template's positional symbols are mapped back to the caller's
+    expressions (or to their values, when a resolver is given) instead of
+    running the compiler again.
+
+    This is only correct for compilers that treat symbols opaquely, i.e. whose
+    output doesn't depend on the value a symbol will later be given. Numeric
+    parameters are part of the fingerprint, so circuits with different
+    numeric angles are compiled separately.
+
+    Since the compiler only sees symbols, it can't make use of the values they
+    will be given. Optimizations that depend on those values, e.g. merging a
+    single-qubit rotation by a resolved angle into its neighbours, are lost.
+    For example, compiling a resolved circuit with `optimized_for_sycamore` can
+    give fewer single-qubit gates than resolving its cached template. When
+    this matters, cheap single-qubit merges can be run again on the compiled
+    circuit:
+
+        compiled = cache.compile(circuit, {'theta': 0.25})
+        cirq.merge_single_qubit_gates_into_phxz(compiled)
+
+    For example:
+
+        cache = cirq.CompilationCache(
+            lambda c: cirq.google.optimized_for_sycamore(
+                c, optimizer_type='sycamore'))
+        compiled = cache.compile(circuit, {'theta': 0.25})
+
+    Compiled templates can also be stored as JSON files in a directory, so
+    that they survive across processes. The directory should only be used by
+    caches wrapping the same compiler. Files are written atomically, so caches
+    in several processes can share a directory, and eviction only deletes the
+    cache's own `*.compiled.json` files.
+
+    Attributes:
+        hits: The number of lookups answered from memory.
+        disk_hits: The number of lookups answered from the directory.
+        misses: The number of lookups that ran the compiler.
+    """
+
+    def __init__(self,
+                 compiler: Callable[['cirq.Circuit'],
+                                    Optional['cirq.Circuit']],
+                 *,
+                 maxsize: Optional[int] = 128,
+                 directory: Union[None, str, pathlib.Path] = None,
+                 max_disk_entries: Optional[int] = None) -> None:
+        """Initializes a CompilationCache.
+
+        Args:
+            compiler: Compiles a circuit. It may either return the compiled
+                circuit, or return None after modifying its argument in place
+                (like `cirq.ConvertToCzAndSingleGates().optimize_circuit`).
+            maxsize: The number of templates to keep in memory, evicting the
+                least recently used one first. None means no limit.
+            directory: If set, templates are also saved to and loaded from
+                this directory.
+            max_disk_entries: The number of templates to keep in `directory`,
+                deleting the least recently used template files first. Other
+                files in the directory are left alone. None means no limit.
+        """
+        self._compiler = compiler
+        self._maxsize = maxsize
+        self._directory = None if directory is None else pathlib.Path(
+            directory)
+        self._max_disk_entries = max_disk_entries
+        self._templates: 'collections.OrderedDict[str, cirq.Circuit]' = (
+            collections.OrderedDict())
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def fingerprint(circuit: 'cirq.Circuit') -> str:
+        """Returns the key under which a circuit's compilation is cached."""
+        return _canonicalize(circuit)[0]
+
+    def compile(self,
+                circuit: 'cirq.Circuit',
+                param_resolver: 'cirq.ParamResolverOrSimilarType' = None
+               ) -> 'cirq.Circuit':
+        """Compiles a circuit, reusing an earlier compilation if possible.
+
+        Args:
+            circuit: The circuit to compile. This value is not mutated.
+            param_resolver: If given, the parameters of the compiled circuit
+                are resolved with this resolver.
+
+        Returns:
+            A new compiled circuit.
+        """
+        key, template_input, expressions = _canonicalize(circuit)
+        template = self._get(key)
+        if template is None:
+            template = template_input.copy()
+            result = self._compiler(template)
+            if result is not None:
+                template = result.copy()
+            self._put(key, template)
+
+        resolver = study.ParamResolver(param_resolver)
+        mapping: study.ParamDictType = {
+            symbol: resolver.value_of(expression) if resolver else expression
+            for symbol, expression in expressions.items()
+        }
+        # Only parameterized operations are resolved, so that the other gates
+        # keep their exact type (e.g. a resolved `cirq.google.SYC` would
+        # become a `cirq.FSimGate`).
+        moments = [
+            ops.Moment(_resolve_if_parameterized(op, mapping)
+                       for op in moment)
+            for moment in template
+        ]
+        return circuits.Circuit(moments, device=template.device)
+
+    def clear(self) -> None:
+        """Forgets the templates held in memory."""
+        self._templates.clear()
+
+    def _get(self, key: str) -> Optional['cirq.Circuit']:
+        template = self._templates.get(key)
+        if template is not None:
+            self._templates.move_to_end(key)
+            self.hits += 1
+            return template
+
+        path = self._path(key)
+        if path is not None and path.exists():
+            template = protocols.read_json(path)
+            os.utime(path)
+            self._remember(key, template)
+            self.disk_hits += 1
+            return template
+
+        self.misses += 1
+        return None
+
+    def _put(self, key: str, template: 'cirq.Circuit') -> None:
+        self._remember(key, template)
+        path = self._path(key)
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write_atomically(path, protocols.to_json(template))
+        if self._max_disk_entries is not None:
+            self._evict(path.parent)
+
+    def _evict(self, directory: pathlib.Path) -> None:
+        assert self._max_disk_entries is not None
+        files = []
+        for f in directory.glob(f'*{_FILE_SUFFIX}'):
+            try:
+                files.append((f.stat().st_mtime, f))
+            except FileNotFoundError:
+                pass  # Evicted by another process.
+        files.sort()
+        for _, stale in files[:max(0, len(files) - self._max_disk_entries)]:
+            try:
+                stale.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _remember(self, key: str, template: 'cirq.Circuit') -> None:
+        self._templates[key] = template
+        if self._maxsize is not None:
+            while len(self._templates) > self._maxsize:
+                self._templates.popitem(last=False)
+
+    def _path(self, key: str) -> Optional[pathlib.Path]:
+        if self._directory is None:
+            return None
+        return self._directory / f'{key}{_FILE_SUFFIX}'
+
+
+def _write_atomically(path: pathlib.Path, text: str) -> None:
+    """Writes a file so that readers never see it partially written."""
+    fd, temp = tempfile.mkstemp(dir=path.parent,
+                                prefix=f'.{path.name}.',
+                                suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(text)
+        os.replace(temp, path)
+    except BaseException:
+        os.unlink(temp)
+        raise
+
+
+def _resolve_if_parameterized(op: 'cirq.Operation',
+                              mapping: study.ParamDictType) -> 'cirq.Operation':
+    if not protocols.is_parameterized(op):
+        return op
+    return protocols.resolve_parameters(op, mapping)
+
+
+def _canonicalize(
+        circuit: 'cirq.Circuit'
+) -> Tuple[str, 'cirq.Circuit', Dict[sympy.Symbol, sympy.Basic]]:
+    """Replaces each distinct parameter expression with a positional symbol.
+
+    Returns:
+        The fingerprint of the circuit, the circuit using positional symbols,
+        and a map from each positional symbol to the expression it replaced.
+    """
+    counter = itertools.count()
+    flattener = flatten_expressions._ParamFlattener(
+        get_param_name=lambda _: f'<p{next(counter)}>')
+    canonical = flattener.flatten(circuit)
+    key = hashlib.sha256(repr(canonical).encode()).hexdigest()
+    expressions = {
+        cast(sympy.Symbol, symbol): cast(sympy.Basic, expression)
+        for expression, symbol in flattener.param_dict.items()
+    }
+    return key, canonical, expressions
@@ -0,0 +1,160 @@
+# Copyright 2020 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import sympy
+
+import cirq
+
+
+class CountingCompiler:
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, circuit):
+        self.calls += 1
+        cirq.ConvertToCzAndSingleGates().optimize_circuit(circuit)
+
+
+def _circuit(symbol):
+    a, b = cirq.LineQubit.range(2)
+    return cirq.Circuit(
+        cirq.X(a)**symbol,
+        cirq.CNOT(a, b),
+        cirq.Z(b)**(2 * symbol + 1),
+    )
+
+
+def test_fingerprint():
+    t, s = sympy.Symbol('t'), sympy.Symbol('s')
+    assert cirq.CompilationCache.fingerprint(
+        _circuit(t)) == cirq.CompilationCache.fingerprint(_circuit(s))
+    assert cirq.CompilationCache.fingerprint(
+        _circuit(t)) != cirq.CompilationCache.fingerprint(_circuit(0.5))
+    assert cirq.CompilationCache.fingerprint(
+        _circuit(0.25)) != cirq.CompilationCache.fingerprint(_circuit(0.5))
+
+
+def test_compile_reuses_templates():
+    compiler = CountingCompiler()
+    cache = cirq.CompilationCache(compiler)
+    t, s = sympy.Symbol('t'), sympy.Symbol('s')
+
+    first = cache.compile(_circuit(t))
+    expected = _circuit(t)
+    cirq.ConvertToCzAndSingleGates().optimize_circuit(expected)
+    assert first == expected
+
+    second = cache.compile(_circuit(s), {'s': 0.25})
+    assert compiler.calls == 1
+    assert (cache.hits, cache.disk_hits, cache.misses) == (1, 0, 1)
+    assert not cirq.is_parameterized(second)
+    cirq.testing.assert_allclose_up_to_global_phase(
+        cirq.unitary(second),
+        cirq.unitary(cirq.resolve_parameters(_circuit(s), {'s': 0.25})),
+        atol=1e-8)
+
+    # Returned circuits can be mutated without affecting the cache.
+    first.append(cirq.X(cirq.LineQubit(0)))
+    assert cache.compile(_circuit(t)) == expected
+    assert compiler.calls == 1
+
+    cache.clear()
+    assert cache.compile(_circuit(t)) == expected
+    assert compiler.calls == 2
+
+
+def test_compile_returning_compiler():
+    a = cirq.LineQubit(0)
+    cache = cirq.CompilationCache(lambda c: cirq.Circuit(c, cirq.X(a)))
+    assert cache.compile(cirq.Circuit(cirq.Y(a))) == cirq.Circuit(
+        cirq.Y(a), cirq.X(a))
+    assert cache.compile(cirq.Circuit(cirq.Y(a))) == cirq.Circuit(
+        cirq.Y(a), cirq.X(a))
+    assert cache.hits == 1
+
+
+def test_memory_lru():
+    compiler = CountingCompiler()
+    cache = cirq.CompilationCache(compiler, maxsize=1)
+    cache.compile(_circuit(0.25))
+    cache.compile(_circuit(0.5))
+    cache.compile(_circuit(0.25))
+    assert compiler.calls == 3
+
+
+def test_disk_cache(tmp_path):
+    compiler = CountingCompiler()
+    t = sympy.Symbol('t')
+    expected = cirq.CompilationCache(compiler).compile(_circuit(t), {'t': 0.5})
+
+    cache = cirq.CompilationCache(compiler, directory=tmp_path)
+    assert cache.compile(_circuit(t), {'t': 0.5}) == expected
+    assert len(list(tmp_path.glob('*.compiled.json'))) == 1
+
+    other = cirq.CompilationCache(compiler, directory=tmp_path)
+    assert other.compile(_circuit(t), {'t': 0.5}) == expected
+    assert (other.hits, other.disk_hits, other.misses) == (0, 1, 0)
+    assert compiler.calls == 2
+
+    small = cirq.CompilationCache(compiler,
+                                  directory=tmp_path,
+                                  max_disk_entries=1)
+    small.compile(_circuit(0.25))
+    assert len(list(tmp_path.glob('*.compiled.json'))) == 1
+
+
+def test_disk_cache_only_evicts_its_own_files(tmp_path):
+    other_file = tmp_path / 'other.json'
+    other_file.write_text('{}')
+    cache = cirq.CompilationCache(CountingCompiler(),
+                                  directory=tmp_path,
+                                  max_disk_entries=1)
+    cache.compile(_circuit(0.25))
+    for f in tmp_path.iterdir():
+        os.utime(f, (0, 0))
+    cache.compile(_circuit(0.5))
+
+    assert other_file.read_text() == '{}'
+    assert sorted(f.name for f in tmp_path.iterdir()) == [
+        cirq.CompilationCache.fingerprint(_circuit(0.5)) + '.compiled.json',
+        'other.json',
+    ]
+
+
+def test_compile_for_sycamore():
+    cache = cirq.CompilationCache(lambda c: cirq.google.optimized_for_sycamore(
+        c, optimizer_type='sycamore'))
+    t = sympy.Symbol('t')
+    compiled = cache.compile(_circuit(t), {'t': 0.25})
+    assert not cirq.is_parameterized(compiled)
+    # Unparameterized gates keep their type when the template is resolved.
+    assert all(op.gate == cirq.google.SYC and
+               isinstance(op.gate, cirq.google.SycamoreGate)
+               for op in compiled.all_operations()
+               if len(op.qubits) == 2)
+
+    # Merging the resolved single-qubit gates recovers the size of a direct
+    # compilation of the resolved circuit.
+    resolved = cirq.resolve_parameters(_circuit(t), {'t': 0.25})
+    direct = cirq.google.optimized_for_sycamore(resolved,
+                                                optimizer_type='sycamore')
+    cirq.merge_single_qubit_gates_into_phxz(compiled)
+    assert len(list(compiled.all_operations())) == len(
+        list(direct.all_operations()))
+    cirq.testing.assert_allclose_up_to_global_phase(cirq.unitary(compiled),
+                                                    cirq.unitary(direct),
+                                                    atol=1e-6)
@@ -58,8 +58,10 @@ class ConvertToCzAndSingleGates(circuits.PointOptimizer):
         if isinstance(op.gate, ops.MeasurementGate):
             return True
 
-        # SingleQubit known matrix
-        if len(op.qubits) == 1 and protocols.has_unitary(op):
+        # SingleQubit known matrix, or one that is only known once its
+        # parameters are resolved
+        if len(op.qubits) == 1 and (protocols.has_unitary(op) or
+                                    protocols.is_parameterized(op)):
             return True
         return False
 
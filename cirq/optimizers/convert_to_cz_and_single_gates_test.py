@@ -15,6 +15,7 @@
 import pytest
 
 import numpy as np
+import sympy
 
 import cirq
 
@@ -173,3 +174,15 @@ def test_dont_allow_partial_czs():
     cirq.testing.assert_allclose_up_to_global_phase(circuit.unitary(),
                                                     c_orig.unitary(),
                                                     atol=1e-7)
+
+
+def test_keeps_parameterized_single_qubit_gates():
+    q0, q1 = cirq.LineQubit.range(2)
+    t = sympy.Symbol('t')
+    circuit = cirq.Circuit(cirq.X(q0)**t, cirq.CNOT(q0, q1), cirq.Z(q1)**t)
+    cirq.ConvertToCzAndSingleGates().optimize_circuit(circuit)
+    assert cirq.X(q0)**t in circuit.all_operations()
+    assert cirq.Z(q1)**t in circuit.all_operations()
+    assert all(
+        len(op.qubits) == 1 or op.gate == cirq.CZ
+        for op in circuit.all_operations())
@@ -20,6 +20,7 @@ from typing import Callable, List, Optional, Sequence, Tuple, cast, \
 import numpy as np
 
 from cirq import circuits, ops, protocols
+from cirq.circuits.optimization_pass import _no_clean_up
 from cirq.optimizers import two_qubit_decompositions
 
 if TYPE_CHECKING:
@@ -35,7 +36,7 @@ class MergeInteractions(circuits.PointOptimizer):
                  allow_partial_czs: bool = True,
                  post_clean_up: Callable[
                      [Sequence[ops.Operation]], ops.OP_TREE
-                 ] = lambda op_list: op_list) -> None:
+                 ] = _no_clean_up) -> None:
         super().__init__(post_clean_up=post_clean_up)
         self.tolerance = tolerance
         self.allow_partial_czs = allow_partial_czs
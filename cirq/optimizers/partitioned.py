@@ -0,0 +1,176 @@
+# Copyright 2020 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Runs circuit optimizers on independent pieces of work in parallel."""
+
+import concurrent.futures
+import functools
+from typing import (Callable, Dict, FrozenSet, Iterable, List, Optional,
+                    TYPE_CHECKING)
+
+from cirq import circuits, ops
+
+if TYPE_CHECKING:
+    import cirq
+
+
+def qubit_partitions(circuit: 'cirq.Circuit') -> List[FrozenSet['cirq.Qid']]:
+    """Splits the qubits of a circuit into groups that never interact.
+
+    Two qubits are in the same group when some chain of multi-qubit operations
+    connects them, so the groups are the connected components of the circuit's
+    qubit interaction graph.
+
+    Args:
+        circuit: The circuit whose qubits should be partitioned.
+
+    Returns:
+        The groups of qubits, ordered by their first qubit in
+        `ops.QubitOrder.DEFAULT` order.
+    """
+    parent: Dict['cirq.Qid', 'cirq.Qid'] = {}
+
+    def find(q: 'cirq.Qid') -> 'cirq.Qid':
+        root = q
+        while parent[root] != root:
+            root = parent[root]
+        while parent[q] != root:
+            parent[q], q = root, parent[q]
+        return root
+
+    for op in circuit.all_operations():
+        for q in op.qubits:
+            parent.setdefault(q, q)
+        roots = [find(q) for q in op.qubits]
+        for root in roots[1:]:
+            parent[root] = roots[0]
+
+    groups: Dict['cirq.Qid', List['cirq.Qid']] = {}
+    for q in ops.QubitOrder.DEFAULT.order_for(parent):
+        groups.setdefault(find(q), []).append(q)
+    return [frozenset(group) for group in groups.values()]
+
+
+def optimize_partitioned(circuit: 'cirq.Circuit',
+                         optimizer: Callable[['cirq.Circuit'], None],
+                         *,
+                         max_workers: Optional[int] = None,
+                         executor: Optional[concurrent.futures.Executor] = None
+                        ) -> 'cirq.Circuit':
+    """Optimizes groups of non-interacting qubits in parallel.
+
+    The circuit is split along `cirq.qubit_partitions`, keeping each moment at
+    the same index, and the optimizer is run on each piece separately. The
+    optimized pieces are then zipped back together moment by moment.
+
+    Only qubits that never interact are split apart, i.e. the pieces are the
+    connected components of the qubit interaction graph. A circuit in which a
+    chain of multi-qubit operations connects all qubits is a single piece, and
+    is optimized serially without any parallelism.
+
+    The result is the same as running the optimizer on the whole circuit, as
+    long as the optimizer only relates operations that share qubits (which is
+    true for the optimizers in `cirq.optimizers`) and leaves the moments where
+    they are, like `cirq.EjectZ` or `cirq.DropNegligible`. Inserting or
+    removing moments in one piece would change how the operations of the
+    other pieces are aligned in a serial run, so when the optimizer changes
+    the number of moments of any piece, the whole circuit is optimized
+    serially instead. To find out early, the smallest piece is optimized
+    first in this process, and the other pieces are only optimized in
+    parallel if it kept its moments. Optimizers that only change the moments
+    of some pieces are still slower this way than a serial run.
+
+    Args:
+        circuit: The circuit to optimize. This value is not mutated.
+        optimizer: A function that optimizes a circuit in place, e.g.
+            `cirq.EjectZ().optimize_circuit`. When using a process pool this
+            must be picklable, so lambdas can't be used.
+        max_workers: The number of worker processes to start when no
+            executor is given. Defaults to the number of processors. A value
+            of 1 optimizes the pieces one after the other in this process.
+        executor: An executor to run the optimizations with, e.g. a
+            shared `concurrent.futures.ProcessPoolExecutor`.
+
+    Returns:
+        The optimized circuit.
+    """
+    partitions = qubit_partitions(circuit)
+    if len(partitions) < 2 or any(
+            not op.qubits for op in circuit.all_operations()):
+        return _optimized_copy(optimizer, circuit)
+
+    pieces = [
+        circuits.Circuit((moment[qubits] for moment in circuit),
+                         device=circuit.device) for qubits in partitions
+    ]
+    smallest = min(range(len(pieces)),
+                   key=lambda i: len(list(pieces[i].all_operations())))
+    first = _optimized_copy(optimizer, pieces[smallest])
+    if len(first) != len(circuit):
+        return _optimized_copy(optimizer, circuit)
+    others = pieces[:smallest] + pieces[smallest + 1:]
+    optimized = _map(functools.partial(_optimized_copy, optimizer), others,
+                     max_workers, executor)
+
+    if any(len(piece) != len(circuit) for piece in optimized):
+        return _optimized_copy(optimizer, circuit)
+    optimized.insert(smallest, first)
+    return circuits.Circuit(
+        (ops.Moment(op for piece in optimized for op in piece[k])
+         for k in range(len(circuit))),
+        device=circuit.device)
+
+
+def optimize_batch(circuit_batch: Iterable['cirq.Circuit'],
+                   optimizer: Callable[['cirq.Circuit'], None],
+                   *,
+                   max_workers: Optional[int] = None,
+                   executor: Optional[concurrent.futures.Executor] = None
+                  ) -> List['cirq.Circuit']:
+    """Optimizes several circuits in parallel.
+
+    Args:
+        circuit_batch: The circuits to optimize. These are not mutated.
+        optimizer: A function that optimizes a circuit in place, e.g.
+            `cirq.EjectZ().optimize_circuit`. When using a process pool this
+            must be picklable, so lambdas can't be used.
+        max_workers: The number of worker processes to start when no
+            executor is given. Defaults to the number of processors. A value
+            of 1 optimizes the circuits one after the other in this process.
+        executor: An executor to run the optimizations with, e.g. a
+            shared `concurrent.futures.ProcessPoolExecutor`.
+
+    Returns:
+        The optimized circuits, in the same order as the given circuits.
+    """
+    return _map(functools.partial(_optimized_copy, optimizer),
+                list(circuit_batch), max_workers, executor)
+
+
+def _optimized_copy(optimizer: Callable[['cirq.Circuit'], None],
+                    circuit: 'cirq.Circuit') -> 'cirq.Circuit':
+    result = circuit.copy()
+    optimizer(result)
+    return result
+
+
+def _map(func: Callable[['cirq.Circuit'], 'cirq.Circuit'],
+         items: List['cirq.Circuit'], max_workers: Optional[int],
+         executor: Optional[concurrent.futures.Executor]
+        ) -> List['cirq.Circuit']:
+    if executor is not None:
+        return list(executor.map(func, items))
+    if max_workers == 1 or len(items) < 2:
+        return [func(item) for item in items]
+    with concurrent.futures.ProcessPoolExecutor(max_workers) as pool:
+        return list(pool.map(func, items))
@@ -0,0 +1,156 @@
+# Copyright 2020 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import concurrent.futures
+
+import pytest
+
+import cirq
+
+
+def test_qubit_partitions():
+    a, b, c, d, e = cirq.LineQubit.range(5)
+    assert cirq.qubit_partitions(cirq.Circuit()) == []
+    assert cirq.qubit_partitions(cirq.Circuit(cirq.X(a), cirq.Y(b))) == [
+        frozenset([a]), frozenset([b])
+    ]
+    circuit = cirq.Circuit(
+        cirq.CZ(a, c),
+        cirq.X(b),
+        cirq.CZ(d, e),
+        cirq.CCZ(b, d, e),
+    )
+    assert cirq.qubit_partitions(circuit) == [
+        frozenset([a, c]), frozenset([b, d, e])
+    ]
+
+
+def _two_region_circuit():
+    a, b, c, d = cirq.LineQubit.range(4)
+    return cirq.Circuit(
+        cirq.X(a)**0.5,
+        cirq.Y(a)**0.25,
+        cirq.CZ(a, b),
+        cirq.Z(a)**0.5,
+        cirq.Z(b),
+        cirq.H(c),
+        cirq.CZ(c, d)**0.5,
+        cirq.X(d),
+        cirq.X(d)**0.5,
+        cirq.Y(c),
+    )
+
+
+@pytest.mark.parametrize('optimizer', [
+    cirq.EjectZ().optimize_circuit,
+    cirq.EjectPhasedPaulis().optimize_circuit,
+    cirq.DropNegligible().optimize_circuit,
+    cirq.MergeSingleQubitGates().optimize_circuit,
+    cirq.MergeInteractions().optimize_circuit,
+    cirq.DropEmptyMoments().optimize_circuit,
+])
+def test_optimize_partitioned_matches_serial(optimizer):
+    circuit = _two_region_circuit()
+    original = circuit.copy()
+    serial = circuit.copy()
+    optimizer(serial)
+
+    result = cirq.optimize_partitioned(circuit, optimizer, max_workers=1)
+    assert circuit == original
+    assert result == serial
+    cirq.testing.assert_circuits_with_terminal_measurements_are_equivalent(
+        result, original, atol=1e-6)
+
+
+def test_optimize_partitioned_realigned_pieces():
+    a, b = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(
+        cirq.X(a),
+        cirq.X(b),
+        cirq.X(b),
+    )
+
+    def prepend_z_on_a(circuit):
+        if a in circuit.all_qubits():
+            circuit.insert(0, cirq.Moment([cirq.Z(a)]))
+
+    serial = circuit.copy()
+    prepend_z_on_a(serial)
+    assert cirq.optimize_partitioned(circuit, prepend_z_on_a,
+                                     max_workers=1) == serial
+
+
+def test_optimize_partitioned_gives_up_before_parallel_work():
+    a, b, c = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit(
+        cirq.X(a),
+        cirq.X(b),
+        cirq.CZ(b, c),
+        cirq.X(c),
+    )
+    optimized = []
+
+    def append_moment(circuit):
+        optimized.append(frozenset(circuit.all_qubits()))
+        circuit.append(cirq.Moment())
+
+    serial = circuit.copy()
+    serial.append(cirq.Moment())
+    assert cirq.optimize_partitioned(circuit, append_moment,
+                                     max_workers=1) == serial
+    # Only the smallest piece was optimized before the whole circuit.
+    assert optimized == [frozenset([a]), frozenset([a, b, c])]
+
+
+def test_optimize_partitioned_with_executor():
+    circuit = _two_region_circuit()
+    optimizer = cirq.MergeSingleQubitGates().optimize_circuit
+    expected = cirq.optimize_partitioned(circuit, optimizer, max_workers=1)
+    with concurrent.futures.ThreadPoolExecutor(2) as executor:
+        assert cirq.optimize_partitioned(circuit, optimizer,
+                                         executor=executor) == expected
+
+
+def test_optimize_partitioned_single_partition():
+    a, b = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(cirq.Z(a), cirq.CZ(a, b), cirq.Z(a))
+    optimizer = cirq.EjectZ().optimize_circuit
+    expected = circuit.copy()
+    optimizer(expected)
+    assert cirq.optimize_partitioned(circuit, optimizer) == expected
+
+    # Operations without qubits prevent partitioning.
+    circuit = cirq.Circuit(cirq.Z(a), cirq.X(b), cirq.GlobalPhaseOperation(-1))
+    assert cirq.optimize_partitioned(circuit, lambda c: None) == circuit
+
+
+def test_optimize_batch():
+    a, b = cirq.LineQubit.range(2)
+    batch = [
+        cirq.Circuit(cirq.X(a), cirq.Y(a)),
+        cirq.Circuit(cirq.H(a), cirq.CZ(a, b), cirq.H(b)),
+        cirq.Circuit(),
+    ]
+    optimizer = cirq.MergeSingleQubitGates().optimize_circuit
+    expected = []
+    for circuit in batch:
+        circuit = circuit.copy()
+        optimizer(circuit)
+        expected.append(circuit)
+
+    assert cirq.optimize_batch(batch, optimizer, max_workers=1) == expected
+    with concurrent.futures.ThreadPoolExecutor(2) as executor:
+        assert cirq.optimize_batch(iter(batch), optimizer,
+                                   executor=executor) == expected
+    assert cirq.optimize_batch(batch, optimizer, max_workers=2) == expected
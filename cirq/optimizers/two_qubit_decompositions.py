@@ -14,7 +14,10 @@
 
 """Utility methods related to optimizing quantum circuits."""
 
-from typing import Iterable, List, Tuple, Optional, cast, TYPE_CHECKING
+import collections
+import threading
+from typing import (Hashable, Iterable, List, NamedTuple, Tuple, Optional, cast,
+                    TYPE_CHECKING)
 
 import numpy as np
 
@@ -53,14 +56,233 @@ def two_qubit_matrix_to_operations(
     Returns:
         A list of operations implementing the matrix.
     """
+    key = _SYNTHESIS_CACHE.key(mat, allow_partial_czs, atol, clean_operations)
+    cached = _SYNTHESIS_CACHE.get(key)
+    if cached is not None:
+        return _operations_on(cached, _TEMPLATE_QUBITS, (q0, q1))
+
     kak = linalg.kak_decomposition(mat, atol=atol)
-    operations = _kak_decomposition_to_operations(
-        q0, q1, kak, allow_partial_czs, atol=atol)
+    template = _SYNTHESIS_CACHE.template(kak.interaction_coefficients,
+                                         allow_partial_czs, atol,
+                                         clean_operations)
     if clean_operations:
-        return _cleanup_operations(operations)
+        operations = _dress_clean_template(q0, q1, kak, template)
+    else:
+        b0, b1 = kak.single_qubit_operations_before
+        a0, a1 = kak.single_qubit_operations_after
+        operations = list(
+            cast(
+                Iterable[ops.Operation],
+                ops.flatten_op_tree([
+                    _do_single_on(b0, q0, atol=atol),
+                    _do_single_on(b1, q1, atol=atol),
+                    _operations_on(template.core, _TEMPLATE_QUBITS, (q0, q1)),
+                    _do_single_on(a0, q0, atol=atol),
+                    _do_single_on(a1, q1, atol=atol),
+                ])))
+    _SYNTHESIS_CACHE.put(key,
+                         _operations_on(operations, (q0, q1), _TEMPLATE_QUBITS))
     return operations
 
 
+# Placeholder qubits that cached operations are stored on.
+_TEMPLATE_QUBITS = (ops.NamedQubit('_template_q0'),
+                    ops.NamedQubit('_template_q1'))
+
+
+class _SynthesisTemplate(NamedTuple):
+    """The synthesized non-local part of a class of two-qubit operations.
+
+    Attributes:
+        before: The matrices of the single-qubit operations that the cleaned
+            up synthesis starts with on each qubit.
+        core: The operations from the first to the last two-qubit operation,
+            on `_TEMPLATE_QUBITS`.
+        after: The matrices of the single-qubit operations that the cleaned
+            up synthesis ends with on each qubit.
+    """
+    before: Tuple[np.ndarray, np.ndarray]
+    core: Tuple[ops.Operation, ...]
+    after: Tuple[np.ndarray, np.ndarray]
+
+
+class _SynthesisCache:
+    """A least recently used cache of synthesized operations.
+
+    Two-qubit operations that are equal up to single-qubit operations share
+    their canonical KAK interaction coefficients, and so the non-local part
+    of their synthesis. That part (cleaned up, if requested) is kept as a
+    template on placeholder qubits, keyed by the coefficients rounded to a
+    thousandth of `atol`. Each synthesis then only has to merge its own
+    single-qubit operations into the template and eject the phased Paulis
+    and Z rotations through it again.
+
+    The same matrix is also often synthesized many times, e.g. for every
+    CNOT of a circuit converted to CZ gates. So the final operations are kept
+    too, keyed by the exact entries of the matrix, and a repeated matrix only
+    needs its operations moved onto the requested qubits.
+    """
+
+    def __init__(self, maxsize: Optional[int]) -> None:
+        self.maxsize = maxsize
+        self._operations: ('collections.OrderedDict[Hashable, '
+                           'Tuple[ops.Operation, ...]]') = (
+                               collections.OrderedDict())
+        self._templates: ('collections.OrderedDict[Hashable, '
+                          '_SynthesisTemplate]') = collections.OrderedDict()
+        # Simulations can run on several threads at once.
+        self._lock = threading.Lock()
+
+    def key(self, mat: np.ndarray, allow_partial_czs: bool, atol: float,
+            clean_operations: bool) -> Optional[Hashable]:
+        # Callers may also pass anything accepted by `cirq.kak_decomposition`,
+        # such as an operation, whose final operations aren't cached.
+        if self.maxsize == 0 or not isinstance(mat, np.ndarray):
+            return None
+        mat = np.asarray(mat, dtype=np.complex128)
+        return (mat.shape, mat.tobytes(), allow_partial_czs, atol,
+                clean_operations)
+
+    def get(self,
+            key: Optional[Hashable]) -> Optional[Tuple[ops.Operation, ...]]:
+        if key is None:
+            return None
+        with self._lock:
+            operations = self._operations.get(key)
+            if operations is not None:
+                self._operations.move_to_end(key)
+            return operations
+
+    def put(self, key: Optional[Hashable],
+            operations: Iterable[ops.Operation]) -> None:
+        if key is None:
+            return
+        with self._lock:
+            self._operations[key] = tuple(operations)
+            self._trim(self._operations)
+
+    def template(self, interaction_coefficients: Tuple[float, float, float],
+                 allow_partial_czs: bool, atol: float,
+                 clean_operations: bool) -> _SynthesisTemplate:
+        steps = tuple(
+            int(np.round(c * 1000 / atol)) for c in interaction_coefficients)
+        key = (steps, allow_partial_czs, atol, clean_operations)
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self._templates.move_to_end(key)
+                return template
+
+        operations = list(
+            cast(
+                Iterable[ops.Operation],
+                ops.flatten_op_tree(
+                    _non_local_part(*_TEMPLATE_QUBITS,
+                                    interaction_coefficients,
+                                    allow_partial_czs,
+                                    atol=atol))))
+        if clean_operations:
+            template = _split_template(_cleanup_operations(operations))
+        else:
+            identity = np.eye(2, dtype=np.complex128)
+            template = _SynthesisTemplate(before=(identity, identity),
+                                          core=tuple(operations),
+                                          after=(identity, identity))
+        if self.maxsize != 0:
+            with self._lock:
+                self._templates[key] = template
+                self._trim(self._templates)
+        return template
+
+    def _trim(self, entries: 'collections.OrderedDict') -> None:
+        if self.maxsize is not None:
+            while len(entries) > self.maxsize:
+                entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._operations.clear()
+            self._templates.clear()
+
+
+_SYNTHESIS_CACHE = _SynthesisCache(maxsize=256)
+
+
+def _operations_on(operations: Iterable[ops.Operation],
+                   old_qubits: Tuple['cirq.Qid', 'cirq.Qid'],
+                   new_qubits: Tuple['cirq.Qid', 'cirq.Qid']
+                  ) -> List[ops.Operation]:
+    qubit_map = dict(zip(old_qubits, new_qubits))
+    return [
+        op.with_qubits(*(qubit_map[q] for q in op.qubits)) for op in operations
+    ]
+
+
+def _split_template(operations: List[ops.Operation]) -> _SynthesisTemplate:
+    """Separates the leading and trailing single-qubit operations."""
+    two_qubit_indices = [
+        i for i, op in enumerate(operations) if len(op.qubits) == 2
+    ]
+    if two_qubit_indices:
+        start, end = two_qubit_indices[0], two_qubit_indices[-1] + 1
+    else:
+        start, end = len(operations), len(operations)
+
+    def product(ops_on_qubits: List[ops.Operation], q: 'cirq.Qid'):
+        result = np.eye(2, dtype=np.complex128)
+        for op in ops_on_qubits:
+            if op.qubits == (q,):
+                result = protocols.unitary(op).dot(result)
+        return result
+
+    before = operations[:start]
+    after = operations[end:]
+    q0, q1 = _TEMPLATE_QUBITS
+    return _SynthesisTemplate(before=(product(before, q0), product(before, q1)),
+                              core=tuple(operations[start:end]),
+                              after=(product(after, q0), product(after, q1)))
+
+
+def _dress_clean_template(q0: 'cirq.Qid', q1: 'cirq.Qid',
+                          kak: linalg.KakDecomposition,
+                          template: _SynthesisTemplate) -> List[ops.Operation]:
+    """Surrounds a cleaned up template with a decomposition's local parts.
+
+    The single-qubit operations of the decomposition are merged with those of
+    the template, and the phased Paulis and Z rotations are ejected through
+    the template again, which gives the same operations as cleaning up the
+    whole synthesis.
+    """
+    qubits = (q0, q1)
+    before = [
+        template.before[i].dot(kak.single_qubit_operations_before[i])
+        for i in range(2)
+    ]
+    after = [
+        kak.single_qubit_operations_after[i].dot(template.after[i])
+        for i in range(2)
+    ]
+
+    def synth(matrices: List[np.ndarray]) -> List[ops.Operation]:
+        return [
+            gate(q)
+            for q, matrix in zip(qubits, matrices)
+            for gate in decompositions.single_qubit_matrix_to_phased_x_z(matrix)
+        ]
+
+    if not template.core:
+        return synth([after[i].dot(before[i]) for i in range(2)])
+
+    circuit = circuits.Circuit(
+        synth(before), _operations_on(template.core, _TEMPLATE_QUBITS, qubits),
+        synth(after))
+    eject_phased_paulis.EjectPhasedPaulis().optimize_circuit(circuit)
+    eject_z.EjectZ().optimize_circuit(circuit)
+    circuit = circuits.Circuit(circuit.all_operations(),
+                               strategy=circuits.InsertStrategy.EARLIEST)
+    return list(circuit.all_operations())
+
+
 def _xx_interaction_via_full_czs(q0: 'cirq.Qid', q1: 'cirq.Qid', x: float):
     a = x * -2 / np.pi
     yield ops.H(q1)
@@ -117,28 +339,6 @@ def _cleanup_operations(operations: List[ops.Operation]):
     return list(circuit.all_operations())
 
 
-def _kak_decomposition_to_operations(q0: 'cirq.Qid',
-                                     q1: 'cirq.Qid',
-                                     kak: linalg.KakDecomposition,
-                                     allow_partial_czs: bool,
-                                     atol: float = 1e-8) -> List[ops.Operation]:
-    """Assumes that the decomposition is canonical."""
-    b0, b1 = kak.single_qubit_operations_before
-    pre = [_do_single_on(b0, q0, atol=atol), _do_single_on(b1, q1, atol=atol)]
-    a0, a1 = kak.single_qubit_operations_after
-    post = [_do_single_on(a0, q0, atol=atol), _do_single_on(a1, q1, atol=atol)]
-
-    return list(cast(Iterable[ops.Operation], ops.flatten_op_tree([
-        pre,
-        _non_local_part(q0,
-                        q1,
-                        kak.interaction_coefficients,
-                        allow_partial_czs,
-                        atol=atol),
-        post,
-    ])))
-
-
 def _is_trivial_angle(rad: float, atol: float) -> bool:
     """Tests if a circuit for an operator exp(i*rad*XX) (or YY, or ZZ) can
     be performed with a whole CZ.
@@ -20,6 +20,7 @@ import pytest
 
 import cirq
 from cirq import value
+from cirq.optimizers import two_qubit_decompositions
 from cirq.optimizers.two_qubit_decompositions import (
     _parity_interaction, _is_trivial_angle
 )
@@ -262,3 +263,80 @@ def test_kak_decomposition_depth_partial_cz():
     c = cirq.Circuit(operations_with_part)
     # 1 CP, 1+1 PhasedX, 1 Z
     assert len(c) <= 4
+
+
+@pytest.mark.parametrize('allow_partial_czs,clean_operations',
+                         [(True, True), (False, True), (False, False)])
+def test_repeated_matrices_give_the_same_operations(allow_partial_czs,
+                                                    clean_operations):
+    a, b, c = cirq.LineQubit.range(3)
+    for u in [
+            cirq.unitary(cirq.CNOT),
+            cirq.unitary(cirq.ISWAP**0.5),
+            cirq.testing.random_unitary(4),
+    ]:
+        first = cirq.two_qubit_matrix_to_operations(
+            a, b, u, allow_partial_czs, clean_operations=clean_operations)
+        assert_ops_implement_unitary(a, b, first, u)
+        for q0, q1 in [(a, b), (c, a)]:
+            again = cirq.two_qubit_matrix_to_operations(
+                q0,
+                q1,
+                u.copy(),
+                allow_partial_czs,
+                clean_operations=clean_operations)
+            qubit_map = {a: q0, b: q1}
+            assert again == [
+                op.transform_qubits(qubit_map.__getitem__) for op in first
+            ]
+
+
+@pytest.mark.parametrize('allow_partial_czs,clean_operations',
+                         [(True, True), (False, True), (False, False)])
+def test_locally_equivalent_matrices_share_their_non_local_part(
+        allow_partial_czs, clean_operations):
+    a, b = cirq.LineQubit.range(2)
+    cache = two_qubit_decompositions._SYNTHESIS_CACHE
+    for u in [
+            cirq.unitary(cirq.CNOT),
+            cirq.unitary(cirq.ISWAP**0.5),
+            cirq.testing.random_unitary(4),
+    ]:
+        local_before = np.kron(cirq.testing.random_unitary(2),
+                               cirq.testing.random_unitary(2))
+        local_after = np.kron(cirq.testing.random_unitary(2),
+                              cirq.testing.random_unitary(2))
+        v = local_after @ u @ local_before
+        cache.clear()
+        fresh = cirq.two_qubit_matrix_to_operations(
+            a, b, v, allow_partial_czs, clean_operations=clean_operations)
+
+        cache.clear()
+        cirq.two_qubit_matrix_to_operations(a,
+                                            b,
+                                            u,
+                                            allow_partial_czs,
+                                            clean_operations=clean_operations)
+        operations = cirq.two_qubit_matrix_to_operations(
+            a, b, v, allow_partial_czs, clean_operations=clean_operations)
+        assert len(cache._templates) == 1
+        assert_ops_implement_unitary(a, b, operations, v)
+        assert len(operations) == len(fresh)
+        assert len(cirq.Circuit(operations)) == len(cirq.Circuit(fresh))
+
+
+@pytest.mark.parametrize('gate,max_ops', [
+    (cirq.CZ, 1),
+    (cirq.CNOT, 3),
+    (cirq.CZ**0.5, 1),
+])
+def test_repeated_gates_keep_their_gate_counts(gate, max_ops):
+    a, b = cirq.LineQubit.range(2)
+    u = cirq.unitary(gate)
+    for _ in range(2):
+        operations = cirq.two_qubit_matrix_to_operations(a,
+                                                         b,
+                                                         u,
+                                                         allow_partial_czs=True)
+        assert_ops_implement_unitary(a, b, operations, u)
+        assert len(operations) <= max_ops
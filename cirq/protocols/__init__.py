@@ -19,6 +19,7 @@ from cirq.protocols.act_on_protocol import (
 )
 from cirq.protocols.apply_unitary_protocol import (
     apply_unitaries,
+    apply_unitaries_batch,
     apply_unitary,
     ApplyUnitaryArgs,
     SupportsConsistentApplyUnitary,
@@ -55,8 +56,12 @@ from cirq.protocols.circuit_diagram_info_protocol import (
 )
 from cirq.protocols.decompose_protocol import (
     decompose,
+    decompose_cache_clear,
+    decompose_cache_info,
     decompose_once,
     decompose_once_with_qubits,
+    DecomposeCacheInfo,
+    set_decompose_cache_size,
     SupportsDecompose,
     SupportsDecomposeWithQubits,
 )
@@ -76,9 +81,13 @@ from cirq.protocols.json_serialization import (
     DEFAULT_RESOLVERS,
     json_serializable_dataclass,
     to_json,
+    to_json_iter,
+    read_binary,
     read_json,
+    read_json_iter,
     obj_to_dict_helper,
     SupportsJSON,
+    write_binary,
 )
 from cirq.protocols.measurement_key_protocol import (
     is_measurement,
@@ -131,6 +140,10 @@ from cirq.protocols.qid_shape_protocol import (
     SupportsExplicitNumQubits,
 )
 from cirq.protocols.unitary_protocol import (
+    set_unitary_cache_size,
     SupportsUnitary,
     unitary,
+    unitary_cache_clear,
+    unitary_cache_info,
+    UnitaryCacheInfo,
 )
@@ -26,10 +26,12 @@ from typing import (
 )
 
 import numpy as np
+import sympy
 from typing_extensions import Protocol
 
 from cirq import linalg, qis
-from cirq.protocols import qid_shape_protocol
+from cirq.protocols import (dispatch_cache, qid_shape_protocol,
+                            resolve_parameters)
 from cirq.protocols.decompose_protocol import (
     _try_decompose_into_operations_and_qubits,)
 from cirq.type_workarounds import NotImplementedType
@@ -58,6 +60,10 @@ class ApplyUnitaryArgs:
     the receiving object is attempting to be simple instead of fast, it can
     create an entirely new array and return that.
 
+    The target tensor may have axes that aren't in `axes`, e.g. a leading
+    batch axis holding many states at once (see `cirq.apply_unitaries_batch`).
+    The unitary effect must be broadcast over those axes.
+
     Attributes:
         target_tensor: The input tensor that needs to be left-multiplied by
             the unitary effect of the receiving object. The tensor will
@@ -333,23 +339,15 @@ def apply_unitary(
     """
 
     # Decide on order to attempt application strategies.
-    if len(args.axes) <= 4:
-        strats = [
-            _strat_apply_unitary_from_apply_unitary,
-            _strat_apply_unitary_from_unitary,
-            _strat_apply_unitary_from_decompose
-        ]
-    else:
-        strats = [
-            _strat_apply_unitary_from_apply_unitary,
-            _strat_apply_unitary_from_decompose,
-            _strat_apply_unitary_from_unitary
-        ]
     if not allow_decompose:
-        strats.remove(_strat_apply_unitary_from_decompose)
+        strats = _STRATS_WITHOUT_DECOMPOSE
+    elif len(args.axes) <= 4:
+        strats = _SMALL_STRATS
+    else:
+        strats = _LARGE_STRATS
 
     # Try each strategy, stopping if one works.
-    for strat in strats:
+    for strat in strats.for_value(unitary_value):
         result = strat(unitary_value, args)
         if result is None:
             break
@@ -437,6 +435,22 @@ def _strat_apply_unitary_from_decompose(val: Any, args: ApplyUnitaryArgs
     return apply_unitaries(operations, qubits, args, None)
 
 
+_SMALL_STRATS = dispatch_cache.StrategyTable(
+    ('_apply_unitary_', _strat_apply_unitary_from_apply_unitary),
+    ('_unitary_', _strat_apply_unitary_from_unitary),
+    ('_decompose_', _strat_apply_unitary_from_decompose),
+)
+_LARGE_STRATS = dispatch_cache.StrategyTable(
+    ('_apply_unitary_', _strat_apply_unitary_from_apply_unitary),
+    ('_decompose_', _strat_apply_unitary_from_decompose),
+    ('_unitary_', _strat_apply_unitary_from_unitary),
+)
+_STRATS_WITHOUT_DECOMPOSE = dispatch_cache.StrategyTable(
+    ('_apply_unitary_', _strat_apply_unitary_from_apply_unitary),
+    ('_unitary_', _strat_apply_unitary_from_unitary),
+)
+
+
 def apply_unitaries(unitary_values: Iterable[Any],
                     qubits: Sequence['cirq.Qid'],
                     args: Optional[ApplyUnitaryArgs] = None,
@@ -519,6 +533,177 @@ def apply_unitaries(unitary_values: Iterable[Any],
     return state
 
 
+def apply_unitaries_batch(
+        unitary_values: Iterable[Any],
+        qubits: Sequence['cirq.Qid'],
+        param_resolvers: Sequence['cirq.ParamResolverOrSimilarType'],
+        args: Optional[ApplyUnitaryArgs] = None,
+        default: Any = RaiseTypeErrorIfNotProvided) -> Optional[np.ndarray]:
+    """Apply a series of unitaries onto a batch of state tensors.
+
+    The target tensor has a leading batch axis with one entry for each of the
+    given parameter resolvers, and each entry ends up with the effect of the
+    unitary values resolved by its resolver. Values without parameters are
+    applied with `cirq.apply_unitary` to all entries at once, since their
+    effect broadcasts over axes that aren't targeted. Parameterized values get
+    a stack of matrices with one matrix per entry, which is applied in a
+    single numpy operation. For gates like `cirq.X**t` and `cirq.CZ**t`, whose
+    only parameter is their exponent, the stack is computed in one go from
+    their eigencomponents.
+
+    This makes it possible to simulate a whole parameter sweep at once, e.g.
+    to estimate gradients.
+
+    Args:
+        unitary_values: The values with unitary effects to apply to the target,
+            possibly parameterized.
+        qubits: The qubits that will be targeted by the unitary values. These
+            qubits match up, index by index, with the `indices` property of the
+            `args` argument.
+        param_resolvers: The resolvers to resolve the values with, one for
+            each entry along the batch axis.
+        args: A mutable `cirq.ApplyUnitaryArgs` object describing the target
+            tensor, available workspace, and axes to operate on. Axis 0 of the
+            target tensor is the batch axis, so it must have size
+            `len(param_resolvers)` and must not be in `args.axes`. The
+            attributes of this object will be mutated as part of computing the
+            result. If not specified, this defaults to the zero state of the
+            given qubits for every entry, with an axis ordering matching the
+            given qubit ordering after the batch axis.
+        default: What should be returned if any of the resolved unitary values
+            don't have a unitary effect. If not specified, a TypeError is
+            raised instead of returning a default value.
+
+    Returns:
+        The `np.ndarray` storing the final result, which has the same aliasing
+        caveats as for `cirq.apply_unitaries`, or the specified default value
+        if any of the resolved unitary values don't have a unitary effect.
+
+    Raises:
+        TypeError: An item from `unitary_values` doesn't have a unitary effect
+            and `default` wasn't specified.
+    """
+    from cirq import study
+
+    resolvers = [study.ParamResolver(r) for r in param_resolvers]
+    if args is None:
+        qid_shape = qid_shape_protocol.qid_shape(qubits)
+        state = np.zeros((len(resolvers),) + qid_shape, dtype=np.complex128)
+        state[(slice(None),) + (0,) * len(qid_shape)] = 1
+        args = ApplyUnitaryArgs(state, np.empty_like(state),
+                                range(1, 1 + len(qid_shape)))
+    if len(qubits) != len(args.axes):
+        raise ValueError('len(qubits) != len(args.axes)')
+    if args.target_tensor.shape[:1] != (len(resolvers),) or 0 in args.axes:
+        raise ValueError('Axis 0 of the target tensor must be a batch axis '
+                         'with one entry per parameter resolver.')
+    qubit_map = {
+        q.with_dimension(1): args.axes[i] for i, q in enumerate(qubits)
+    }
+    state = args.target_tensor
+    buffer = args.available_buffer
+
+    for op in unitary_values:
+        indices = [qubit_map[q.with_dimension(1)] for q in op.qubits]
+        op_args = ApplyUnitaryArgs(state, buffer, indices)
+        if resolve_parameters.is_parameterized(op):
+            result = _apply_unitary_stack(op, resolvers, op_args)
+        else:
+            result = apply_unitary(unitary_value=op,
+                                   args=op_args,
+                                   default=None)
+
+        # Handle failure.
+        if result is None:
+            if default is RaiseTypeErrorIfNotProvided:
+                raise TypeError(
+                    "cirq.apply_unitaries_batch failed. "
+                    "There was a value without a unitary effect in the "
+                    "`unitary_values` list.\n"
+                    "\n"
+                    "non-unitary value type: {}\n"
+                    "non-unitary value: {!r}".format(type(op), op))
+            return default
+
+        # Handle aliasing of results.
+        if result is buffer:
+            buffer = state
+        state = result
+
+    return state
+
+
+def _apply_unitary_stack(val: Any, resolvers: Sequence['cirq.ParamResolver'],
+                         args: ApplyUnitaryArgs) -> Optional[np.ndarray]:
+    """Applies a differently resolved matrix of `val` to each batch entry."""
+    stack = _unitary_stack(val, resolvers)
+    if stack is None:
+        return None
+    val_qid_shape = qid_shape_protocol.qid_shape(val)
+    sub_args = args._for_operation_with_qid_shape(range(len(val_qid_shape)),
+                                                  val_qid_shape)
+    stack = stack.astype(sub_args.target_tensor.dtype)
+    if len(val_qid_shape) == 1 and val_qid_shape[0] <= 2:
+        subspaces = [(..., level) for level in range(val_qid_shape[0])]
+        sub_result = linalg.apply_matrix_to_slices(
+            sub_args.target_tensor,
+            stack,
+            subspaces,
+            out=sub_args.available_buffer)
+    else:
+        sub_result = linalg.targeted_left_multiply(
+            stack.reshape((len(resolvers),) + val_qid_shape * 2),
+            sub_args.target_tensor,
+            sub_args.axes,
+            out=sub_args.available_buffer)
+    return _incorporate_result_into_target(args, sub_args, sub_result)
+
+
+def _unitary_stack(val: Any, resolvers: Sequence['cirq.ParamResolver']
+                  ) -> Optional[np.ndarray]:
+    """Returns the matrices of `val` resolved by each resolver, or None."""
+    from cirq import ops, protocols
+
+    gate = getattr(val, 'gate', val)
+    if (isinstance(gate, ops.EigenGate) and
+            not resolve_parameters.is_parameterized(gate._with_exponent(0))):
+        exponents = _values_of(gate.exponent, resolvers)
+        if exponents is None:
+            return None
+        exponents = exponents.reshape(-1, 1, 1)
+        return np.sum([
+            component * np.exp(1j * np.pi * exponents *
+                               (half_turns + gate.global_shift))
+            for half_turns, component in gate._eigen_components()
+        ],
+                      axis=0)
+
+    matrices = [
+        protocols.unitary(resolve_parameters.resolve_parameters(val, r), None)
+        for r in resolvers
+    ]
+    if any(m is None for m in matrices):
+        return None
+    return np.array(matrices)
+
+
+def _values_of(value: sympy.Basic, resolvers: Sequence['cirq.ParamResolver']
+              ) -> Optional[np.ndarray]:
+    """Evaluates a parameter with each resolver, or returns None."""
+    # Look up the symbols instead of substituting into the expression, which
+    # is much slower than evaluating it once on arrays of values.
+    symbols = sorted(value.free_symbols, key=str)
+    values = [[r.value_of(symbol) for r in resolvers] for symbol in symbols]
+    if any(
+            resolve_parameters.is_parameterized(v)
+            for row in values
+            for v in row):
+        return None
+    func = sympy.lambdify(symbols, value, 'numpy')
+    result = func(*np.array(values, dtype=float))
+    return np.broadcast_to(np.asarray(result, dtype=float), (len(resolvers),))
+
+
 def _incorporate_result_into_target(args: 'ApplyUnitaryArgs',
                                     sub_args: 'ApplyUnitaryArgs',
                                     sub_result: np.ndarray):
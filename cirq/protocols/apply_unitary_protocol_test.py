@@ -14,6 +14,7 @@
 
 import numpy as np
 import pytest
+import sympy
 
 import cirq
 from cirq.protocols.apply_unitary_protocol import (
@@ -486,3 +487,98 @@ def test_apply_unitary_args_with_axes_transposed_to_start():
     assert args.target_tensor[1, 2, 3, 4] == 1
     new_args.available_buffer[2, 4, 1, 3] = 2
     assert args.available_buffer[1, 2, 3, 4] == 2
+
+
+@pytest.mark.parametrize('gate', [
+    cirq.X**0.3,
+    cirq.Y**-0.7,
+    cirq.Z**0.2,
+    cirq.H,
+    cirq.S,
+    cirq.T,
+    cirq.CZ**0.5,
+    cirq.CNOT,
+    cirq.SWAP**0.25,
+    cirq.ISWAP**0.5,
+    cirq.CCX,
+    cirq.PhasedXPowGate(phase_exponent=0.25, exponent=0.5),
+    cirq.FSimGate(0.3, 0.2),
+    cirq.MatrixGate(cirq.testing.random_unitary(4)),
+])
+def test_apply_unitary_broadcasts_over_batch_axis(gate):
+    n = cirq.num_qubits(gate)
+    states = np.array([
+        cirq.testing.random_superposition(2**n).reshape((2,) * n)
+        for _ in range(3)
+    ])
+    expected = np.array([
+        cirq.unitary(gate).dot(state.reshape(2**n)).reshape((2,) * n)
+        for state in states
+    ])
+    args = cirq.ApplyUnitaryArgs(states, np.empty_like(states),
+                                 range(1, n + 1))
+    np.testing.assert_allclose(cirq.apply_unitary(gate, args), expected)
+
+
+def test_apply_unitaries_batch():
+    a, b = cirq.LineQubit.range(2)
+    t, s = sympy.Symbol('t'), sympy.Symbol('s')
+    circuit = cirq.Circuit(
+        cirq.H(a),
+        cirq.X(b)**t,
+        cirq.CZ(a, b)**s,
+        cirq.PhasedXPowGate(phase_exponent=s, exponent=0.5).on(b),
+        cirq.FSimGate(theta=t, phi=0.3).on(a, b),
+    )
+    resolvers = [{'t': 0.1 * i, 's': 1 - 0.3 * i} for i in range(4)]
+    result = cirq.apply_unitaries_batch(circuit.all_operations(), [a, b],
+                                        resolvers)
+    assert result.shape == (4, 2, 2)
+    for state, resolver in zip(result, resolvers):
+        np.testing.assert_allclose(
+            state.reshape(4),
+            cirq.final_state_vector(cirq.resolve_parameters(circuit, resolver),
+                                    dtype=np.complex128),
+            atol=1e-8)
+
+    # Batches of initial states.
+    states = np.array([
+        cirq.testing.random_superposition(4).reshape((2, 2))
+        for _ in resolvers
+    ])
+    args = cirq.ApplyUnitaryArgs(states.copy(), np.empty_like(states),
+                                 [1, 2])
+    result = cirq.apply_unitaries_batch(circuit.all_operations(), [a, b],
+                                        resolvers, args)
+    for state, initial, resolver in zip(result, states, resolvers):
+        np.testing.assert_allclose(
+            state.reshape(4),
+            cirq.unitary(cirq.resolve_parameters(circuit, resolver)).dot(
+                initial.reshape(4)),
+            atol=1e-8)
+
+
+def test_apply_unitaries_batch_failure():
+    a, b = cirq.LineQubit.range(2)
+    t = sympy.Symbol('t')
+    with pytest.raises(TypeError, match='non-unitary'):
+        cirq.apply_unitaries_batch([cirq.X(a)**t, cirq.measure(b)], [a, b],
+                                   [{'t': 0.5}])
+    assert cirq.apply_unitaries_batch(
+        [cirq.Z(a)**t], [a], [{'t': 0.5}, {}], default='unresolved') == (
+            'unresolved')
+    assert cirq.apply_unitaries_batch([cirq.Y(a)**(t * sympy.Symbol('u'))],
+                                      [a], [{
+                                          't': 0.5
+                                      }],
+                                      default=None) is None
+    assert cirq.apply_unitaries_batch([cirq.FSimGate(t, 0).on(a, b)], [a, b],
+                                      [{}],
+                                      default=None) is None
+
+    with pytest.raises(ValueError, match='len'):
+        cirq.apply_unitaries_batch([], [a, b], [{}],
+                                   cirq.ApplyUnitaryArgs.default(1))
+    with pytest.raises(ValueError, match='batch axis'):
+        cirq.apply_unitaries_batch([], [a], [{}, {}],
+                                   cirq.ApplyUnitaryArgs.default(1))
@@ -16,9 +16,12 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Deque,
     Dict,
+    Hashable,
     Iterable,
     List,
+    NamedTuple,
     Optional,
     overload,
     Sequence,
@@ -26,7 +29,9 @@ from typing import (
     TypeVar,
     Union,
 )
+import collections
 from collections import defaultdict
+import threading
 from typing_extensions import Protocol
 
 from cirq import devices, ops
@@ -213,9 +218,9 @@ def decompose(
         return decomposer(val)
 
     output = []
-    queue: List[Any] = [val]
+    queue: Deque[Any] = collections.deque([val])
     while queue:
-        item = queue.pop(0)
+        item = queue.popleft()
         if isinstance(item, ops.Operation) and keep is not None and keep(item):
             output.append(item)
             continue
@@ -229,11 +234,11 @@ def decompose(
             decomposed = try_op_decomposer(item, fallback_decomposer)
 
         if decomposed is not NotImplemented and decomposed is not None:
-            queue[:0] = ops.flatten_to_ops(decomposed)
+            queue.extendleft(reversed(list(ops.flatten_to_ops(decomposed))))
             continue
 
         if not isinstance(item, ops.Operation) and isinstance(item, Iterable):
-            queue[:0] = ops.flatten_to_ops(item)
+            queue.extendleft(reversed(list(ops.flatten_to_ops(item))))
             continue
 
         if keep is not None and on_stuck_raise is not None:
@@ -342,6 +347,14 @@ def decompose_once_with_qubits(val: Any,
             `_decompose_` method or that method returns `NotImplemented` or
             `None`. If not specified, undecomposable values cause a `TypeError`.
 
+    Gates whose class sets `_qubit_independent_decomposition_ = True` next to
+    its `_decompose_` method are decomposed once per distinct gate. Later
+    decompositions of a gate with the same attributes reuse the earlier
+    result, with its qubits replaced by the given ones (see
+    `cirq.protocols.decompose_cache_info`). Gates should only set it when
+    their decomposition doesn't depend on which qubits they act on (unlike,
+    say, `cirq.CCZ`, which decomposes differently for adjacent qubits).
+
     Returns:
         The result of `val._decompose_(qubits)`, if `val` has a
         `_decompose_` method and it didn't return `NotImplemented` or `None`.
@@ -352,7 +365,141 @@ def decompose_once_with_qubits(val: Any,
         `val` didn't have a `_decompose_` method (or that method returned
         `NotImplemented` or `None`) and `default` wasn't set.
     """
-    return decompose_once(val, default, tuple(qubits))
+    qubits = tuple(qubits)
+    key = _DECOMPOSE_CACHE.key(val)
+    if key is None:
+        return decompose_once(val, default, qubits)
+    result = _DECOMPOSE_CACHE.get(key, qubits)
+    if result is None:
+        result = decompose_once(val, None, qubits)
+        if result is not None:
+            _DECOMPOSE_CACHE.put(key, qubits, result)
+    if result is None:
+        return decompose_once(val, default, qubits)
+    return result
+
+
+class DecomposeCacheInfo(NamedTuple):
+    """Statistics of the cache used by `cirq.decompose` for gates."""
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+class _DecomposeCache:
+    """A least recently used cache of gate decompositions.
+
+    Each entry holds the qubits a gate was first decomposed on and the
+    operations it was decomposed into, which are moved onto the qubits of
+    later lookups.
+    """
+
+    def __init__(self, maxsize: Optional[int]) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: ('collections.OrderedDict[Hashable, Tuple[Tuple[Any, '
+                        '...], List[cirq.Operation]]]') = (
+                            collections.OrderedDict())
+        # Simulations can run on several threads at once.
+        self._lock = threading.RLock()
+
+    def key(self, val: Any) -> Optional[Hashable]:
+        """Returns the key of a cacheable gate, or None."""
+        if self.maxsize == 0 or not isinstance(val, ops.Gate):
+            return None
+        if not _has_qubit_independent_decomposition(type(val)):
+            return None
+        attributes = getattr(val, '__dict__', None)
+        if (getattr(val, '_value_equality_values_', None) is None or
+                attributes is None):
+            return None
+        # Equal gates can still decompose differently, e.g. `cirq.ISWAP**0.5`
+        # and `cirq.ISWAP**-3.5` into Z rotations by different exponents, so
+        # the key is made of the gate's attributes instead of its values.
+        key = (type(val), tuple(sorted(attributes.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def get(self, key: Hashable,
+            qubits: Tuple[Any, ...]) -> Optional[List['cirq.Operation']]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        old_qubits, operations = entry
+        if old_qubits == qubits:
+            return list(operations)
+        qubit_map = dict(zip(old_qubits, qubits))
+        return [op.transform_qubits(qubit_map.__getitem__) for op in operations]
+
+    def put(self, key: Hashable, qubits: Tuple[Any, ...],
+            operations: List['cirq.Operation']) -> None:
+        # Decompositions that use other qubits (e.g. ancillae) can't be moved.
+        qubit_set = set(qubits)
+        if len(qubit_set) != len(qubits) or not all(
+                isinstance(op, ops.Operation) and qubit_set.issuperset(
+                    op.qubits) for op in operations):
+            return
+        with self._lock:
+            self._entries[key] = (qubits, list(operations))
+            self.trim()
+
+    def trim(self) -> None:
+        with self._lock:
+            if self.maxsize is not None:
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_DECOMPOSE_CACHE = _DecomposeCache(maxsize=1024)
+
+
+def _has_qubit_independent_decomposition(cls: type) -> bool:
+    # The marker only counts for the `_decompose_` method it was set next to,
+    # so subclasses that override the method don't inherit it.
+    for base in cls.__mro__:
+        if '_decompose_' in base.__dict__:
+            return base.__dict__.get('_qubit_independent_decomposition_', False)
+    return False
+
+
+def set_decompose_cache_size(maxsize: Optional[int]) -> None:
+    """Sets how many gate decompositions `cirq.decompose` keeps.
+
+    Args:
+        maxsize: The number of decompositions to keep, evicting the least
+            recently used ones first. 0 disables the cache, and None removes
+            the limit.
+    """
+    _DECOMPOSE_CACHE.maxsize = maxsize
+    _DECOMPOSE_CACHE.trim()
+
+
+def decompose_cache_info() -> DecomposeCacheInfo:
+    """Returns the hits, misses and size of `cirq.decompose`'s gate cache."""
+    return DecomposeCacheInfo(hits=_DECOMPOSE_CACHE.hits,
+                              misses=_DECOMPOSE_CACHE.misses,
+                              maxsize=_DECOMPOSE_CACHE.maxsize,
+                              currsize=len(_DECOMPOSE_CACHE._entries))
+
+
+def decompose_cache_clear() -> None:
+    """Empties `cirq.decompose`'s gate cache and resets its statistics."""
+    _DECOMPOSE_CACHE.clear()
 
 
 # pylint: enable=function-redefined
@@ -243,3 +243,94 @@ def test_decompose_intercept():
         keep=lambda op: isinstance(op.gate, cirq.CNotPowGate),
         intercepting_decomposer=lambda _: NotImplemented)
     assert actual == [cirq.CNOT(a, b), cirq.CNOT(b, a), cirq.CNOT(a, b)]
+
+
+def test_decompose_cache():
+    a, b, c, d = cirq.LineQubit.range(4)
+    qft = cirq.QuantumFourierTransformGate(3)
+    cirq.protocols.decompose_cache_clear()
+    try:
+        first = cirq.decompose_once_with_qubits(qft, [a, b, c])
+        assert cirq.protocols.decompose_cache_info() == (0, 1, 1024, 1)
+
+        # Equal gates reuse the decomposition, moved onto the new qubits.
+        moved = cirq.decompose_once_with_qubits(qft, [b, c, d])
+        assert cirq.protocols.decompose_cache_info() == (1, 1, 1024, 1)
+        qubit_map = {a: b, b: c, c: d}
+        assert moved == [
+            op.transform_qubits(qubit_map.__getitem__) for op in first
+        ]
+        assert cirq.decompose_once_with_qubits(qft, [a, b, c]) == first
+
+        # Operations go through the cache via their gate.
+        assert cirq.decompose_once(qft(b, c, d)) == moved
+        assert cirq.protocols.decompose_cache_info().hits == 3
+
+        cirq.decompose_once_with_qubits(cirq.SWAP, [a, b])
+        assert cirq.protocols.decompose_cache_info().currsize == 2
+        cirq.protocols.set_decompose_cache_size(1)
+        assert cirq.protocols.decompose_cache_info().currsize == 1
+
+        cirq.protocols.set_decompose_cache_size(0)
+        assert cirq.decompose_once_with_qubits(qft, [a, b, c]) == first
+        assert cirq.protocols.decompose_cache_info().currsize == 0
+    finally:
+        cirq.protocols.set_decompose_cache_size(1024)
+        cirq.protocols.decompose_cache_clear()
+
+
+def test_decompose_cache_tells_equal_gates_apart():
+    a, b = cirq.LineQubit.range(2)
+    cirq.protocols.decompose_cache_clear()
+    assert cirq.ISWAP**-3.5 == cirq.ISWAP**0.5
+    first = cirq.decompose_once_with_qubits(cirq.ISWAP**-3.5, [a, b])
+    second = cirq.decompose_once_with_qubits(cirq.ISWAP**0.5, [a, b])
+    assert cirq.protocols.decompose_cache_info().hits == 0
+    # The decompositions are equal, but use different exponents.
+    assert repr(first) != repr(second)
+    cirq.protocols.decompose_cache_clear()
+    assert repr(cirq.decompose_once_with_qubits(cirq.ISWAP**0.5,
+                                                [a, b])) == repr(second)
+
+
+def test_decompose_cache_skips_qubit_dependent_decompositions():
+    a, b, c = cirq.LineQubit.range(3)
+    cirq.protocols.decompose_cache_clear()
+
+    # CCZ decomposes differently depending on which qubits are adjacent.
+    cirq.decompose_once_with_qubits(cirq.CCZ, [a, b, c])
+    cirq.decompose_once_with_qubits(cirq.CCZ, [a, c, b])
+    assert cirq.protocols.decompose_cache_info().currsize == 0
+
+    class SwapOnLine(cirq.SwapPowGate):
+
+        def _decompose_(self, qubits):
+            if qubits[0].is_adjacent(qubits[1]):
+                return [cirq.CNOT(*qubits)] * 3
+            return [cirq.X(qubits[0])]
+
+    # The marker isn't inherited by subclasses overriding `_decompose_`.
+    assert cirq.decompose_once_with_qubits(SwapOnLine(), [a, c]) == [cirq.X(a)]
+    assert cirq.decompose_once_with_qubits(SwapOnLine(),
+                                           [a, b]) == [cirq.CNOT(a, b)] * 3
+    assert cirq.protocols.decompose_cache_info().currsize == 0
+
+
+def test_decompose_cache_skips_decompositions_with_ancillae():
+
+    class GateWithAncilla(cirq.SingleQubitGate):
+        _qubit_independent_decomposition_ = True
+
+        def _decompose_(self, qubits):
+            return [cirq.CNOT(qubits[0], cirq.NamedQubit('ancilla'))]
+
+        def _value_equality_values_(self):
+            return ()
+
+    a, b = cirq.LineQubit.range(2)
+    cirq.protocols.decompose_cache_clear()
+    gate = GateWithAncilla()
+    ancilla = cirq.NamedQubit('ancilla')
+    assert cirq.decompose_once_with_qubits(gate, [a]) == [cirq.CNOT(a, ancilla)]
+    assert cirq.decompose_once_with_qubits(gate, [b]) == [cirq.CNOT(b, ancilla)]
+    assert cirq.protocols.decompose_cache_info().currsize == 0
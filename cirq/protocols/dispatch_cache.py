@@ -0,0 +1,67 @@
+# Copyright 2020 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Remembers which magic methods each type of value has."""
+
+from typing import Any, Callable, Dict, FrozenSet, Optional, Tuple
+
+
+class StrategyTable:
+    """The strategies of a protocol, filtered by the type of the value.
+
+    Protocols like `cirq.unitary` try a list of strategies in order until one
+    of them is conclusive. Most strategies start by looking up a magic method
+    of the value (e.g. `_unitary_`) and are inconclusive when it is missing.
+    Whether the method exists only depends on the value's type, so it is
+    looked up once per type, and strategies whose method is missing are left
+    out. The remaining strategies are still tried in order on each value,
+    since whether they are conclusive depends on the value.
+
+    This assumes that values get their magic methods from their class. Types
+    that compute attributes dynamically (with `__getattr__`) and values that
+    are classes themselves always get all strategies.
+    """
+
+    def __init__(self, *strats: Tuple[str, Callable[..., Any]]) -> None:
+        """Initializes a StrategyTable.
+
+        Args:
+            *strats: The strategies in the order they should be tried, each
+                with the name of the magic method it needs.
+        """
+        self._strats = strats
+        self._all = tuple(strat for _, strat in strats)
+        self._by_type: Dict[type, Tuple[Callable[..., Any], ...]] = {}
+
+    def for_value(self, val: Any) -> Tuple[Callable[..., Any], ...]:
+        """Returns the strategies that may be conclusive for the value."""
+        t = type(val)
+        result = self._by_type.get(t)
+        if result is None:
+            methods = _magic_methods(t)
+            if methods is None:
+                result = self._all
+            else:
+                result = tuple(
+                    strat for name, strat in self._strats if name in methods)
+            self._by_type[t] = result
+        return result
+
+
+def _magic_methods(t: type) -> Optional[FrozenSet[str]]:
+    """Returns the magic methods of a type's values, or None if unknown."""
+    if (issubclass(t, type) or hasattr(t, '__getattr__') or
+            t.__getattribute__ is not object.__getattribute__):
+        return None
+    return frozenset(name for name in dir(t)
+                     if name.startswith('_') and name.endswith('_'))
@@ -0,0 +1,95 @@
+# Copyright 2020 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+
+import cirq
+from cirq.protocols import dispatch_cache
+
+
+def _strat_a(val):
+    return val._a_()
+
+
+def _strat_b(val):
+    return val._b_()
+
+
+def test_strategy_table_skips_missing_methods():
+    table = dispatch_cache.StrategyTable(('_a_', _strat_a), ('_b_', _strat_b))
+
+    class OnlyB:
+
+        def _b_(self):
+            pass
+
+    class Both(OnlyB):
+
+        def _a_(self):
+            pass
+
+    class Neither:
+        pass
+
+    assert table.for_value(OnlyB()) == (_strat_b,)
+    assert table.for_value(Both()) == (_strat_a, _strat_b)
+    assert table.for_value(Neither()) == ()
+
+
+def test_strategy_table_dynamic_attributes():
+    table = dispatch_cache.StrategyTable(('_a_', _strat_a), ('_b_', _strat_b))
+
+    class Dynamic:
+
+        def __getattr__(self, name):
+            return lambda: name
+
+    class Intercepting:
+
+        def __getattribute__(self, name):
+            return object.__getattribute__(self, name)
+
+    assert table.for_value(Dynamic()) == (_strat_a, _strat_b)
+    assert table.for_value(Intercepting()) == (_strat_a, _strat_b)
+    # Classes have the methods of their instances as attributes.
+    assert table.for_value(Dynamic) == (_strat_a, _strat_b)
+
+
+def test_strategies_are_tried_in_order_for_each_value():
+
+    class SometimesUnitary(cirq.Gate):
+
+        def __init__(self, has_matrix):
+            self.has_matrix = has_matrix
+
+        def num_qubits(self):
+            return 1
+
+        def _unitary_(self):
+            if self.has_matrix:
+                return np.array([[0, 1], [1, 0]])
+            return NotImplemented
+
+        def _decompose_(self, qubits):
+            return [cirq.Y(*qubits)]
+
+    np.testing.assert_allclose(cirq.unitary(SometimesUnitary(True)),
+                               cirq.unitary(cirq.X))
+    np.testing.assert_allclose(cirq.unitary(SometimesUnitary(False)),
+                               cirq.unitary(cirq.Y))
+    np.testing.assert_allclose(cirq.unitary(SometimesUnitary(True)),
+                               cirq.unitary(cirq.X))
+    assert cirq.has_unitary(SometimesUnitary(False))
+    assert not cirq.has_unitary(SometimesUnitary(False),
+                                allow_decompose=False)
@@ -23,7 +23,7 @@ import numpy as np
 from typing_extensions import Protocol
 
 from cirq._doc import document
-from cirq.protocols import qid_shape_protocol
+from cirq.protocols import dispatch_cache, qid_shape_protocol
 from cirq.protocols.apply_unitary_protocol import ApplyUnitaryArgs
 from cirq.protocols.decompose_protocol import (
     _try_decompose_into_operations_and_qubits,)
@@ -100,13 +100,8 @@ def has_unitary(val: Any, *, allow_decompose: bool = True) -> bool:
     Returns:
         Whether or not `val` has a unitary effect.
     """
-    strats = [
-        _strat_has_unitary_from_has_unitary, _strat_has_unitary_from_decompose,
-        _strat_has_unitary_from_apply_unitary, _strat_has_unitary_from_unitary
-    ]
-    if not allow_decompose:
-        strats.remove(_strat_has_unitary_from_decompose)
-    for strat in strats:
+    strats = _STRATS if allow_decompose else _STRATS_WITHOUT_DECOMPOSE
+    for strat in strats.for_value(val):
         result = strat(val)
         if result is not None:
             return result
@@ -158,3 +153,16 @@ def _strat_has_unitary_from_apply_unitary(val: Any) -> Optional[bool]:
     if result is NotImplemented:
         return None
     return result is not None
+
+
+_STRATS = dispatch_cache.StrategyTable(
+    ('_has_unitary_', _strat_has_unitary_from_has_unitary),
+    ('_decompose_', _strat_has_unitary_from_decompose),
+    ('_apply_unitary_', _strat_has_unitary_from_apply_unitary),
+    ('_unitary_', _strat_has_unitary_from_unitary),
+)
+_STRATS_WITHOUT_DECOMPOSE = dispatch_cache.StrategyTable(
+    ('_has_unitary_', _strat_has_unitary_from_has_unitary),
+    ('_apply_unitary_', _strat_has_unitary_from_apply_unitary),
+    ('_unitary_', _strat_has_unitary_from_unitary),
+)
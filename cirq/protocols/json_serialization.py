@@ -11,10 +11,14 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import contextlib
 import dataclasses
+import io
 import json
 import numbers
 import pathlib
+import re
+import threading
 from typing import (
     Union,
     Any,
@@ -25,7 +29,9 @@ from typing import (
     Type,
     cast,
     TYPE_CHECKING,
+    Tuple,
     Iterable,
+    Iterator,
     overload,
     IO,
 )
@@ -96,6 +102,7 @@ class _ResolverCache:
                 'CliffordTableau': cirq.CliffordTableau,
                 'DepolarizingChannel': cirq.DepolarizingChannel,
                 'ConstantQubitNoiseModel': cirq.ConstantQubitNoiseModel,
+                'CountsTrialResult': cirq.CountsTrialResult,
                 'Duration': cirq.Duration,
                 'FSimGate': cirq.FSimGate,
                 'DensePauliString': cirq.DensePauliString,
@@ -400,23 +407,214 @@ class CirqEncoder(json.JSONEncoder):
         return super().default(o)  # coverage: ignore
 
 
-def _cirq_object_hook(d, resolvers: List[Callable[[str], Union[None, Type]]]):
-    if 'cirq_type' not in d:
-        return d
+class _ObjectHook:
+    """Turns decoded JSON dictionaries into the objects they describe.
+
+    Remembers the class found for each `cirq_type`, so the resolvers are only
+    consulted once per type, and the objects interned by `cirq.to_json` with
+    `compact=True`.
+    """
 
-    for resolver in resolvers:
-        cls = resolver(d['cirq_type'])
+    def __init__(self, resolvers: List[Callable[[str], Union[None, Type]]]):
+        self.resolvers = resolvers
+        self.classes: Dict[str, Type] = {}
+        self.interned: List[Any] = []
+
+    def resolve(self, cirq_type: str) -> Type:
+        cls = self.classes.get(cirq_type)
         if cls is not None:
-            break
-    else:
-        raise ValueError("Could not resolve type '{}' "
-                         "during deserialization".format(d['cirq_type']))
+            return cls
+        for resolver in self.resolvers:
+            cls = resolver(cirq_type)
+            if cls is not None:
+                break
+        else:
+            raise ValueError("Could not resolve type '{}' "
+                             "during deserialization".format(cirq_type))
+        self.classes[cirq_type] = cls
+        return cls
+
+    def __call__(self, d):
+        if 'cirq_type' not in d:
+            return d
+
+        cirq_type = d['cirq_type']
+        if cirq_type == '_InternedRef':
+            return self.interned[d['i']]
+        if cirq_type == '_Interned':
+            self.interned.append(d['value'])
+            return d['value']
+        if cirq_type == '_InternTable':
+            return d['value']
+
+        cls = self.resolve(cirq_type)
+        if hasattr(cls, '_from_json_dict_'):
+            return cls._from_json_dict_(**d)
+
+        del d['cirq_type']
+        return cls(**d)
+
+
+def _cirq_object_hook(d, resolvers: List[Callable[[str], Union[None, Type]]]):
+    return _ObjectHook(resolvers)(d)
+
+
+class _InterningEncoder(CirqEncoder):
+    """Encodes each distinct qubit and gate once, into a table of entries.
+
+    Qubits and gates are replaced by references to their index in the table.
+    The entries are encoded when first seen, after the entries they refer to.
+    Two objects share an entry only if they have the same type and the same
+    JSON, since objects that are equal (e.g. `cirq.X**0.5` and
+    `cirq.X**-1.5`) can still have different JSON.
+    """
+
+    def __init__(self, *args, entries: Optional[List[str]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.entries: List[str] = [] if entries is None else entries
+        self._indices: Dict[Tuple[type, str], int] = {}
+        # The index of the objects already encoded, by id. The objects are
+        # kept so that their ids aren't reused.
+        self._seen: Dict[int, Tuple[Any, int]] = {}
+        self._entry_encoder: Optional['_InterningEncoder'] = None
+
+    def default(self, o):
+        if not isinstance(o, (raw_types.Qid, raw_types.Gate)) or not hasattr(
+                o, '_json_dict_'):
+            return super().default(o)
+        seen = self._seen.get(id(o))
+        if seen is not None:
+            return {'cirq_type': '_InternedRef', 'i': seen[1]}
+        if self._entry_encoder is None:
+            self._entry_encoder = type(self)(entries=self.entries)
+            self._entry_encoder._indices = self._indices
+            self._entry_encoder._seen = self._seen
+        entry = self._entry_encoder.encode(o._json_dict_())
+        key = (type(o), entry)
+        index = self._indices.get(key)
+        if index is None:
+            index = len(self.entries)
+            self.entries.append(entry)
+            self._indices[key] = index
+        self._seen[id(o)] = (o, index)
+        return {'cirq_type': '_InternedRef', 'i': index}
+
+
+def _intern_table_json(entries: List[str], value: str,
+                       indent: Optional[int]) -> str:
+    """Returns the JSON of a value encoded with interned entries."""
+    entry_texts = [
+        f'{{"cirq_type": "_Interned", "value": {entry}}}' for entry in entries
+    ]
+    if indent is None:
+        return ('{"cirq_type": "_InternTable", "table": [' +
+                ', '.join(entry_texts) + '], "value": ' + value + '}')
+    newline = '\n' + ' ' * indent
+    table = ('[]' if not entries else '[' + newline + ' ' * indent +
+             (',' + newline + ' ' * indent).join(entry_texts) + newline + ']')
+    return ('{' + newline + '"cirq_type": "_InternTable",' + newline +
+            '"table": ' + table + ',' + newline + '"value": ' +
+            value.replace('\n', newline) + '\n}')
+
+
+class _BinaryFiles(threading.local):
+    """The binary files used by the `to_json` or `read_json` call running on
+    the current thread, if any."""
+
+    def __init__(self):
+        self.writer: Optional[IO[bytes]] = None
+        self.reader: Optional[np.ndarray] = None
+
+
+_BINARY_FILES = _BinaryFiles()
+
+# Offsets of arrays in binary files are multiples of this, so that arrays
+# read from them are aligned.
+_BINARY_ALIGNMENT = 8
+
+
+@contextlib.contextmanager
+def _writing_binary_file(binary_file: Union[None, pathlib.Path, str]
+                        ) -> Iterator[None]:
+    if binary_file is None:
+        yield
+        return
+    with open(binary_file, 'wb') as file:
+        with _using_binary_files(writer=file):
+            yield
+
+
+def _open_binary_file(binary_file: Union[None, pathlib.Path, str]
+                     ) -> Optional[np.ndarray]:
+    if binary_file is None:
+        return None
+    if pathlib.Path(binary_file).stat().st_size:
+        return np.memmap(binary_file, dtype=np.uint8, mode='r')
+    return np.zeros(0, dtype=np.uint8)
+
+
+@contextlib.contextmanager
+def _using_binary_files(*,
+                        writer: Optional[IO[bytes]] = None,
+                        reader: Optional[np.ndarray] = None
+                       ) -> Iterator[None]:
+    previous = _BINARY_FILES.writer, _BINARY_FILES.reader
+    if writer is not None:
+        _BINARY_FILES.writer = writer
+    if reader is not None:
+        _BINARY_FILES.reader = reader
+    try:
+        yield
+    finally:
+        _BINARY_FILES.writer, _BINARY_FILES.reader = previous
+
+
+def write_binary(data: np.ndarray) -> Optional[Dict[str, int]]:
+    """Writes the bytes of an array to the binary file of `cirq.to_json`.
+
+    This is meant for `_json_dict_` methods of objects holding large arrays.
+
+    Args:
+        data: The array to write.
+
+    Returns:
+        None if the running `cirq.to_json` call has no binary file. Otherwise
+        a dictionary with the 'offset' and 'size' in bytes of the data in the
+        binary file, to be given to `cirq.protocols.read_binary` when reading.
+    """
+    file = _BINARY_FILES.writer
+    if file is None:
+        return None
+    offset = file.tell()
+    padding = -offset % _BINARY_ALIGNMENT
+    file.write(bytes(padding))
+    data_bytes = np.ascontiguousarray(data).tobytes()
+    file.write(data_bytes)
+    return {'offset': offset + padding, 'size': len(data_bytes)}
+
+
+def read_binary(offset: int, size: int) -> np.ndarray:
+    """Returns bytes from the binary file of `cirq.read_json`.
 
-    if hasattr(cls, '_from_json_dict_'):
-        return cls._from_json_dict_(**d)
+    This is meant for `_from_json_dict_` methods of objects written with
+    `cirq.protocols.write_binary`. The bytes are memory-mapped, so they are
+    only read from disk when they are used.
 
-    del d['cirq_type']
-    return cls(**d)
+    Args:
+        offset: The position of the bytes in the binary file.
+        size: The number of bytes.
+
+    Returns:
+        A read-only uint8 array of the bytes.
+
+    Raises:
+        ValueError: The running `cirq.read_json` call has no binary file.
+    """
+    data = _BINARY_FILES.reader
+    if data is None:
+        raise ValueError('The JSON refers to a binary file, but no '
+                         'binary_file was given to read_json.')
+    return data[offset:offset + size]
 
 
 # pylint: disable=function-redefined
@@ -425,13 +623,20 @@ def to_json(obj: Any,
             file_or_fn: Union[IO, pathlib.Path, str],
             *,
             indent=2,
-            cls=CirqEncoder) -> None:
+            cls=CirqEncoder,
+            binary_file: Union[None, pathlib.Path, str] = None,
+            compact: bool = False) -> None:
     pass
 
 
 @overload
-def to_json(obj: Any, file_or_fn: None = None, *, indent=2,
-            cls=CirqEncoder) -> str:
+def to_json(obj: Any,
+            file_or_fn: None = None,
+            *,
+            indent=2,
+            cls=CirqEncoder,
+            binary_file: Union[None, pathlib.Path, str] = None,
+            compact: bool = False) -> str:
     pass
 
 
@@ -439,7 +644,9 @@ def to_json(obj: Any,
             file_or_fn: Union[None, IO, pathlib.Path, str] = None,
             *,
             indent: int = 2,
-            cls: Type[json.JSONEncoder] = CirqEncoder) -> Optional[str]:
+            cls: Type[json.JSONEncoder] = CirqEncoder,
+            binary_file: Union[None, pathlib.Path, str] = None,
+            compact: bool = False) -> Optional[str]:
     """Write a JSON file containing a representation of obj.
 
     The object may be a cirq object or have data members that are cirq
@@ -458,17 +665,42 @@ def to_json(obj: Any,
             the SupportsJSON protocol. To support serialization of 3rd
             party classes, prefer adding the _json_dict_ magic method
             to your classes rather than overriding this default.
+        binary_file: A filename to write large arrays (such as the
+            measurements of a `cirq.TrialResult`) to as raw bytes, instead of
+            encoding them in the JSON. The same file must then be given to
+            `cirq.read_json`. Defaults to `None`, which keeps everything in the
+            JSON.
+        compact: If True, each distinct qubit and gate is written once, in a
+            table at the start of the JSON, and referred to by its index
+            everywhere it is used. `cirq.read_json` reads both forms.
+            Defaults to False.
     """
-    if file_or_fn is None:
-        return json.dumps(obj, indent=indent, cls=cls)
-
-    if isinstance(file_or_fn, (str, pathlib.Path)):
-        with open(file_or_fn, 'w') as actually_a_file:
-            json.dump(obj, actually_a_file, indent=indent, cls=cls)
+    with _writing_binary_file(binary_file):
+        if compact:
+            encoder_cls = (cls if issubclass(cls, _InterningEncoder) else type(
+                '_Interning' + cls.__name__, (_InterningEncoder, cls), {}))
+            encoder = encoder_cls(indent=indent)
+            text = _intern_table_json(encoder.entries, encoder.encode(obj),
+                                      indent)
+            if file_or_fn is None:
+                return text
+            if isinstance(file_or_fn, (str, pathlib.Path)):
+                with open(file_or_fn, 'w') as actually_a_file:
+                    actually_a_file.write(text)
+                    return None
+            file_or_fn.write(text)
             return None
 
-    json.dump(obj, file_or_fn, indent=indent, cls=cls)
-    return None
+        if file_or_fn is None:
+            return json.dumps(obj, indent=indent, cls=cls)
+
+        if isinstance(file_or_fn, (str, pathlib.Path)):
+            with open(file_or_fn, 'w') as actually_a_file:
+                json.dump(obj, actually_a_file, indent=indent, cls=cls)
+                return None
+
+        json.dump(obj, file_or_fn, indent=indent, cls=cls)
+        return None
 
 
 # pylint: enable=function-redefined
@@ -478,7 +710,8 @@ def read_json(
         file_or_fn: Union[None, IO, pathlib.Path, str] = None,
         *,
         json_text: Optional[str] = None,
-        resolvers: Optional[List[Callable[[str], Union[None, Type]]]] = None):
+        resolvers: Optional[List[Callable[[str], Union[None, Type]]]] = None,
+        binary_file: Union[None, pathlib.Path, str] = None):
     """Read a JSON file that optionally contains cirq objects.
 
     Args:
@@ -496,6 +729,9 @@ def read_json(
             by pre-pending custom resolvers. Each resolver should return `None`
             to indicate that it cannot resolve the given cirq_type and that
             the next resolver should be tried.
+        binary_file: The binary file given to `cirq.to_json` when writing the
+            JSON, if any. Arrays stored in it are memory-mapped and only read
+            from disk when used.
     """
     if (file_or_fn is None) == (json_text is None):
         raise ValueError('Must specify ONE of "file_or_fn" or "json".')
@@ -507,14 +743,199 @@ def read_json(
         resolvers = cast(Optional[List[Callable[[str], Union[None, Type]]]],
                          DEFAULT_RESOLVERS)
 
-    def obj_hook(x):
-        return _cirq_object_hook(x, resolvers)
+    obj_hook = _ObjectHook(resolvers)
 
-    if json_text is not None:
-        return json.loads(json_text, object_hook=obj_hook)
+    with _using_binary_files(reader=_open_binary_file(binary_file)):
+        if json_text is not None:
+            return json.loads(json_text, object_hook=obj_hook)
+
+        if isinstance(file_or_fn, (str, pathlib.Path)):
+            with open(file_or_fn, 'r') as file:
+                return json.load(file, object_hook=obj_hook)
+
+        return json.load(cast(IO, file_or_fn), object_hook=obj_hook)
 
+
+def to_json_iter(objs: Iterable[Any],
+                 file_or_fn: Union[IO, pathlib.Path, str],
+                 *,
+                 indent: Optional[int] = 2,
+                 cls: Type[json.JSONEncoder] = CirqEncoder,
+                 binary_file: Union[None, pathlib.Path, str] = None) -> None:
+    """Write a JSON list of objects to a file, one object at a time.
+
+    This produces the same JSON as `cirq.to_json(list(objs), file_or_fn)`, but
+    each object is encoded and written as it is taken from `objs`, so `objs`
+    can be a generator that produces the objects as they are needed. The
+    list can be read back one object at a time with `cirq.read_json_iter`.
+
+    Args:
+        objs: The objects to write.
+        file_or_fn: A filename (if a string or `pathlib.Path`) to write to, or
+            an IO object (such as a file or buffer) to write to.
+        indent: Pretty-print the resulting file with this indent level. If
+            `None`, the whole list is written on a single line.
+        cls: The JSON encoder to use, as in `cirq.to_json`.
+        binary_file: A filename to write large arrays to, as in
+            `cirq.to_json`.
+    """
     if isinstance(file_or_fn, (str, pathlib.Path)):
+        with open(file_or_fn, 'w') as actually_a_file:
+            to_json_iter(objs,
+                         actually_a_file,
+                         indent=indent,
+                         cls=cls,
+                         binary_file=binary_file)
+            return
+
+    encoder = cls(indent=indent)
+    if indent is None:
+        first_separator, separator, end = '', ', ', ']'
+    else:
+        newline = '\n' + ' ' * indent
+        first_separator, separator, end = newline, ',' + newline, '\n]'
+    with _writing_binary_file(binary_file):
+        file_or_fn.write('[')
+        written = False
+        for obj in objs:
+            file_or_fn.write(separator if written else first_separator)
+            # Newlines inside JSON strings are escaped, so every newline in
+            # the chunks starts a new line of the object.
+            for chunk in encoder.iterencode(obj):
+                if indent is not None:
+                    chunk = chunk.replace('\n', newline)
+                file_or_fn.write(chunk)
+            written = True
+        file_or_fn.write(end if written else ']')
+
+
+def read_json_iter(
+        file_or_fn: Union[None, IO, pathlib.Path, str] = None,
+        *,
+        json_text: Optional[str] = None,
+        resolvers: Optional[List[Callable[[str], Union[None, Type]]]] = None,
+        binary_file: Union[None, pathlib.Path, str] = None,
+        chunk_size: int = 1 << 16) -> Iterator[Any]:
+    """Read the elements of a JSON list one at a time.
+
+    The file is read in chunks and each element is decoded as soon as it has
+    been read, so only one element at a time is held in memory.
+
+    Args:
+        file_or_fn: A filename (if a string or `pathlib.Path`) to read from, or
+            an IO object (such as a file or buffer) to read from, or `None` to
+            indicate that `json_text` argument should be used.
+        json_text: A string representation of the JSON list, or else `None`
+            indicating `file_or_fn` should be used.
+        resolvers: Functions turning `cirq_type` strings into classes, as in
+            `cirq.read_json`.
+        binary_file: The binary file given when writing the JSON, as in
+            `cirq.read_json`.
+        chunk_size: The number of characters to read from the file at once.
+
+    Yields:
+        The decoded elements of the list.
+
+    Raises:
+        ValueError: The JSON is not a list, or is invalid.
+    """
+    if (file_or_fn is None) == (json_text is None):
+        raise ValueError('Must specify ONE of "file_or_fn" or "json".')
+
+    if json_text is not None:
+        yield from _read_json_list_elements(io.StringIO(json_text), resolvers,
+                                            binary_file, chunk_size)
+    elif isinstance(file_or_fn, (str, pathlib.Path)):
         with open(file_or_fn, 'r') as file:
-            return json.load(file, object_hook=obj_hook)
+            yield from _read_json_list_elements(file, resolvers, binary_file,
+                                                chunk_size)
+    else:
+        yield from _read_json_list_elements(cast(IO, file_or_fn), resolvers,
+                                            binary_file, chunk_size)
+
 
-    return json.load(cast(IO, file_or_fn), object_hook=obj_hook)
+def _read_json_list_elements(
+        file: IO, resolvers: Optional[List[Callable[[str], Union[None, Type]]]],
+        binary_file: Union[None, pathlib.Path, str],
+        chunk_size: int) -> Iterator[Any]:
+    if resolvers is None:
+        resolvers = cast(List[Callable[[str], Union[None, Type]]],
+                         DEFAULT_RESOLVERS)
+    binary_data = _open_binary_file(binary_file)
+    decoder = json.JSONDecoder(
+        object_hook=_ObjectHook(resolvers))
+    text = _ChunkedText(file, chunk_size)
+
+    if text.next_char() != '[':
+        raise ValueError('The JSON is not a list.')
+    text.pos += 1
+    if text.next_char() == ']':
+        return
+    while True:
+        with _using_binary_files(reader=binary_data):
+            obj = text.decode(decoder)
+        yield obj
+        char = text.next_char()
+        text.pos += 1
+        if char == ']':
+            return
+        if char != ',':
+            raise ValueError(f'Expected "," or "]" in the JSON list, '
+                             f'not {char!r}.')
+
+
+_WHITESPACE = re.compile(r'\s*')
+_NUMBER_CHARS = frozenset('0123456789.eE+-')
+
+
+class _ChunkedText:
+    """Text read from a file in chunks, as it is needed."""
+
+    def __init__(self, file: IO, chunk_size: int):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.text = ''
+        self.pos = 0
+        self.at_end = False
+
+    def _read_more(self, size: int) -> bool:
+        """Reads more text, dropping the text before `self.pos`.
+
+        Returns False if the end of the file was reached.
+        """
+        chunk = self.file.read(size)
+        if not chunk:
+            self.at_end = True
+            return False
+        self.text = self.text[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def next_char(self) -> str:
+        """Skips whitespace and returns the next character, or '' at the end."""
+        while True:
+            self.pos = _WHITESPACE.match(self.text, self.pos).end()
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self._read_more(self.chunk_size):
+                return ''
+
+    def decode(self, decoder: json.JSONDecoder) -> Any:
+        """Decodes the next JSON value and moves past it."""
+        self.next_char()
+        while True:
+            try:
+                obj, end = decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                # The value may not have been read completely yet. Reading as
+                # much again as is buffered keeps the retries linear overall.
+                if not self._read_more(max(self.chunk_size, len(self.text))):
+                    raise
+                continue
+            # A number at the end of the text may continue in the next chunk.
+            if (isinstance(obj, numbers.Number) and not self.at_end and
+                    _NUMBER_CHARS.issuperset(self.text[end:]) and
+                    self._read_more(self.chunk_size)):
+                continue
+            self.pos = end
+            return obj
@@ -119,6 +119,7 @@ SHOULDNT_BE_SERIALIZED = [
 
     # Circuit optimizers are function-like. Only attributes
     # are ignore_failures, tolerance, and other feature flags
+    'CompilationCache',
     'ConvertToCzAndSingleGates',
     'ConvertToIonGates',
     'ConvertToNeutralAtomGates',
@@ -130,6 +131,7 @@ SHOULDNT_BE_SERIALIZED = [
     'EjectPhasedPaulis',
     'EjectZ',
     'ExpandComposite',
+    'FusedPointOptimizer',
     'MergeInteractions',
     'MergeSingleQubitGates',
     'PointOptimizer',
@@ -197,6 +199,7 @@ SHOULDNT_BE_SERIALIZED = [
     'GateOpSerializer',
     'GreedySequenceSearchStrategy',
     'SerializingArg',
+    'ShardedSampler',
     'Unique',
     'DEFAULT_RESOLVERS',
 
@@ -277,6 +280,7 @@ NOT_YET_SERIALIZABLE = [
     'CliffordSimulatorStepResult',
     'CliffordState',
     'CliffordTrialResult',
+    'CompiledParameters',
     'ConstantQubitNoiseModel',
     'DensityMatrixSimulator',
     'DensityMatrixSimulatorState',
@@ -288,6 +292,7 @@ NOT_YET_SERIALIZABLE = [
     'InsertStrategy',
     'IonDevice',
     'KakDecomposition',
+    'KakDecompositionBatch',
     'LinearCombinationOfGates',
     'LinearCombinationOfOperations',
     'Linspace',
@@ -316,6 +321,7 @@ NOT_YET_SERIALIZABLE = [
     'SparseSimulatorStep',
     'SQRT_ISWAP_GATESET',
     'StateVectorMixin',
+    'SweepSlice',
     'SYC_GATESET',
     'Sycamore',
     'Sycamore23',
@@ -602,6 +608,149 @@ def test_pathlib_paths(tmpdir):
     assert cirq.read_json(path) == cirq.X
 
 
+def test_binary_file(tmpdir):
+    json_path = pathlib.Path(tmpdir) / 'results.json'
+    binary_path = pathlib.Path(tmpdir) / 'results.bin'
+    results = [
+        cirq.TrialResult(params=cirq.ParamResolver({'a': 0.5}),
+                         measurements={
+                             'm': np.array([[1, 0, 1], [0, 0, 1]],
+                                           dtype=np.bool_),
+                             'n': np.array([[7], [-2]], dtype=np.int16),
+                         }),
+        cirq.CountsTrialResult(params=cirq.ParamResolver({}),
+                               records={'m': np.array([[0], [1]])},
+                               counts=[5, 6]),
+    ]
+    cirq.to_json(results, json_path, binary_file=binary_path)
+    assert 'packed_digits' not in json_path.read_text()
+    assert binary_path.stat().st_size > 0
+
+    loaded = cirq.read_json(json_path, binary_file=binary_path)
+    assert loaded == results
+    assert cirq.read_json(json_text=cirq.to_json(loaded)) == results
+
+    with pytest.raises(ValueError, match='binary_file'):
+        _ = cirq.read_json(json_path)
+
+    # Without binary data, the binary file is empty.
+    cirq.to_json(cirq.X, json_path, binary_file=binary_path)
+    assert binary_path.stat().st_size == 0
+    assert cirq.read_json(json_path, binary_file=binary_path) == cirq.X
+
+
+def test_compact_json():
+    qubits = cirq.GridQubit.rect(2, 2)
+    circuit = cirq.Circuit(
+        cirq.CZ(a, b)**0.5 for a, b in zip(qubits, qubits[1:])
+        for _ in range(5))
+    circuit.append(cirq.ControlledGate(cirq.Y**sympy.Symbol('t')).on(
+        qubits[0], qubits[1]))
+    circuit.append(cirq.measure(*qubits, key='m'))
+
+    text = cirq.to_json(circuit, compact=True)
+    assert len(text) < len(cirq.to_json(circuit))
+    assert text.count('"GridQubit"') == 4
+    assert text.count('"CZPowGate"') == 1
+    assert cirq.read_json(json_text=text) == circuit
+    assert cirq.read_json(json_text=cirq.to_json(
+        circuit, compact=True, indent=None)) == circuit
+
+    buffer = io.StringIO()
+    cirq.to_json([cirq.X, cirq.X, cirq.LineQubit(1)], buffer, compact=True)
+    buffer.seek(0)
+    assert cirq.read_json(buffer) == [cirq.X, cirq.X, cirq.LineQubit(1)]
+    assert cirq.read_json(json_text=cirq.to_json(
+        'no qubits', compact=True)) == 'no qubits'
+
+    # Equal gates with different JSON are kept apart.
+    gates = [cirq.X**0.5, cirq.X**-1.5, cirq.CCZ, cirq.CCZ**-1]
+    text = cirq.to_json(gates, compact=True)
+    assert [repr(g) for g in cirq.read_json(json_text=text)
+           ] == [repr(g) for g in gates]
+
+
+def test_compact_json_custom_encoder_and_unhashable_gates():
+
+    class UnhashableGate(cirq.SingleQubitGate):
+        __hash__ = None
+
+        def _json_dict_(self):
+            return {'cirq_type': 'UnhashableGate'}
+
+        @classmethod
+        def _from_json_dict_(cls, **kwargs):
+            return cls()
+
+        def __eq__(self, other):
+            return isinstance(other, UnhashableGate)
+
+    class CustomEncoder(cirq.protocols.json_serialization.CirqEncoder):
+        pass
+
+    def custom_resolver(name):
+        return UnhashableGate if name == 'UnhashableGate' else None
+
+    q = cirq.LineQubit(0)
+    ops = [UnhashableGate().on(q), UnhashableGate().on(q)]
+    text = cirq.to_json(ops, compact=True, cls=CustomEncoder)
+    assert text.count('"UnhashableGate"') == 1
+    assert text.count('"LineQubit"') == 1
+    assert cirq.read_json(
+        json_text=text,
+        resolvers=[custom_resolver] + cirq.DEFAULT_RESOLVERS) == ops
+
+
+def test_json_iter(tmpdir):
+    path = pathlib.Path(tmpdir) / 'circuits.json'
+    q = cirq.LineQubit(0)
+    circuits = [
+        cirq.Circuit(cirq.X(q)**(i / 8), cirq.measure(q)) for i in range(20)
+    ]
+
+    cirq.to_json_iter((c for c in circuits), path)
+    assert path.read_text() == cirq.to_json(circuits)
+    assert list(cirq.read_json_iter(path)) == circuits
+    # Small chunks split values, including numbers, across reads.
+    with open(path) as file:
+        assert list(cirq.read_json_iter(file, chunk_size=3)) == circuits
+    assert list(cirq.read_json_iter(json_text='[1, 23, 4.5e1]',
+                                    chunk_size=1)) == [1, 23, 45]
+
+    buffer = io.StringIO()
+    cirq.to_json_iter([], buffer)
+    assert buffer.getvalue() == cirq.to_json([]) == '[]'
+    assert list(cirq.read_json_iter(json_text=' [ ] ')) == []
+
+    buffer = io.StringIO()
+    cirq.to_json_iter((c for c in circuits), buffer, indent=None)
+    assert buffer.getvalue() == json.dumps(
+        circuits, cls=cirq.protocols.json_serialization.CirqEncoder)
+    assert list(cirq.read_json_iter(json_text=buffer.getvalue())) == circuits
+
+    with pytest.raises(ValueError, match='not a list'):
+        _ = list(cirq.read_json_iter(json_text='{}'))
+    with pytest.raises(ValueError, match='Expected'):
+        _ = list(cirq.read_json_iter(json_text='[1 2]'))
+    with pytest.raises(ValueError):
+        _ = list(cirq.read_json_iter(json_text='[1, [2'))
+    with pytest.raises(ValueError, match='ONE of'):
+        _ = list(cirq.read_json_iter())
+
+
+def test_json_iter_binary_file(tmpdir):
+    json_path = pathlib.Path(tmpdir) / 'results.json'
+    binary_path = pathlib.Path(tmpdir) / 'results.bin'
+    results = [
+        cirq.TrialResult(params=cirq.ParamResolver({'a': i}),
+                         measurements={'m': np.array([[i % 2, 1]] * 3)})
+        for i in range(4)
+    ]
+    cirq.to_json_iter(results, json_path, binary_file=binary_path)
+    assert list(cirq.read_json_iter(json_path,
+                                    binary_file=binary_path)) == results
+
+
 def test_json_serializable_dataclass():
 
     @cirq.json_serializable_dataclass
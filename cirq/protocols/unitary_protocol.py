@@ -12,9 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
+import threading
 from typing import (
     TYPE_CHECKING,
     Any,
+    Hashable,
+    NamedTuple,
     TypeVar,
     Union,
     Optional,
@@ -25,13 +29,14 @@ from typing_extensions import Protocol
 
 from cirq import qis
 from cirq._doc import document
-from cirq.protocols import qid_shape_protocol
+from cirq.protocols import dispatch_cache, qid_shape_protocol
 from cirq.protocols.apply_unitary_protocol import (
     ApplyUnitaryArgs,
     apply_unitaries,
 )
 from cirq.protocols.decompose_protocol import (
     _try_decompose_into_operations_and_qubits,)
+from cirq.protocols.resolve_parameters import is_parameterized
 from cirq.type_workarounds import NotImplementedType
 
 if TYPE_CHECKING:
@@ -108,6 +113,13 @@ def unitary(val: Any, default: TDefault = RaiseTypeErrorIfNotProvided
     a unitary effect. The order in which techniques are attempted is
     unspecified.
 
+    The matrices of gates with value equality (see `cirq.value_equality`),
+    and of operations applying such gates, are kept in a bounded cache that
+    is keyed by the gate's type and value, so equal gates are only computed
+    once. Each call still returns a new array, which the caller may modify.
+    The cache can be resized or disabled with
+    `cirq.protocols.set_unitary_cache_size`.
+
     Args:
         val: The value to describe with a unitary matrix.
         default: Determines the fallback behavior when `val` doesn't have
@@ -122,15 +134,20 @@ def unitary(val: Any, default: TDefault = RaiseTypeErrorIfNotProvided
         TypeError: `val` doesn't have a unitary effect and no default value was
             specified.
     """
-    strats = [
-        _strat_unitary_from_unitary, _strat_unitary_from_apply_unitary,
-        _strat_unitary_from_decompose
-    ]
-    for strat in strats:
+    key = _UNITARY_CACHE.key(val)
+    if key is not None:
+        matrix = _UNITARY_CACHE.get(key)
+        if matrix is not None:
+            # The cached matrix is shared, so callers get their own copy.
+            return matrix.copy()
+
+    for strat in _STRATS.for_value(val):
         result = strat(val)
         if result is None:
             break
         if result is not NotImplemented:
+            if key is not None:
+                _UNITARY_CACHE.put(key, result)
             return result
 
     if default is not RaiseTypeErrorIfNotProvided:
@@ -202,3 +219,112 @@ def _strat_unitary_from_decompose(val: Any) -> Optional[np.ndarray]:
         return None
     state_len = np.prod(val_qid_shape, dtype=int)
     return result.reshape((state_len, state_len))
+
+
+_STRATS = dispatch_cache.StrategyTable(
+    ('_unitary_', _strat_unitary_from_unitary),
+    ('_apply_unitary_', _strat_unitary_from_apply_unitary),
+    ('_decompose_', _strat_unitary_from_decompose),
+)
+
+
+class UnitaryCacheInfo(NamedTuple):
+    """Statistics of the cache used by `cirq.unitary` for gates."""
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+class _UnitaryCache:
+    """A least recently used cache of gate matrices."""
+
+    def __init__(self, maxsize: Optional[int]) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._matrices: 'collections.OrderedDict[Hashable, np.ndarray]' = (
+            collections.OrderedDict())
+        # Simulations can run on several threads at once.
+        self._lock = threading.RLock()
+
+    def key(self, val: Any) -> Optional[Hashable]:
+        """Returns the key of a cacheable value, or None."""
+        from cirq import ops
+        if self.maxsize == 0:
+            return None
+        if type(val) is ops.GateOperation:
+            # The matrix of a gate operation is the matrix of its gate.
+            val = val.gate
+        if not isinstance(val, ops.Gate):
+            return None
+        values = getattr(val, '_value_equality_values_', None)
+        if values is None or is_parameterized(val):
+            return None
+        # Gates of one type can report the values of another class, e.g.
+        # `cirq.PhasedXPowGate` does so for X and Y rotations.
+        values_cls = getattr(val, '_value_equality_values_cls_', None)
+        key = (type(val), values_cls and values_cls(), values())
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def get(self, key: Hashable) -> Optional[np.ndarray]:
+        with self._lock:
+            matrix = self._matrices.get(key)
+            if matrix is None:
+                self.misses += 1
+                return None
+            self._matrices.move_to_end(key)
+            self.hits += 1
+            return matrix
+
+    def put(self, key: Hashable, matrix: np.ndarray) -> np.ndarray:
+        # Copy, since the value may have returned an array it holds on to.
+        matrix = np.array(matrix)
+        matrix.setflags(write=False)
+        with self._lock:
+            self._matrices[key] = matrix
+            self.trim()
+        return matrix
+
+    def trim(self) -> None:
+        with self._lock:
+            if self.maxsize is not None:
+                while len(self._matrices) > self.maxsize:
+                    self._matrices.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._matrices.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_UNITARY_CACHE = _UnitaryCache(maxsize=1024)
+
+
+def set_unitary_cache_size(maxsize: Optional[int]) -> None:
+    """Sets how many gate matrices `cirq.unitary` keeps.
+
+    Args:
+        maxsize: The number of matrices to keep, evicting the least recently
+            used ones first. 0 disables the cache, and None removes the limit.
+    """
+    _UNITARY_CACHE.maxsize = maxsize
+    _UNITARY_CACHE.trim()
+
+
+def unitary_cache_info() -> UnitaryCacheInfo:
+    """Returns the hits, misses and size of `cirq.unitary`'s gate cache."""
+    return UnitaryCacheInfo(hits=_UNITARY_CACHE.hits,
+                            misses=_UNITARY_CACHE.misses,
+                            maxsize=_UNITARY_CACHE.maxsize,
+                            currsize=len(_UNITARY_CACHE._matrices))
+
+
+def unitary_cache_clear() -> None:
+    """Empties `cirq.unitary`'s gate cache and resets its statistics."""
+    _UNITARY_CACHE.clear()
@@ -11,10 +11,12 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import concurrent.futures
 from typing import Optional
 
 import numpy as np
 import pytest
+import sympy
 
 import cirq
 
@@ -304,3 +306,96 @@ def test_unitary_from_apply_unitary():
                                np.array([[0, 1], [1, 0]]))
     assert cirq.unitary(ApplyGateNotUnitary(), default=None) is None
     assert cirq.unitary(UnknownType(), default=None) is None
+
+
+def test_unitary_cache():
+
+    @cirq.value_equality
+    class CountingGate(cirq.SingleQubitGate):
+
+        calls = 0
+
+        def __init__(self, theta):
+            self.theta = theta
+
+        def _value_equality_values_(self):
+            return self.theta
+
+        def _unitary_(self):
+            CountingGate.calls += 1
+            return np.diag([1, np.exp(1j * self.theta)])
+
+    cirq.protocols.unitary_cache_clear()
+    first = cirq.unitary(CountingGate(0.5))
+    second = cirq.unitary(CountingGate(0.5))
+    np.testing.assert_allclose(second, np.diag([1, np.exp(0.5j)]))
+
+    # Callers get their own arrays, and may modify them.
+    assert second is not first
+    first[0, 0] = 2
+    second[0, 0] = 3
+    assert cirq.unitary(CountingGate(0.5))[0, 0] == 1
+    np.testing.assert_allclose(cirq.unitary(CountingGate(0.25)),
+                               np.diag([1, np.exp(0.25j)]))
+    assert CountingGate.calls == 2
+    assert cirq.protocols.unitary_cache_info() == (
+        cirq.protocols.UnitaryCacheInfo(hits=2,
+                                        misses=2,
+                                        maxsize=1024,
+                                        currsize=2))
+
+    # Operations share the matrix of their gate.
+    np.testing.assert_allclose(
+        cirq.unitary(CountingGate(0.5).on(cirq.LineQubit(0))),
+        np.diag([1, np.exp(0.5j)]))
+    assert CountingGate.calls == 2
+
+    # Parameterized gates have no matrix, and aren't remembered.
+    assert cirq.unitary(cirq.X**sympy.Symbol('t'), None) is None
+    assert cirq.protocols.unitary_cache_info().currsize == 2
+
+    cirq.protocols.set_unitary_cache_size(1)
+    assert cirq.protocols.unitary_cache_info().currsize == 1
+    cirq.unitary(CountingGate(0.5))
+    cirq.unitary(CountingGate(0.25))
+    assert CountingGate.calls == 3
+
+    cirq.protocols.set_unitary_cache_size(0)
+    try:
+        assert cirq.unitary(CountingGate(0.5)).flags.writeable
+        assert cirq.protocols.unitary_cache_info().currsize == 0
+    finally:
+        cirq.protocols.set_unitary_cache_size(1024)
+
+
+def test_unitary_cache_from_several_threads():
+    gates = [cirq.X**(i / 16) for i in range(16)]
+    expected = [cirq.unitary(cirq.X**(i / 16), None) for i in range(16)]
+
+    def unitaries(_):
+        return [cirq.unitary(gate) for gate in gates * 20]
+
+    cirq.protocols.set_unitary_cache_size(2)
+    try:
+        with concurrent.futures.ThreadPoolExecutor(4) as executor:
+            for results in executor.map(unitaries, range(4)):
+                for u, e in zip(results, expected * 20):
+                    np.testing.assert_allclose(u, e)
+    finally:
+        cirq.protocols.set_unitary_cache_size(1024)
+
+
+def test_unitary_cache_keeps_equal_values_of_other_classes_apart():
+    cirq.protocols.unitary_cache_clear()
+    # PhasedX gates compare by the values of X and Y rotations.
+    np.testing.assert_allclose(
+        cirq.unitary(cirq.PhasedXPowGate(phase_exponent=0)),
+        cirq.unitary(cirq.X))
+    np.testing.assert_allclose(
+        cirq.unitary(cirq.PhasedXPowGate(phase_exponent=0.5)),
+        cirq.unitary(cirq.Y))
+
+    # Sympy numbers are equal to floats, but count as parameters.
+    np.testing.assert_allclose(cirq.unitary(cirq.XX**0), np.eye(4))
+    assert cirq.unitary(cirq.XXPowGate(exponent=sympy.Integer(0)),
+                        None) is None
@@ -31,11 +31,14 @@ from typing import (Any, Dict, Iterator, List, Sequence, Tuple, Optional,
                     TYPE_CHECKING, Set, cast)
 
 import abc
+import asyncio
 import collections
+import functools
 
 import numpy as np
 
 from cirq import circuits, ops, protocols, study, value, work
+from cirq._compat import get_running_loop
 
 if TYPE_CHECKING:
     import cirq
@@ -45,6 +48,11 @@ class SimulatesSamples(work.Sampler, metaclass=abc.ABCMeta):
     """Simulator that mimics running on quantum hardware.
 
     Implementors of this interface should implement the _run method.
+
+    The asynchronous methods of a simulator that was given a seed run on the
+    event loop's thread instead of `self.executor`, one call at a time, so
+    that concurrent calls draw from the seeded random state in a
+    reproducible order.
     """
 
     def run_sweep(
@@ -82,6 +90,78 @@ class SimulatesSamples(work.Sampler, metaclass=abc.ABCMeta):
                     params=param_resolver, measurements=measurements))
         return trial_results
 
+    async def run_sweep_async(
+            self,
+            program: 'cirq.Circuit',
+            params: study.Sweepable,
+            repetitions: int = 1,
+    ) -> List[study.TrialResult]:
+        """Asynchronously runs the supplied Circuit, mimicking quantum hardware.
+
+        Each parameter resolver is simulated as a separate call on
+        `self.executor`, so that resolvers are simulated concurrently. If the
+        simulator was given a seed, this instead calls `run_sweep` on the
+        event loop's thread, so that the samples are the same as those of
+        `run_sweep`.
+
+        Args:
+            program: The circuit to simulate.
+            params: Parameters to run with the program.
+            repetitions: The number of repetitions to simulate.
+
+        Returns:
+            TrialResult list for this run; one for each possible parameter
+            resolver.
+        """
+        if not program.has_measurements():
+            raise ValueError("Circuit has no measurements to sample.")
+
+        _verify_unique_measurement_keys(program)
+
+        if self._is_seeded():
+            return self.run_sweep(program, params, repetitions)
+
+        loop = get_running_loop()
+        resolvers = list(study.to_resolvers(params))
+        all_measurements = await asyncio.gather(*[
+            loop.run_in_executor(
+                self.executor,
+                functools.partial(self._run,
+                                  circuit=program,
+                                  param_resolver=param_resolver,
+                                  repetitions=repetitions))
+            for param_resolver in resolvers
+        ])
+        return [
+            study.TrialResult.from_single_parameter_set(
+                params=param_resolver, measurements=measurements)
+            for param_resolver, measurements in zip(resolvers, all_measurements)
+        ]
+
+    async def run_async(self, program: 'cirq.Circuit', *,
+                        repetitions: int) -> study.TrialResult:
+        if self._is_seeded():
+            return self.run(program, repetitions=repetitions)
+        return await super().run_async(program, repetitions=repetitions)
+
+    async def run_batch_async(
+            self,
+            programs: Sequence['cirq.Circuit'],
+            params_list: Optional[Sequence['cirq.Sweepable']] = None,
+            repetitions: int = 1,
+    ) -> List[List[study.TrialResult]]:
+        if self._is_seeded():
+            return self.run_batch(programs, params_list, repetitions)
+        return await super().run_batch_async(programs, params_list, repetitions)
+
+    def _is_seeded(self) -> bool:
+        """Whether the simulator draws from its own, seeded, random state.
+
+        Concurrent calls on other threads would draw from such a random state
+        in an order that depends on timing.
+        """
+        return getattr(self, '_prng', np.random) is not np.random
+
     @abc.abstractmethod
     def _run(
         self,
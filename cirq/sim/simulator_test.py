@@ -13,9 +13,13 @@
 # limitations under the License.
 """Tests for simulator.py"""
 
+import concurrent.futures
+import threading
 from unittest import mock
+
 import numpy as np
 import pytest
+import sympy
 
 import cirq
 
@@ -306,6 +310,64 @@ async def test_async_sample():
     np.testing.assert_equal(result.measurements, m)
 
 
+@pytest.mark.asyncio
+async def test_async_sweep_runs_resolvers_concurrently():
+    barrier = threading.Barrier(2, timeout=10)
+
+    class MockSimulator(cirq.SimulatesSamples):
+
+        def _run(self, circuit, param_resolver, repetitions):
+            # Blocks until both resolvers are being simulated at once.
+            barrier.wait()
+            return {'m': np.array([[param_resolver.value_of('a')]])}
+
+    q = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.measure(q, key='m'))
+    simulator = MockSimulator()
+    with concurrent.futures.ThreadPoolExecutor(2) as executor:
+        simulator.executor = executor
+        results = await simulator.run_sweep_async(circuit,
+                                                  cirq.Points('a', [0, 1]))
+    assert [r.measurements['m'].tolist() for r in results] == [[[0]], [[1]]]
+    assert [r.params for r in results] == list(
+        cirq.to_resolvers(cirq.Points('a', [0, 1])))
+
+    with pytest.raises(ValueError, match='no measurements'):
+        await simulator.run_sweep_async(cirq.Circuit(), None)
+
+
+@pytest.mark.asyncio
+async def test_async_sweep_seeded_matches_run_sweep():
+    q = cirq.LineQubit(0)
+    circuit = cirq.Circuit(
+        cirq.X(q)**sympy.Symbol('t'), cirq.measure(q, key='m'))
+    sweep = cirq.Linspace('t', 0, 1, 10)
+    expected = cirq.Simulator(seed=1234).run_sweep(circuit,
+                                                   sweep,
+                                                   repetitions=100)
+    simulator = cirq.Simulator(seed=1234)
+    with concurrent.futures.ThreadPoolExecutor(4) as executor:
+        simulator.executor = executor
+        results = await simulator.run_sweep_async(circuit,
+                                                  sweep,
+                                                  repetitions=100)
+    assert results == expected
+
+
+def test_seeded_collect_is_reproducible():
+    a, b = cirq.LineQubit.range(2)
+    energies = set()
+    for _ in range(3):
+        collector = cirq.PauliSumCollector(cirq.Circuit(cirq.H(a),
+                                                        cirq.X(b)**0.3),
+                                           cirq.X(a) + cirq.Z(b),
+                                           samples_per_term=100,
+                                           max_samples_per_job=10)
+        collector.collect(cirq.Simulator(seed=1234), concurrency=3)
+        energies.add(collector.estimated_energy())
+    assert len(energies) == 1
+
+
 def test_simulation_trial_result_qubit_map():
     q = cirq.LineQubit.range(2)
     result = cirq.Simulator().simulate(cirq.Circuit([cirq.CZ(q[0], q[1])]))
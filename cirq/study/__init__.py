@@ -14,6 +14,9 @@
 
 """Types and methods for running studies (repeated trials)."""
 
+from cirq.study.compiled_parameters import (
+    CompiledParameters,)
+
 from cirq.study.flatten_expressions import (
     ExpressionMap,
     flatten,
@@ -28,6 +31,7 @@ from cirq.study.resolver import (
 )
 
 from cirq.study.sweepable import (
+    shard_sweep,
     Sweepable,
     to_resolvers,
     to_sweep,
@@ -40,12 +44,15 @@ from cirq.study.sweeps import (
     Points,
     Product,
     Sweep,
+    SweepSlice,
     UnitSweep,
     Zip,
 )
 
 from cirq.study.trial_result import (
-    TrialResult,)
+    CountsTrialResult,
+    TrialResult,
+)
 
 from cirq.study.visualize import (
     plot_state_histogram,)
@@ -0,0 +1,193 @@
+# Copyright 2020 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Resolves the parameters of a value for many parameter values at once."""
+
+from typing import (Any, Callable, Dict, Iterable, List, Mapping, Sequence,
+                    Tuple, TYPE_CHECKING, Union)
+
+import numpy as np
+import sympy
+
+from cirq import protocols
+from cirq.study import flatten_expressions, resolver, sweepable
+
+if TYPE_CHECKING:
+    import cirq
+
+
+class CompiledParameters:
+    """A value whose parameter expressions are compiled into numpy functions.
+
+    The value (e.g. a `cirq.Circuit`) is scanned once with `cirq.flatten`,
+    which replaces every distinct sympy expression by a new symbol. Each
+    expression is then turned into a numpy function with `sympy.lambdify`.
+    Resolving the value for a batch of parameter values evaluates each
+    expression once for the whole batch, and the flattened value is resolved
+    with plain floats, so no sympy substitution happens per point.
+
+    Examples:
+        >>> q = cirq.LineQubit(0)
+        >>> a, b = sympy.symbols('a b')
+        >>> circuit = cirq.Circuit(cirq.X(q)**(2 * a + b), cirq.Z(q)**b)
+        >>> compiled = cirq.CompiledParameters(circuit)
+        >>> values = {'a': [0, 0.25], 'b': [0, 0.25]}
+        >>> for c in compiled.resolve_arrays(values):
+        ...     print(c)
+        0: ───X^0───Z^0───
+        0: ───X^0.75───Z^0.25───
+
+    Attributes:
+        flat_val: The value with its expressions replaced by new symbols.
+        symbols: The symbols that parameter values must be given for.
+    """
+
+    def __init__(self, val: Any) -> None:
+        """Compiles the parameter expressions of a value.
+
+        Args:
+            val: The value to compile, e.g. a `cirq.Circuit`, `cirq.Gate` or
+                `cirq.Operation`.
+        """
+        self.flat_val, expr_map = flatten_expressions.flatten(val)
+        self._functions: List[Tuple[sympy.Symbol, Callable[..., Any], Tuple[
+            sympy.Symbol, ...]]] = []
+        symbols = set()
+        for expr, flat_symbol in expr_map.items():
+            args = tuple(sorted(expr.free_symbols, key=str))
+            symbols.update(args)
+            func = sympy.lambdify(args, expr, modules='numpy')
+            self._functions.append((flat_symbol, func, args))
+        self.symbols: Tuple[sympy.Symbol, ...] = tuple(
+            sorted(symbols, key=str))
+
+    def evaluate(self, values: Mapping[Union[str, sympy.Symbol], Any]
+                ) -> Dict[sympy.Symbol, np.ndarray]:
+        """Evaluates every compiled expression for a batch of values.
+
+        Args:
+            values: A mapping from each symbol in `self.symbols` (or its name)
+                to a one dimensional array of values, one per point of the
+                batch. All arrays must have the same length.
+
+        Returns:
+            A dictionary from the symbols of `self.flat_val` to arrays of
+            their values, one per point of the batch.
+
+        Raises:
+            ValueError: A symbol has no values, or the arrays have different
+                lengths.
+        """
+        columns = {}
+        for key, column in values.items():
+            name = key.name if isinstance(key, sympy.Symbol) else key
+            columns[name] = np.asarray(column)
+        missing = [s for s in self.symbols if s.name not in columns]
+        if missing:
+            raise ValueError(f'No values given for symbols {missing!r}.')
+        length = _batch_size(columns.values())
+
+        result = {}
+        for flat_symbol, func, args in self._functions:
+            column = np.asarray(func(*(columns[a.name] for a in args)))
+            column = np.broadcast_to(column, (length,))
+            if np.iscomplexobj(column) and not np.any(np.imag(column)):
+                column = np.real(column)
+            result[flat_symbol] = column
+        return result
+
+    def param_arrays(self, params: 'cirq.Sweepable'
+                    ) -> Dict[sympy.Symbol, np.ndarray]:
+        """Collects the values of `self.symbols` from sweeps or resolvers.
+
+        Args:
+            params: The parameter values, in any form accepted by
+                `cirq.to_resolvers`.
+
+        Returns:
+            A dictionary from each symbol in `self.symbols` to an array of its
+            values, one per resolver.
+
+        Raises:
+            ValueError: A resolver doesn't give a number for a symbol.
+        """
+        points = [[] for _ in self.symbols]  # type: List[List[Any]]
+        for r in sweepable.to_resolvers(params):
+            for symbol, column in zip(self.symbols, points):
+                value = r.value_of(symbol)
+                if isinstance(value, sympy.Basic):
+                    raise ValueError(
+                        f'No value given for symbol {symbol!r} by {r!r}.')
+                column.append(value)
+        return {
+            symbol: np.array(column)
+            for symbol, column in zip(self.symbols, points)
+        }
+
+    def flat_resolvers(self, values: Mapping[Union[str, sympy.Symbol], Any]
+                      ) -> List['cirq.ParamResolver']:
+        """Returns resolvers for `self.flat_val`, one per point of a batch.
+
+        Args:
+            values: A mapping from each symbol in `self.symbols` to an array
+                of its values, as given to `evaluate`.
+        """
+        columns = self.evaluate(values)
+        if not columns:
+            return [
+                resolver.ParamResolver({})
+                for _ in range(_batch_size(values.values()))
+            ]
+        symbols = list(columns)
+        rows = zip(*(columns[s].tolist() for s in symbols))
+        return [resolver.ParamResolver(dict(zip(symbols, row))) for row in rows]
+
+    def resolve_arrays(self, values: Mapping[Union[str, sympy.Symbol], Any]
+                      ) -> Sequence[Any]:
+        """Resolves the value for each point of a batch of values.
+
+        Args:
+            values: A mapping from each symbol in `self.symbols` to an array
+                of its values, as given to `evaluate`.
+
+        Returns:
+            A list with one copy of the value per point of the batch, with its
+            parameters resolved to the values of that point.
+        """
+        return [
+            protocols.resolve_parameters(self.flat_val, r)
+            for r in self.flat_resolvers(values)
+        ]
+
+    def resolve_sweep(self, params: 'cirq.Sweepable') -> Sequence[Any]:
+        """Resolves the value for each resolver of a sweep.
+
+        Args:
+            params: The parameter values, in any form accepted by
+                `cirq.to_resolvers`.
+
+        Returns:
+            A list with one copy of the value per resolver, with its
+            parameters resolved to the values of that resolver.
+        """
+        if not self.symbols:
+            return [self.flat_val for _ in sweepable.to_resolvers(params)]
+        return self.resolve_arrays(self.param_arrays(params))
+
+
+def _batch_size(columns: Iterable[Any]) -> int:
+    lengths = {len(column) for column in columns}
+    if len(lengths) > 1:
+        raise ValueError('The value arrays have different lengths: '
+                         f'{sorted(lengths)}.')
+    return lengths.pop() if lengths else 1
@@ -0,0 +1,86 @@
+# Copyright 2020 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+import sympy
+
+import cirq
+
+
+def test_resolve_sweep_matches_resolve_parameters():
+    a, b = cirq.LineQubit.range(2)
+    theta, phi = sympy.symbols('theta phi')
+    circuit = cirq.Circuit(
+        cirq.X(a)**(2 * theta + phi),
+        cirq.CZ(a, b)**(theta / 2),
+        cirq.Y(b)**phi,
+        cirq.Z(a)**(theta**2),
+        cirq.rz(theta).on(b),
+    )
+    compiled = cirq.CompiledParameters(circuit)
+    assert compiled.symbols == (phi, theta)
+
+    sweep = cirq.Linspace(theta, 0, 1, 5) * cirq.Points('phi', [0.25, -0.5])
+    actual = compiled.resolve_sweep(sweep)
+    expected = [cirq.resolve_parameters(circuit, r) for r in sweep]
+    assert len(actual) == len(expected) == 10
+    for actual_circuit, expected_circuit in zip(actual, expected):
+        cirq.testing.assert_allclose_up_to_global_phase(
+            cirq.unitary(actual_circuit),
+            cirq.unitary(expected_circuit),
+            atol=1e-8)
+
+
+def test_evaluate():
+    theta, phi = sympy.symbols('theta phi')
+    q = cirq.LineQubit(0)
+    compiled = cirq.CompiledParameters(
+        cirq.Circuit(cirq.X(q)**(2 * theta + phi),
+                     cirq.Y(q)**theta))
+    # The flattened symbol is named after the expression, whose printed form
+    # depends on the sympy version.
+    flat = sympy.Symbol(f'<{2 * theta + phi}>')
+    values = compiled.evaluate({'theta': [0, 1, 2], phi: np.array([1, 1, 0])})
+    assert set(values) == {flat, theta}
+    np.testing.assert_allclose(values[flat], [1, 3, 4])
+    np.testing.assert_allclose(values[theta], [0, 1, 2])
+
+    resolvers = compiled.flat_resolvers({'theta': [0, 1], 'phi': [1, 2]})
+    assert resolvers == [
+        cirq.ParamResolver({
+            flat: 1,
+            theta: 0
+        }),
+        cirq.ParamResolver({
+            flat: 4,
+            theta: 1
+        }),
+    ]
+
+    with pytest.raises(ValueError, match='No values'):
+        _ = compiled.evaluate({'theta': [0]})
+    with pytest.raises(ValueError, match='different lengths'):
+        _ = compiled.evaluate({'theta': [0], 'phi': [0, 1]})
+    with pytest.raises(ValueError, match='No value given'):
+        _ = compiled.resolve_sweep(cirq.Points('theta', [0]))
+
+
+def test_unparameterized():
+    q = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.X(q)**0.5)
+    compiled = cirq.CompiledParameters(circuit)
+    assert compiled.symbols == ()
+    assert compiled.resolve_sweep(cirq.Points('a', [0, 1, 2])) == [circuit] * 3
+    assert compiled.resolve_arrays({}) == [circuit]
@@ -61,6 +61,10 @@ class ParamResolver:
         self._param_hash: Optional[int] = None
         self.param_dict = cast(ParamDictType,
                                {} if param_dict is None else param_dict)
+        # Numbers assigned to each parameter name, built on first use.
+        self._values_by_name: Optional[Dict[str, Union[float, int]]] = None
+        # Values of the strings and sympy expressions resolved so far.
+        self._value_cache: Dict[Union[sympy.Basic, str], 'cirq.TParamVal'] = {}
 
     def value_of(self,
                  value: Union[sympy.Basic, float, str]) -> 'cirq.TParamVal':
@@ -77,6 +81,8 @@ class ParamResolver:
         underlying sympy library.  For circuits relying on quick performance,
         it is recommended that all formulas are flattened before-hand using
         cirq.flatten or other means so that formula resolution is avoided.
+        Each resolver remembers the values of the formulas it has resolved,
+        so its parameter dictionary must not be modified after first use.
         If unable to resolve a sympy.Symbol, returns it unchanged.
         If unable to resolve a name, returns a sympy.Symbol with that name.
 
@@ -91,6 +97,44 @@ class ParamResolver:
         if isinstance(value, float):
             return value
 
+        # Input is a name or symbol assigned a number: return it.
+        if isinstance(value, (str, sympy.Symbol)):
+            if self._values_by_name is None:
+                self._values_by_name = self._numbers_by_name()
+            name = value if isinstance(value, str) else value.name
+            param_value = self._values_by_name.get(name)
+            if param_value is not None:
+                return param_value
+
+        if not isinstance(value, (str, sympy.Basic)):
+            return self._value_of_uncached(value)
+        if value not in self._value_cache:
+            self._value_cache[value] = self._value_of_uncached(value)
+        return self._value_cache[value]
+
+    def _numbers_by_name(self) -> Dict[str, Union[float, int]]:
+        """Returns the numbers assigned to parameter names.
+
+        Names given both as a string and as a symbol are left out, since which
+        of their values is used depends on how they are looked up.
+        """
+        result: Dict[str, Union[float, int]] = {}
+        ambiguous = set()
+        for key, param_value in self.param_dict.items():
+            name = key if isinstance(key, str) else getattr(key, 'name', None)
+            if name is None:
+                continue
+            if name in result or name in ambiguous:
+                ambiguous.add(name)
+                result.pop(name, None)
+            elif isinstance(param_value, (float, int)):
+                result[name] = param_value
+            else:
+                ambiguous.add(name)
+        return result
+
+    def _value_of_uncached(self, value: Union[sympy.Basic, float, str]
+                          ) -> 'cirq.TParamVal':
         # Handles 2 cases:
         # Input is a string and maps to a number in the dictionary
         # Input is a symbol and maps to a number in the dictionary
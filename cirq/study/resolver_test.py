@@ -79,6 +79,28 @@ def test_formulas_in_param_dict():
     assert r.value_of('d') == 2 * e
 
 
+def test_value_of_name_given_as_str_and_symbol():
+    a = sympy.Symbol('a')
+    r = cirq.ParamResolver({'a': 1, a: 2})
+    assert r.value_of('a') == 1
+    assert r.value_of(a) == 2
+    assert r.value_of(a + 1) == 3
+
+
+def test_value_of_remembers_formulas(monkeypatch):
+    a = sympy.Symbol('a')
+    r = cirq.ParamResolver({'a': 0})
+    assert r.value_of(sympy.cos(a)) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError('Formula was resolved again.')
+
+    monkeypatch.setattr(sympy.Basic, 'subs', fail)
+    assert r.value_of(sympy.cos(a)) == 1
+    assert r.value_of('a') == 0
+    assert r.value_of(a) == 0
+
+
 def test_equals():
     et = cirq.testing.EqualsTester()
     et.add_equality_group(cirq.ParamResolver(),
@@ -14,7 +14,7 @@
 
 """Defines which types are Sweepable."""
 
-from typing import Dict, Iterable, Iterator, List, Union, cast
+from typing import Dict, Iterable, Iterator, List, Optional, Union, cast
 import itertools
 
 from cirq._doc import document
@@ -107,6 +107,57 @@ def to_sweep(sweep_or_resolver_list: Union['Sweep', ParamResolverOrSimilarType,
         'Unexpected sweep-like value: {}'.format(sweep_or_resolver_list))
 
 
+def shard_sweep(
+        sweep_or_resolver_list: Union['Sweep', ParamResolverOrSimilarType,
+                                      Iterable[ParamResolverOrSimilarType]],
+        *,
+        num_shards: Optional[int] = None,
+        max_shard_size: Optional[int] = None) -> List['Sweep']:
+    """Splits a sweep into consecutive shards of balanced sizes.
+
+    The shards are slices of the sweep, so they are computed without
+    enumerating the points of the sweep. Iterating over the shards in order
+    gives the points of the sweep in order.
+
+    Args:
+        sweep_or_resolver_list: The sweep to split, or anything accepted by
+            `cirq.to_sweep`.
+        num_shards: The number of shards to split the sweep into. Fewer shards
+            are returned if the sweep has fewer points.
+        max_shard_size: The maximum number of points in a shard. If
+            `num_shards` is also given, more shards are returned when needed
+            to respect this limit.
+
+    Returns:
+        A list of non-empty sweeps, whose sizes differ by at most one.
+
+    Raises:
+        ValueError: Neither `num_shards` nor `max_shard_size` was given, or
+            one of them is not positive.
+    """
+    if num_shards is None and max_shard_size is None:
+        raise ValueError('Specify num_shards or max_shard_size.')
+    if num_shards is not None and num_shards <= 0:
+        raise ValueError(f'num_shards must be positive: {num_shards!r}')
+    if max_shard_size is not None and max_shard_size <= 0:
+        raise ValueError(f'max_shard_size must be positive: {max_shard_size!r}')
+
+    sweep = to_sweep(sweep_or_resolver_list)
+    n = len(sweep)
+    count = num_shards or 1
+    if max_shard_size is not None:
+        count = max(count, -(-n // max_shard_size))
+    count = min(count, n)
+
+    shards = []
+    start = 0
+    for i in range(count):
+        stop = start + n // count + (i < n % count)
+        shards.append(sweep[start:stop])
+        start = stop
+    return shards
+
+
 def _resolver_to_sweep(resolver: ParamResolver) -> Sweep:
     params = resolver.param_dict
     if not params:
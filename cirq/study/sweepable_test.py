@@ -173,3 +173,49 @@ def test_to_sweep_resolver_list(r_list_gen):
 def test_to_sweep_type_error():
     with pytest.raises(TypeError, match='Unexpected sweep'):
         cirq.to_sweep(5)
+
+
+def test_shard_sweep():
+    sweep = cirq.Points('a', [1, 2, 3]) * cirq.Linspace('b', 0, 1, 4)
+    shards = cirq.shard_sweep(sweep, num_shards=5)
+    assert [len(s) for s in shards] == [3, 3, 2, 2, 2]
+    assert [r for s in shards for r in s] == list(sweep)
+
+    shards = cirq.shard_sweep(sweep, max_shard_size=5)
+    assert [len(s) for s in shards] == [4, 4, 4]
+    shards = cirq.shard_sweep(sweep, num_shards=2, max_shard_size=5)
+    assert [len(s) for s in shards] == [4, 4, 4]
+    shards = cirq.shard_sweep(sweep, num_shards=20)
+    assert [len(s) for s in shards] == [1] * 12
+
+    points = cirq.shard_sweep(cirq.Points('a', [1, 2, 3]), num_shards=2)
+    assert points == [
+        cirq.ListSweep([{
+            'a': 1
+        }, {
+            'a': 2
+        }]),
+        cirq.ListSweep([{
+            'a': 3
+        }]),
+    ]
+    resolvers = cirq.shard_sweep([{'a': 1}, {'a': 2}], num_shards=2)
+    assert resolvers == [
+        cirq.ListSweep([{
+            'a': 1
+        }]),
+        cirq.ListSweep([{
+            'a': 2
+        }]),
+    ]
+    assert cirq.shard_sweep(cirq.Zip(), num_shards=2) == []
+
+
+def test_shard_sweep_invalid():
+    sweep = cirq.Points('a', [1, 2, 3])
+    with pytest.raises(ValueError, match='num_shards or max_shard_size'):
+        _ = cirq.shard_sweep(sweep)
+    with pytest.raises(ValueError, match='num_shards'):
+        _ = cirq.shard_sweep(sweep, num_shards=0)
+    with pytest.raises(ValueError, match='max_shard_size'):
+        _ = cirq.shard_sweep(sweep, max_shard_size=0)
@@ -11,12 +11,14 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import (Any, cast, Dict, Iterable, Iterator, List, overload,
+from typing import (Any, cast, Iterable, Iterator, List, overload,
                     Sequence, Tuple, Union)
 
 import abc
 import collections
 import itertools
+
+import numpy as np
 import sympy
 
 from cirq._doc import document
@@ -119,20 +121,12 @@ class Sweep(metaclass=abc.ABCMeta):
                 raise IndexError(f'sweep index out of range: {val}')
             if val < 0:
                 val += n
-            return next(itertools.islice(self, val, val + 1))
+            return resolver.ParamResolver(
+                collections.OrderedDict(self._param_tuple_at(val)))
         if not isinstance(val, slice):
             raise TypeError(
                 f'Sweep indices must be either int or slices, not {type(val)}')
-
-        inds_map: Dict[int, int] = {
-            sweep_i: slice_i for slice_i, sweep_i in enumerate(range(n)[val])
-        }
-        results = [resolver.ParamResolver()] * len(inds_map)
-        for i, item in enumerate(self):
-            if i in inds_map:
-                results[inds_map[i]] = item
-
-        return ListSweep(results)
+        return self._slice(range(n)[val])
 
     # pylint: enable=function-redefined
 
@@ -140,6 +134,38 @@ class Sweep(metaclass=abc.ABCMeta):
     def param_tuples(self) -> Iterator[Params]:
         """An iterator over (key, value) pairs assigning Symbol key to value."""
 
+    def to_numpy(self) -> np.ndarray:
+        """Returns the parameter values of the sweep as a float array.
+
+        Returns:
+            An array of shape `(len(self), len(self.keys))`, whose row `i`
+            holds the values that `self[i]` assigns to `self.keys`, in order.
+        """
+        if not len(self):
+            return np.zeros((0, len(self.keys)))
+        return self._param_values_at(np.arange(len(self)))
+
+    def _param_tuple_at(self, index: int) -> Params:
+        """Returns the (key, value) pairs of the point at an index.
+
+        The index is in `range(len(self))`. Child classes should override
+        this method with one that does not iterate over the sweep.
+        """
+        return next(itertools.islice(self.param_tuples(), index, None))
+
+    def _param_values_at(self, indices: np.ndarray) -> np.ndarray:
+        """Returns the rows of `to_numpy()` at some indices.
+
+        Child classes should override this method with a vectorized one.
+        """
+        rows = [[v for _, v in self._param_tuple_at(int(i))] for i in indices]
+        return np.array(rows, dtype=float).reshape(
+            (len(indices), len(self.keys)))
+
+    def _slice(self, indices: range) -> 'Sweep':
+        """Returns the sweep over the points at the given indices."""
+        return SweepSlice(self, indices)
+
     def __str__(self) -> str:
         length = len(self)
         max_show = 10
@@ -156,8 +182,8 @@ class Sweep(metaclass=abc.ABCMeta):
         if end_len > 0:
             lines.append('...')
             lines.extend(
-                str(dict(r.param_dict))
-                for r in itertools.islice(self, length - end_len, length))
+                str(dict(self[i].param_dict))
+                for i in range(length - end_len, length))
         return '\n'.join(lines)
 
 
@@ -182,6 +208,12 @@ class _Unit(Sweep):
     def param_tuples(self) -> Iterator[Params]:
         yield ()
 
+    def _param_tuple_at(self, index: int) -> Params:
+        return ()
+
+    def _param_values_at(self, indices: np.ndarray) -> np.ndarray:
+        return np.zeros((len(indices), 0))
+
     def __repr__(self) -> str:
         return 'cirq.UnitSweep'
 
@@ -222,16 +254,29 @@ class Product(Sweep):
         return length
 
     def param_tuples(self) -> Iterator[Params]:
-        def _gen(factors):
-            if not factors:
-                yield ()
-            else:
-                first, rest = factors[0], factors[1:]
-                for first_values in first.param_tuples():
-                    for rest_values in _gen(rest):
-                        yield first_values + rest_values
-
-        return _gen(self.factors)
+        # Each factor is enumerated once, instead of once per point of the
+        # factors before it.
+        factor_values = [list(f.param_tuples()) for f in self.factors]
+        for values in itertools.product(*factor_values):
+            yield tuple(itertools.chain.from_iterable(values))
+
+    def _param_tuple_at(self, index: int) -> Params:
+        # The last factor varies fastest, so the index is a mixed radix number
+        # whose least significant digit indexes into the last factor.
+        values = []
+        for factor in reversed(self.factors):
+            index, digit = divmod(index, len(factor))
+            values.append(factor._param_tuple_at(digit))
+        return tuple(itertools.chain.from_iterable(reversed(values)))
+
+    def _param_values_at(self, indices: np.ndarray) -> np.ndarray:
+        columns = []
+        for factor in reversed(self.factors):
+            indices, digits = np.divmod(indices, len(factor))
+            columns.append(factor._param_values_at(digits))
+        if not columns:
+            return np.zeros((len(indices), 0))
+        return np.hstack(columns[::-1])
 
     def __repr__(self) -> str:
         factors_repr = ', '.join(repr(f) for f in self.factors)
@@ -287,6 +332,17 @@ class Zip(Sweep):
         for values in zip(*iters):
             yield sum(values, ())
 
+    def _param_tuple_at(self, index: int) -> Params:
+        return tuple(
+            itertools.chain.from_iterable(
+                sweep._param_tuple_at(index) for sweep in self.sweeps))
+
+    def _param_values_at(self, indices: np.ndarray) -> np.ndarray:
+        if not self.sweeps:
+            return np.zeros((len(indices), 0))
+        return np.hstack(
+            [sweep._param_values_at(indices) for sweep in self.sweeps])
+
     def __repr__(self) -> str:
         sweeps_repr = ', '.join(repr(s) for s in self.sweeps)
         return f'cirq.Zip({sweeps_repr})'
@@ -326,10 +382,16 @@ class SingleSweep(Sweep):
         for value in self._values():
             yield ((self.key, value),)
 
+    def _param_tuple_at(self, index: int) -> Params:
+        return ((self.key, self._value_at(index)),)
+
     @abc.abstractmethod
     def _values(self) -> Iterator[float]:
         pass
 
+    def _value_at(self, index: int) -> float:
+        return next(itertools.islice(self._values(), index, None))
+
 
 class Points(SingleSweep):
     """A simple sweep with explicitly supplied values."""
@@ -349,6 +411,13 @@ class Points(SingleSweep):
     def _values(self) -> Iterator[float]:
         return iter(self.points)
 
+    def _value_at(self, index: int) -> float:
+        return self.points[index]
+
+    def _param_values_at(self, indices: np.ndarray) -> np.ndarray:
+        points = np.asarray(self.points, dtype=float).reshape((-1,))
+        return points[indices].reshape((-1, 1))
+
     def __repr__(self) -> str:
         return f'cirq.Points({self.key!r}, {self.points!r})'
 
@@ -385,6 +454,20 @@ class Linspace(SingleSweep):
                 p = i / (self.length - 1)
                 yield self.start * (1 - p) + self.stop * p
 
+    def _value_at(self, index: int) -> float:
+        if self.length == 1:
+            return self.start
+        p = index / (self.length - 1)
+        return self.start * (1 - p) + self.stop * p
+
+    def _param_values_at(self, indices: np.ndarray) -> np.ndarray:
+        if self.length == 1:
+            values = np.full(len(indices), self.start, dtype=float)
+        else:
+            p = indices / (self.length - 1)
+            values = self.start * (1 - p) + self.stop * p
+        return values.reshape((-1, 1))
+
     def __repr__(self) -> str:
         return (f'cirq.Linspace({self.key!r}, start={self.start!r}, '
                 f'stop={self.stop!r}, length={self.length!r})')
@@ -428,10 +511,78 @@ class ListSweep(Sweep):
         for r in self.resolver_list:
             yield tuple(_params_without_symbols(r))
 
+    def _param_tuple_at(self, index: int) -> Params:
+        return tuple(_params_without_symbols(self.resolver_list[index]))
+
+    def _slice(self, indices: range) -> 'Sweep':
+        if not indices:
+            # An empty ListSweep would have no keys.
+            return super()._slice(indices)
+        return ListSweep([self.resolver_list[i] for i in indices])
+
     def __repr__(self) -> str:
         return f'cirq.ListSweep({self.resolver_list!r})'
 
 
+class SweepSlice(Sweep):
+    """The points of a sweep at a range of indices, e.g. `sweep[10:20]`.
+
+    Points are computed from the underlying sweep when needed, so slicing a
+    large sweep doesn't enumerate it. A slice is equal to the `ListSweep` of
+    its points, and to any other slice with the same points.
+    """
+
+    def __init__(self, sweep: Sweep, indices: range) -> None:
+        """Creates a slice of a sweep.
+
+        Args:
+            sweep: The sweep to take points from.
+            indices: The indices of the points of `sweep` in the slice, in
+                order. They must be in `range(len(sweep))`.
+        """
+        self.sweep = sweep
+        self.indices = indices
+
+    def __eq__(self, other):
+        if not isinstance(other, (SweepSlice, ListSweep)):
+            return NotImplemented
+        if (isinstance(other, SweepSlice) and self.sweep == other.sweep and
+                self.indices == other.indices):
+            return True
+        return len(self) == len(other) and list(self) == list(other)
+
+    @property
+    def keys(self) -> List[str]:
+        return self.sweep.keys
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def param_tuples(self) -> Iterator[Params]:
+        for i in self.indices:
+            yield self.sweep._param_tuple_at(i)
+
+    def _param_tuple_at(self, index: int) -> Params:
+        return self.sweep._param_tuple_at(self.indices[index])
+
+    def _param_values_at(self, indices: np.ndarray) -> np.ndarray:
+        r = self.indices
+        return self.sweep._param_values_at(r.start + r.step * indices)
+
+    def _slice(self, indices: range) -> 'Sweep':
+        r = self.indices
+        return SweepSlice(
+            self.sweep,
+            range(r.start + r.step * indices.start,
+                  r.start + r.step * indices.stop, r.step * indices.step))
+
+    def __repr__(self) -> str:
+        r = self.indices if self.indices else range(0)
+        # A negative stop means the range ends at index 0.
+        stop = None if r.stop < 0 else r.stop
+        return f'{self.sweep!r}[{r.start!r}:{stop!r}:{r.step!r}]'
+
+
 def _params_without_symbols(resolver: resolver.ParamResolver) -> Params:
     for sym, val in resolver.param_dict.items():
         if isinstance(sym, sympy.Symbol):
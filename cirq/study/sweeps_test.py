@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import numpy as np
 import pytest
 import sympy
 import cirq
@@ -134,6 +135,85 @@ def test_access_sweep():
     assert sixth_elem == cirq.ParamResolver({'a': 2, 'b': 5})
 
 
+@pytest.mark.parametrize('sweep', [
+    cirq.UnitSweep,
+    cirq.Linspace('a', 0, 1, 5),
+    cirq.Linspace('a', 2, 3, 1),
+    cirq.Points('a', [1, 5, 2]),
+    cirq.ListSweep([{'a': 1, 'b': 2}, {'a': 3, 'b': 4}]),
+    cirq.Points('a', [1, 2, 3]) * cirq.Linspace('b', 0, 1, 4),
+    cirq.Points('a', [1, 2, 3]) + cirq.Linspace('b', 0, 1, 4),
+    cirq.Points('a', [1, 2]) *
+    (cirq.Linspace('b', 0, 1, 3) + cirq.Points('c', [5, 6, 7])) *
+    cirq.UnitSweep,
+    cirq.Zip(),
+])
+def test_random_access_matches_iteration(sweep):
+    resolvers = list(sweep)
+    assert [sweep[i] for i in range(len(sweep))] == resolvers
+    assert [sweep[i - len(sweep)] for i in range(len(sweep))] == resolvers
+    expected = np.array([[r.value_of(k) for k in sweep.keys] for r in resolvers
+                        ]).reshape((len(sweep), len(sweep.keys)))
+    np.testing.assert_allclose(sweep.to_numpy(), expected)
+    for s in [slice(None), slice(1, None), slice(None, None, -2), slice(5, 0)]:
+        sliced = sweep[s]
+        assert list(sliced) == resolvers[s]
+        assert sliced == cirq.ListSweep(resolvers[s])
+        assert sliced.keys == sweep.keys
+        assert len(sliced) == len(resolvers[s])
+        np.testing.assert_allclose(sliced.to_numpy(),
+                                   expected[s].reshape(
+                                       (len(sliced), len(sweep.keys))))
+
+
+def test_slice_large_sweep_lazily():
+    sweep = (cirq.Linspace('a', 0, 1, 100) * cirq.Linspace('b', 0, 1, 100) *
+             cirq.Points('c', list(range(100))))
+    assert len(sweep) == 10**6
+    assert sweep[123456] == cirq.ParamResolver({
+        'a': 12 / 99,
+        'b': 34 / 99,
+        'c': 56
+    })
+
+    shard = sweep[500000:500010]
+    assert len(shard) == 10
+    assert shard[-1] == sweep[500009]
+    assert shard[::3][1] == sweep[500003]
+    np.testing.assert_allclose(shard.to_numpy()[:, 2], np.arange(10))
+    assert list(shard[::-1]) == list(shard)[::-1]
+
+
+def test_sweep_slice():
+    assert cirq.Points('a', [1, 2, 3])[::2] == cirq.ListSweep([{
+        'a': 1
+    }, {
+        'a': 3
+    }])
+    assert cirq.ListSweep([{'a': 1}, {'a': 2}])[1:] == cirq.ListSweep([{
+        'a': 2
+    }])
+    sweep = cirq.Points('a', [1, 2]) * cirq.Points('b', [3, 4])
+    assert isinstance(sweep[1:3], cirq.SweepSlice)
+    assert sweep[1:3] == sweep[1:3]
+    assert sweep[1:3] != sweep[1:4]
+    assert sweep[1:3] == cirq.ListSweep([{'a': 1, 'b': 4}, {'a': 2, 'b': 3}])
+    assert cirq.ListSweep([{'a': 1, 'b': 4}, {'a': 2, 'b': 3}]) == sweep[1:3]
+    assert sweep[1:3] == cirq.SweepSlice(sweep[::-1], range(2, 0, -1))
+    assert sweep[1:3] != cirq.Points('a', [1, 2])
+    assert sweep[1:3].keys == ['a', 'b']
+    cirq.testing.assert_equivalent_repr(sweep[1:3])
+    cirq.testing.assert_equivalent_repr(sweep[::-1])
+    cirq.testing.assert_equivalent_repr(sweep[3:0:-2])
+    cirq.testing.assert_equivalent_repr(sweep[2:1])
+
+    # Empty slices keep the keys of the sweep.
+    empty = cirq.ListSweep([{'a': 1, 'b': 2}])[1:]
+    assert empty.keys == ['a', 'b']
+    assert empty.to_numpy().shape == (0, 2)
+    assert empty == cirq.ListSweep([])
+
+
 @pytest.mark.parametrize('r_list', [
     [{
         'a': a,
@@ -14,7 +14,7 @@
 
 """Defines trial results."""
 
-from typing import (Any, Callable, Dict, Iterable, Optional, Sequence,
+from typing import (Any, Callable, Dict, Iterable, List, Optional, Sequence,
                     TYPE_CHECKING, Tuple, TypeVar, Union)
 
 import collections
@@ -22,7 +22,7 @@ import io
 import numpy as np
 import pandas as pd
 
-from cirq import value, ops
+from cirq import value, ops, protocols
 from cirq._compat import proper_repr
 from cirq.study import resolver
 
@@ -46,6 +46,22 @@ def _tuple_of_big_endian_int(bit_groups: Iterable[Any]) -> Tuple[int, ...]:
     return tuple(value.big_endian_bits_to_int(bits) for bits in bit_groups)
 
 
+def _big_endian_ints(bit_rows: np.ndarray) -> np.ndarray:
+    """Returns the big-endian integer of each row of a 2-D array of bits.
+
+    Nonzero entries count as 1s, as in `cirq.big_endian_bits_to_int`. The
+    result has dtype int64 for up to 63 bits per row, and holds Python
+    integers (object dtype) otherwise.
+    """
+    bits = np.asarray(bit_rows) != 0
+    n = bits.shape[1]
+    if n <= 63:
+        powers = np.left_shift(np.int64(1), np.arange(n - 1, -1, -1))
+        return bits.astype(np.int64).dot(powers)
+    powers = np.array([1 << i for i in range(n - 1, -1, -1)], dtype=object)
+    return bits.astype(object).dot(powers)
+
+
 def _bitstring(vals: Iterable[Any]) -> str:
     str_list = [str(int(v)) for v in vals]
     separator = '' if all(len(s) == 1 for s in str_list) else ' '
@@ -99,7 +115,20 @@ class TrialResult:
         """
         self.params = params
         self._data: Optional[pd.DataFrame] = None
-        self._measurements = measurements
+        self._measurements: Optional[Dict[str, np.ndarray]] = measurements
+        self._load_measurements: Optional[Callable[[], Dict[str, np.ndarray]]]
+        self._load_measurements = None
+
+    @classmethod
+    def _from_measurement_loader(
+            cls, params: resolver.ParamResolver,
+            load_measurements: Callable[[], Dict[str, np.ndarray]]
+    ) -> 'TrialResult':
+        """Returns a TrialResult whose measurements are loaded on first use."""
+        result = cls(params=params, measurements={})
+        result._measurements = None
+        result._load_measurements = load_measurements
+        return result
 
     @property
     def data(self) -> pd.DataFrame:
@@ -107,10 +136,10 @@ class TrialResult:
             # Convert to a DataFrame with columns as measurement keys, rows as
             # repetitions and a big endian integer for individual measurements.
             converted_dict = {}
-            for key, val in self._measurements.items():
-                converted_dict[key] = [
-                    value.big_endian_bits_to_int(m_vals) for m_vals in val
-                ]
+            for key, val in self.measurements.items():
+                ints = _big_endian_ints(val)
+                converted_dict[key] = (ints.tolist()
+                                       if ints.dtype == object else ints)
             # Note that when a numpy array is produced from this data frame,
             # Pandas will try to use np.int64 as dtype, but will upgrade to
             # object if any value is too large to fit.
@@ -136,11 +165,17 @@ class TrialResult:
 
     @property
     def measurements(self) -> Dict[str, np.ndarray]:
+        if self._measurements is None:
+            assert self._load_measurements is not None
+            self._measurements = self._load_measurements()
+            self._load_measurements = None
         return self._measurements
 
     @property
     def repetitions(self) -> int:
-        return self.data.shape[0]
+        if not self.measurements:
+            return 0
+        return next(iter(self.measurements.values())).shape[0]
 
     # Reason for 'type: ignore': https://github.com/python/mypy/issues/5273
     def multi_measurement_histogram(  # type: ignore
@@ -194,6 +229,20 @@ class TrialResult:
             results.
         """
         fixed_keys = tuple(_key_to_str(key) for key in keys)
+        if (fold_func is _tuple_of_big_endian_int and fixed_keys and
+                self.repetitions):
+            columns = [
+                _big_endian_ints(self.measurements[key]) for key in fixed_keys
+            ]
+            if all(column.dtype == np.int64 for column in columns):
+                rows, counts = np.unique(np.stack(columns, axis=1),
+                                         axis=0,
+                                         return_counts=True)
+                return collections.Counter(
+                    dict(zip(map(tuple, rows.tolist()), counts.tolist())))
+            return collections.Counter(
+                zip(*(column.tolist() for column in columns)))
+
         samples = zip(*(self.measurements[sub_key]
                         for sub_key in fixed_keys))  # type: Iterable[Any]
         if len(fixed_keys) == 0:
@@ -246,9 +295,35 @@ class TrialResult:
             A counter indicating how often a measurement sampled various
             results.
         """
+        if fold_func is value.big_endian_bits_to_int:
+            results, counts = self.histogram_counts(key=key)
+            return collections.Counter(dict(zip(results.tolist(),
+                                                counts.tolist())))
         return self.multi_measurement_histogram(
             keys=[key], fold_func=lambda e: fold_func(e[0]))
 
+    def histogram_counts(self, *, key: TMeasurementKey
+                        ) -> Tuple[np.ndarray, np.ndarray]:
+        """Counts the number of times each result of a measurement occurred.
+
+        This is an array version of `histogram` without a `fold_func`.
+
+        Args:
+            key: Key of the measurement to count the results of.
+
+        Returns:
+            A tuple (results, counts) of arrays. `results` holds the distinct
+            results sampled by the measurement, as big endian integers in
+            ascending order, and `counts` holds how often each occurred.
+        """
+        ints = _big_endian_ints(self.measurements[_key_to_str(key)])
+        if ints.dtype == object:
+            counter = collections.Counter(ints.tolist())
+            results = sorted(counter)
+            return (np.array(results, dtype=object),
+                    np.array([counter[r] for r in results], dtype=np.int64))
+        return np.unique(ints, return_counts=True)
+
     def __repr__(self) -> str:
 
         def item_repr(entry):
@@ -298,23 +373,28 @@ class TrialResult:
         return TrialResult(params=self.params, measurements=all_measurements)
 
     def _json_dict_(self):
-        packed_measurements = {}
-        for key, digits in self.measurements.items():
-            packed_digits, binary = _pack_digits(digits)
-            packed_measurements[key] = {
-                'packed_digits': packed_digits,
-                'binary': binary,
-                'dtype': digits.dtype.name,
-                'shape': digits.shape
-            }
         return {
             'cirq_type': self.__class__.__name__,
             'params': self.params,
-            'measurements': packed_measurements
+            'measurements': {
+                key: _digits_json_dict(digits)
+                for key, digits in self.measurements.items()
+            }
         }
 
     @classmethod
     def _from_json_dict_(cls, params, measurements, **kwargs):
+        if any('offset' in val for val in measurements.values()):
+            # Measurements stored in a binary file are only unpacked when used.
+            stored = {
+                key: (protocols.read_binary(val['offset'], val['size']), val)
+                for key, val in measurements.items()
+            }
+            return cls._from_measurement_loader(
+                params, lambda: {
+                    key: _unpack_stored_digits(data, **val)
+                    for key, (data, val) in stored.items()
+                })
         return cls(
             params=params,
             measurements={
@@ -322,11 +402,275 @@ class TrialResult:
             })
 
 
+class CountsTrialResult(TrialResult):
+    """The results of executions of a circuit, stored as counts.
+
+    Instead of one row per repetition, each distinct combination of
+    measurement results is stored once together with how often it occurred.
+    Measurements with binary results are kept bit-packed. The per-repetition
+    `measurements` and `data` are only built when accessed, with the
+    repetitions of each combination of results next to each other.
+
+    Attributes:
+        params: A ParamResolver of settings used when sampling result.
+    """
+
+    def __init__(
+            self,
+            *,  # Forces keyword args.
+            params: resolver.ParamResolver,
+            records: Dict[str, np.ndarray],
+            counts: Sequence[int]) -> None:
+        """
+        Args:
+            params: A ParamResolver of settings used for this result.
+            records: A dictionary from measurement gate key to measurement
+                results. The value for each key is a 2-D array, with the first
+                index running over combinations of results and the second
+                index running over the qubits for the corresponding
+                measurements. The rows of all keys line up.
+            counts: How often each combination of results occurred. Repeated
+                combinations are merged.
+        """
+        self.params = params
+        self._data: Optional[pd.DataFrame] = None
+        self._measurements: Optional[Dict[str, np.ndarray]] = None
+
+        rows = {key: np.asarray(val) for key, val in records.items()}
+        counts = np.asarray(counts, dtype=np.int64)
+        self._widths = {key: val.shape[1] for key, val in rows.items()}
+        self._dtypes = {key: val.dtype for key, val in rows.items()}
+        self._binary = {
+            key: val.dtype == np.bool_ or bool(np.all((val == 0) | (val == 1)))
+            for key, val in rows.items()
+        }
+        encoded = [
+            np.packbits(val != 0, axis=1)
+            if self._binary[key] else np.ascontiguousarray(val).view(
+                np.uint8).reshape(len(val), -1) for key, val in rows.items()
+        ]
+        joined = (np.concatenate(encoded, axis=1)
+                  if encoded else np.zeros((len(counts), 0), dtype=np.uint8))
+        if joined.shape[1] == 0 or len(counts) == 0:
+            index = np.arange(min(len(counts), 1))
+            inverse = np.zeros(len(counts), dtype=np.int64)
+        else:
+            _, index, inverse = np.unique(joined,
+                                          axis=0,
+                                          return_index=True,
+                                          return_inverse=True)
+        merged = np.bincount(inverse.ravel(),
+                             weights=counts,
+                             minlength=len(index)).astype(np.int64)
+        index = index[merged > 0]
+        self._counts = merged[merged > 0]
+        self._records = {
+            key: (np.packbits(val != 0, axis=1)
+                  if self._binary[key] else val)[index]
+            for key, val in rows.items()
+        }
+
+    @classmethod
+    def from_trial_result(cls, result: 'cirq.TrialResult'
+                         ) -> 'cirq.CountsTrialResult':
+        """Returns the counts of the results in a `cirq.TrialResult`."""
+        if isinstance(result, CountsTrialResult):
+            return result
+        return cls(params=result.params,
+                   records=result.measurements,
+                   counts=np.ones(result.repetitions, dtype=np.int64))
+
+    @property
+    def records(self) -> Dict[str, np.ndarray]:
+        """The distinct combinations of results of each measurement.
+
+        Rows of all keys line up with each other and with `counts`.
+        """
+        return {key: self._record(key) for key in self._records}
+
+    def _record(self, key: str) -> np.ndarray:
+        record = self._records[key]
+        if not self._binary[key]:
+            return record
+        bits = np.unpackbits(record, axis=1)[:, :self._widths[key]]
+        return bits.astype(self._dtypes[key])
+
+    @property
+    def counts(self) -> np.ndarray:
+        """How often each combination of results in `records` occurred."""
+        return self._counts
+
+    @property
+    def measurements(self) -> Dict[str, np.ndarray]:
+        if self._measurements is None:
+            self._measurements = {
+                key: np.repeat(val, self._counts, axis=0)
+                for key, val in self.records.items()
+            }
+        return self._measurements
+
+    @property
+    def repetitions(self) -> int:
+        return int(self._counts.sum())
+
+    # Reason for 'type: ignore': https://github.com/python/mypy/issues/5273
+    def multi_measurement_histogram(  # type: ignore
+            self,
+            *,  # Forces keyword args.
+            keys: Iterable[TMeasurementKey],
+            fold_func: Callable[[Tuple], T] = _tuple_of_big_endian_int
+    ) -> collections.Counter:
+        fixed_keys = tuple(_key_to_str(key) for key in keys)
+        records = [self._record(key) for key in fixed_keys]
+        if fold_func is _tuple_of_big_endian_int:
+            samples = zip(*(_big_endian_ints(r).tolist() for r in records))
+            if not fixed_keys:
+                samples = [()] * len(self._counts)  # type: ignore
+            folded = list(samples)  # type: List[Any]
+        else:
+            folded = [
+                fold_func(tuple(r[i] for r in records))
+                for i in range(len(self._counts))
+            ]
+        c = collections.Counter()  # type: collections.Counter
+        for result, count in zip(folded, self._counts.tolist()):
+            c[result] += count
+        return c
+
+    def histogram_counts(self, *, key: TMeasurementKey
+                        ) -> Tuple[np.ndarray, np.ndarray]:
+        ints = _big_endian_ints(self._record(_key_to_str(key)))
+        if ints.dtype == object:
+            counter = collections.Counter()  # type: collections.Counter
+            for result, count in zip(ints.tolist(), self._counts.tolist()):
+                counter[result] += count
+            results = sorted(counter)
+            return (np.array(results, dtype=object),
+                    np.array([counter[r] for r in results], dtype=np.int64))
+        results, inverse = np.unique(ints, return_inverse=True)
+        counts = np.bincount(inverse, weights=self._counts,
+                             minlength=len(results)).astype(np.int64)
+        return results, counts
+
+    def _counts_by_result(self) -> Dict[Tuple, int]:
+        records = self.records
+        keys = sorted(records)
+        return {
+            tuple(tuple(records[key][i].tolist()) for key in keys): count
+            for i, count in enumerate(self._counts.tolist())
+        }
+
+    def __eq__(self, other):
+        if not isinstance(other, CountsTrialResult):
+            return NotImplemented
+        return (self.params == other.params and
+                self._measurement_shape() == other._measurement_shape() and
+                self._counts_by_result() == other._counts_by_result())
+
+    def _measurement_shape(self):
+        return self.params, dict(self._widths)
+
+    def __add__(self, other: 'cirq.TrialResult') -> 'cirq.CountsTrialResult':
+        if not isinstance(other, TrialResult):
+            return NotImplemented
+        other = CountsTrialResult.from_trial_result(other)
+        if self._measurement_shape() != other._measurement_shape():
+            raise ValueError(
+                'TrialResults do not have the same parameters or do '
+                'not have the same measurement keys.')
+        self_records = self.records
+        other_records = other.records
+        return CountsTrialResult(
+            params=self.params,
+            records={
+                key: np.append(self_records[key], other_records[key], axis=0)
+                for key in self_records
+            },
+            counts=np.append(self._counts, other._counts))
+
+    def __repr__(self) -> str:
+        records_repr = '{' + ', '.join(
+            f'{key!r}: {proper_repr(val)}'
+            for key, val in self.records.items()) + '}'
+        return (f'cirq.CountsTrialResult(params={self.params!r}, '
+                f'records={records_repr}, '
+                f'counts={self._counts.tolist()!r})')
+
+    def _json_dict_(self):
+        stored_counts = protocols.write_binary(self._counts)
+        return {
+            'cirq_type': self.__class__.__name__,
+            'params': self.params,
+            'records': {
+                key: _digits_json_dict(digits)
+                for key, digits in self.records.items()
+            },
+            'counts': (self._counts.tolist()
+                       if stored_counts is None else stored_counts),
+        }
+
+    @classmethod
+    def _from_json_dict_(cls, params, records, counts, **kwargs):
+        if isinstance(counts, dict):
+            counts = protocols.read_binary(**counts).view(np.int64)
+        return cls(params=params,
+                   records={
+                       key: _digits_from_json_dict(val)
+                       for key, val in records.items()
+                   },
+                   counts=counts)
+
+
+def _digits_json_dict(digits: np.ndarray) -> Dict[str, Any]:
+    """Returns the JSON dictionary of an array of measured digits.
+
+    The digits go to the binary file of the running `cirq.to_json` call if it
+    has one, and are packed into a hex string otherwise.
+    """
+    binary = _is_binary(digits)
+    stored = protocols.write_binary(
+        np.packbits(digits) if binary else digits)
+    if stored is None:
+        packed_digits, binary = _pack_digits(digits)
+        return {
+            'packed_digits': packed_digits,
+            'binary': binary,
+            'dtype': digits.dtype.name,
+            'shape': digits.shape
+        }
+    return {
+        **stored,
+        'binary': binary,
+        'dtype': digits.dtype.name,
+        'shape': digits.shape
+    }
+
+
+def _digits_from_json_dict(val: Dict[str, Any]) -> np.ndarray:
+    if 'offset' in val:
+        return _unpack_stored_digits(
+            protocols.read_binary(val['offset'], val['size']), **val)
+    return _unpack_digits(**val)
+
+
+def _unpack_stored_digits(data: np.ndarray, binary: bool, dtype: str,
+                          shape: Sequence[int], **kwargs) -> np.ndarray:
+    """Returns digits stored by `_digits_json_dict` in a binary file."""
+    if binary:
+        bits = np.unpackbits(data)
+        return bits[:np.prod(shape)].reshape(shape).astype(dtype)
+    return data.view(dtype).reshape(shape)
+
+
+def _is_binary(digits: np.ndarray) -> bool:
+    return np.array_equal(digits, digits.astype(np.bool_))
+
+
 def _pack_digits(digits: np.ndarray) -> Tuple[str, bool]:
     """Returns a string of packed digits and a boolean indicating whether the
     digits were packed as binary values."""
     # If digits are binary, pack them better to save space
-    if np.array_equal(digits, digits.astype(np.bool)):
+    if _is_binary(digits):
         return _pack_bits(digits), True
     buffer = io.BytesIO()
     np.save(buffer, digits, allow_pickle=False)
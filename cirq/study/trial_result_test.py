@@ -151,6 +151,57 @@ def test_multi_measurement_histogram():
     })
 
 
+def test_histogram_counts():
+    result = cirq.TrialResult.from_single_parameter_set(
+        params=cirq.ParamResolver({}),
+        measurements={
+            'ab': np.array([[0, 1], [0, 1], [0, 1], [1, 0], [0, 1]],
+                           dtype=np.bool_),
+        })
+    results, counts = result.histogram_counts(key='ab')
+    np.testing.assert_array_equal(results, [1, 2])
+    np.testing.assert_array_equal(counts, [4, 1])
+
+
+def test_histograms_of_wide_measurements():
+    bits = np.zeros((3, 70), dtype=np.bool_)
+    bits[0, 0] = True
+    bits[1, -1] = True
+    bits[2, 0] = True
+    result = cirq.TrialResult.from_single_parameter_set(
+        params=cirq.ParamResolver({}),
+        measurements={
+            'wide': bits,
+            'c': np.array([[0], [1], [1]], dtype=np.bool_)
+        })
+
+    assert result.histogram(key='wide') == collections.Counter({
+        1 << 69: 2,
+        1: 1
+    })
+    assert result.multi_measurement_histogram(
+        keys=['wide', 'c']) == collections.Counter({
+            (1 << 69, 0): 1,
+            (1 << 69, 1): 1,
+            (1, 1): 1,
+        })
+    results, counts = result.histogram_counts(key='wide')
+    assert results.tolist() == [1, 1 << 69]
+    assert counts.tolist() == [1, 2]
+
+
+def test_histograms_without_repetitions():
+    result = cirq.TrialResult.from_single_parameter_set(
+        params=cirq.ParamResolver({}),
+        measurements={'ab': np.zeros((0, 2), dtype=np.bool_)})
+    assert result.repetitions == 0
+    assert result.histogram(key='ab') == collections.Counter()
+    assert result.multi_measurement_histogram(
+        keys=['ab']) == collections.Counter()
+    assert cirq.TrialResult(params=cirq.ParamResolver({}),
+                            measurements={}).repetitions == 0
+
+
 def test_trial_result_equality():
     et = cirq.testing.EqualsTester()
     et.add_equality_group(
@@ -288,3 +339,120 @@ def test_json_bit_packing_and_dtype():
     assert loaded_bits_result.measurements['m'].dtype == np.uint8
     assert loaded_digits_result.measurements['m'].dtype == np.uint8
     np.testing.assert_allclose(len(bits_json), len(digits_json) / 8, rtol=0.02)
+
+
+def test_counts_trial_result():
+    measurements = {
+        'ab': np.array([[0, 1], [0, 1], [0, 1], [1, 0], [0, 1]],
+                       dtype=np.bool_),
+        'c': np.array([[0], [0], [1], [0], [1]], dtype=np.bool_),
+        'd': np.array([[2], [2], [0], [2], [0]], dtype=np.int8),
+    }
+    full = cirq.TrialResult(params=cirq.ParamResolver({}),
+                            measurements=measurements)
+    result = cirq.CountsTrialResult.from_trial_result(full)
+    assert cirq.CountsTrialResult.from_trial_result(result) is result
+
+    assert result.repetitions == 5
+    assert result.counts.tolist() == [2, 2, 1]
+    records = result.records
+    np.testing.assert_array_equal(records['ab'], [[0, 1], [0, 1], [1, 0]])
+    assert records['ab'].dtype == np.bool_
+    np.testing.assert_array_equal(records['d'], [[2], [0], [2]])
+    assert records['d'].dtype == np.int8
+
+    for key in ['ab', 'c', 'd']:
+        assert result.histogram(key=key) == full.histogram(key=key)
+        for actual, expected in zip(result.histogram_counts(key=key),
+                                    full.histogram_counts(key=key)):
+            np.testing.assert_array_equal(actual, expected)
+    for keys in [[], ['ab'], ['ab', 'c'], ['d', 'c']]:
+        assert result.multi_measurement_histogram(
+            keys=keys) == full.multi_measurement_histogram(keys=keys)
+        assert result.multi_measurement_histogram(
+            keys=keys, fold_func=str) == full.multi_measurement_histogram(
+                keys=keys, fold_func=str)
+
+    # Per-repetition results are grouped by combination of results.
+    assert sorted(result.data.itertuples(index=False)) == sorted(
+        full.data.itertuples(index=False))
+    np.testing.assert_array_equal(result.measurements['c'],
+                                  [[0], [0], [1], [1], [0]])
+
+
+def test_counts_trial_result_merges_repeated_records():
+    a = cirq.CountsTrialResult(params=cirq.ParamResolver({}),
+                               records={'m': np.array([[1], [0], [1], [1]])},
+                               counts=[2, 3, 0, 1])
+    assert a.repetitions == 6
+    assert a.histogram(key='m') == collections.Counter({0: 3, 1: 3})
+    assert len(a.counts) == 2
+
+    b = cirq.CountsTrialResult(params=cirq.ParamResolver({}),
+                               records={'m': np.array([[0], [1]])},
+                               counts=[3, 3])
+    c = cirq.CountsTrialResult(params=cirq.ParamResolver({}),
+                               records={'m': np.array([[0]])},
+                               counts=[6])
+    d = cirq.CountsTrialResult(params=cirq.ParamResolver({'a': 1}),
+                               records={'m': np.array([[0], [1]])},
+                               counts=[3, 3])
+    e = cirq.CountsTrialResult(params=cirq.ParamResolver({}),
+                               records={},
+                               counts=[6])
+    assert e.multi_measurement_histogram(keys=[]) == collections.Counter(
+        {(): 6})
+    eq = cirq.testing.EqualsTester()
+    eq.add_equality_group(a, b)
+    eq.add_equality_group(c)
+    eq.add_equality_group(d)
+    eq.add_equality_group(e)
+
+
+def test_counts_trial_result_addition():
+    a = cirq.CountsTrialResult(params=cirq.ParamResolver({}),
+                               records={'m': np.array([[0, 1], [1, 1]])},
+                               counts=[1, 2])
+    b = cirq.TrialResult(params=cirq.ParamResolver({}),
+                         measurements={'m': np.array([[1, 1], [0, 0]])})
+    total = a + b
+    assert isinstance(total, cirq.CountsTrialResult)
+    assert total.histogram(key='m') == collections.Counter({
+        0: 1,
+        1: 1,
+        3: 3
+    })
+
+    with pytest.raises(ValueError):
+        _ = a + cirq.TrialResult(params=cirq.ParamResolver({}),
+                                 measurements={'m': np.array([[1]])})
+    with pytest.raises(TypeError):
+        _ = a + 'junk'
+
+
+def test_counts_trial_result_repr_and_json():
+    result = cirq.CountsTrialResult(
+        params=cirq.ParamResolver({'a': 2}),
+        records={
+            'm': np.array([[1, 0], [0, 1]], dtype=np.bool_),
+            'q': np.array([[3], [1]], dtype=np.int32),
+        },
+        counts=[10, 20])
+    cirq.testing.assert_equivalent_repr(result)
+    assert cirq.read_json(json_text=cirq.to_json(result)) == result
+
+
+def test_measurements_in_binary_file_are_loaded_lazily(tmpdir):
+    json_path = f'{tmpdir}/result.json'
+    binary_path = f'{tmpdir}/result.bin'
+    result = cirq.TrialResult(
+        params=cirq.ParamResolver({}),
+        measurements={'m': np.array([[1, 0], [0, 1], [1, 1]], dtype=np.bool_)})
+    cirq.to_json(result, json_path, binary_file=binary_path)
+
+    loaded = cirq.read_json(json_path, binary_file=binary_path)
+    assert loaded._measurements is None
+    assert loaded.histogram(key='m') == collections.Counter({1: 1, 2: 1, 3: 1})
+    np.testing.assert_array_equal(loaded.measurements['m'],
+                                  result.measurements['m'])
+    assert loaded.measurements['m'].dtype == np.bool_
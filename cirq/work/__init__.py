@@ -6,5 +6,7 @@ from cirq.work.pauli_sum_collector import (
     PauliSumCollector,)
 from cirq.work.sampler import (
     Sampler,)
+from cirq.work.sharded_sampler import (
+    ShardedSampler,)
 from cirq.work.zeros_sampler import (
     ZerosSampler,)
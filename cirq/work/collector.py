@@ -12,14 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Iterable, List, Optional, TYPE_CHECKING, Union
+from typing import (Any, Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING,
+                    Union)
 import abc
 import asyncio
 
 import numpy as np
 
 from cirq import circuits, study, value
-from cirq.work import work_pool
+from cirq.work import sampler as work_sampler, work_pool
 
 if TYPE_CHECKING:
     import cirq
@@ -143,6 +144,13 @@ class Collector(metaclass=abc.ABCMeta):
                             max_total_samples: Optional[int] = None) -> None:
         """Asynchronously collects needed samples from a sampler.
 
+        When the queue of jobs is empty, `next_job` is called once per free
+        slot in the pool. Jobs given in the same round that sample the same
+        circuit are run together, with their repetitions summed, and the
+        result is split back into one result per job. If the sampler overrides
+        `cirq.Sampler.run_batch`, queued jobs with distinct circuits but the
+        same number of repetitions are also sent to it as a single batch.
+
         Examples:
 
             ```
@@ -167,37 +175,152 @@ class Collector(metaclass=abc.ABCMeta):
             https://docs.python.org/3/library/asyncio-task.html
         """
         pool = work_pool.CompletionOrderedAsyncWorkPool()
-        queued_jobs: List[CircuitSampleJob] = []
+        queue = _JobQueue()
         remaining_samples = (np.infty if max_total_samples is None else
                              max_total_samples)
-
-        async def _start_async_job(job):
-            return job, await sampler.run_async(job.circuit,
-                                                repetitions=job.repetitions)
+        batch_natively = _overrides_run_batch(sampler)
+
+        async def _start_async_jobs(groups):
+            # All the groups of a batch have the same total repetitions.
+            repetitions = sum(job.repetitions for job in groups[0])
+            if len(groups) == 1:
+                results = [
+                    await sampler.run_async(groups[0][0].circuit,
+                                            repetitions=repetitions)
+                ]
+            else:
+                batch = await sampler.run_batch_async(
+                    [group[0].circuit for group in groups],
+                    repetitions=repetitions)
+                results = [sweep_results[0] for sweep_results in batch]
+            return [(job, job_result)
+                    for group, result in zip(groups, results)
+                    for job, job_result in zip(group, _split_result(group,
+                                                                    result))]
 
         # Keep dispatching and processing work.
         while True:
             # Fill up the work pool.
             while remaining_samples > 0 and pool.num_uncollected < concurrency:
-                if not queued_jobs:
-                    queued_jobs.extend(_flatten_jobs(self.next_job()))
+                if not queue.groups:
+                    # Ask for one job (tree) per free slot. Jobs given in the
+                    # same round that sample the same circuit run together.
+                    requested = 0
+                    for _ in range(concurrency - pool.num_uncollected):
+                        if requested >= remaining_samples:
+                            break
+                        jobs = _flatten_jobs(self.next_job())
+                        if not jobs:
+                            break
+                        for job in jobs:
+                            queue.add(job)
+                            requested += job.repetitions
 
                 # If no jobs were given, stop asking until something completes.
-                if not queued_jobs:
+                if not queue.groups:
                     break
 
-                # Start new sampling job.
-                new_job = queued_jobs.pop(0)
-                remaining_samples -= new_job.repetitions
-                pool.include_work(_start_async_job(new_job))
+                # Start new sampling job, covering all queued jobs that sample
+                # the same circuit.
+                new_group = []
+                for job in queue.pop(queue.groups[0]):
+                    if remaining_samples <= 0:
+                        break
+                    remaining_samples -= job.repetitions
+                    new_group.append(job)
+                new_groups = [new_group]
+
+                # Add other circuits needing the same repetitions to the run.
+                if batch_natively:
+                    total = sum(job.repetitions for job in new_group)
+                    for group in list(queue.groups):
+                        if (remaining_samples >= total and
+                                sum(job.repetitions for job in group) == total):
+                            remaining_samples -= total
+                            new_groups.append(queue.pop(group))
+
+                pool.include_work(_start_async_jobs(new_groups))
 
             # If no jobs were started or running, we're in a steady state. Halt.
             if not pool.num_uncollected:
                 break
 
-            # Forward next job result from pool.
-            done_job, done_val = await pool.__anext__()
-            self.on_job_result(done_job, done_val)
+            # Forward next job results from pool.
+            for done_job, done_val in await pool.__anext__():
+                self.on_job_result(done_job, done_val)
+
+
+def _overrides_run_batch(sampler: 'cirq.Sampler') -> bool:
+    """Determines if a sampler does better than one `run_sweep` per circuit."""
+    return (getattr(type(sampler), 'run_batch', None) is not
+            work_sampler.Sampler.run_batch)
+
+
+class _JobQueue:
+    """Queued jobs, in groups of jobs sampling the same circuit."""
+
+    def __init__(self):
+        self.groups: List[List[CircuitSampleJob]] = []
+        # The queued groups by the moments of their circuit, or by None if the
+        # moments aren't hashable.
+        self._groups_by_moments: Dict[Any, List[List[CircuitSampleJob]]] = {}
+
+    def add(self, job: CircuitSampleJob) -> None:
+        """Adds a job to the group of queued jobs sampling its circuit."""
+        candidates = self._groups_by_moments.setdefault(
+            _moments_key(job.circuit), [])
+        for group in candidates:
+            if group[0].circuit == job.circuit:
+                group.append(job)
+                break
+        else:
+            candidates.append([job])
+            self.groups.append(candidates[-1])
+
+    def pop(self, group: List[CircuitSampleJob]) -> List[CircuitSampleJob]:
+        """Removes a group from the queue, and returns it."""
+        _remove_identical(self.groups, group)
+        key = _moments_key(group[0].circuit)
+        _remove_identical(self._groups_by_moments[key], group)
+        if not self._groups_by_moments[key]:
+            del self._groups_by_moments[key]
+        return group
+
+
+def _remove_identical(items: List[Any], item: Any) -> None:
+    """Removes an item from a list, without comparing items for equality."""
+    del items[next(i for i, other in enumerate(items) if other is item)]
+
+
+def _moments_key(circuit: 'cirq.Circuit'
+                ) -> Optional[Tuple['cirq.Moment', ...]]:
+    """Returns the moments of a circuit if they are hashable, else None."""
+    moments = tuple(circuit)
+    try:
+        hash(moments)
+    except TypeError:
+        return None
+    return moments
+
+
+def _split_result(jobs: List[CircuitSampleJob],
+                  result: study.TrialResult) -> List[study.TrialResult]:
+    """Splits the result of a coalesced run into one result per job."""
+    if len(jobs) == 1:
+        return [result]
+    measurements = result.measurements
+    out = []
+    start = 0
+    for job in jobs:
+        end = start + job.repetitions
+        out.append(
+            study.TrialResult(params=result.params,
+                              measurements={
+                                  key: val[start:end]
+                                  for key, val in measurements.items()
+                              }))
+        start = end
+    return out
 
 
 def _flatten_jobs(given: Optional[CIRCUIT_SAMPLE_JOB_TREE]
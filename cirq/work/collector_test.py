@@ -140,3 +140,146 @@ def test_flatten_jobs_terminate_from_collector():
 
     TestCollector().collect(sampler=cirq.Simulator(), concurrency=5)
     assert received == ['test'] * 2
+
+
+class _RecordingSampler(cirq.Sampler):
+
+    def __init__(self):
+        self.runs = []
+        self.batches = []
+
+    def run_sweep(self, program, params, repetitions=1):
+        self.runs.append((program, repetitions))
+        return cirq.ZerosSampler().run_sweep(program, params, repetitions)
+
+
+def test_collect_coalesces_jobs_with_same_circuit():
+    q = cirq.LineQubit(0)
+    circuit1 = cirq.Circuit(cirq.H(q), cirq.measure(q, key='a'))
+    circuit2 = cirq.Circuit(cirq.X(q), cirq.measure(q, key='b'))
+    received = []
+    sent = False
+
+    class TestCollector(cirq.Collector):
+
+        def next_job(self):
+            nonlocal sent
+            if sent:
+                return None
+            sent = True
+            return [
+                cirq.CircuitSampleJob(circuit1, repetitions=3, tag=1),
+                cirq.CircuitSampleJob(circuit2, repetitions=5, tag=2),
+                cirq.CircuitSampleJob(circuit1.copy(), repetitions=4, tag=3),
+            ]
+
+        def on_job_result(self, job, result):
+            received.append((job.tag, result.repetitions))
+
+    sampler = _RecordingSampler()
+    TestCollector().collect(sampler=sampler, concurrency=5)
+    assert sorted(received) == [(1, 3), (2, 5), (3, 4)]
+    assert sorted((str(c), r) for c, r in sampler.runs) == sorted([
+        (str(circuit1), 7),
+        (str(circuit2), 5),
+    ])
+
+
+def test_collect_coalesces_jobs_given_in_the_same_round():
+    a, b = cirq.LineQubit.range(2)
+    collector = cirq.PauliSumCollector(circuit=cirq.Circuit(cirq.H(a)),
+                                       observable=cirq.X(a) + cirq.Z(b),
+                                       samples_per_term=1000,
+                                       max_samples_per_job=100)
+    sampler = _RecordingSampler()
+    collector.collect(sampler=sampler, concurrency=5)
+    assert sum(r for _, r in sampler.runs) == 2000
+    assert len(sampler.runs) < 20
+    assert collector.estimated_energy() == 2
+
+
+def test_collect_asks_for_jobs_once_per_free_slot():
+    q = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.measure(q))
+
+    class TestCollector(cirq.Collector):
+
+        def __init__(self):
+            self.calls = 0
+            self.samples = 0
+
+        def next_job(self):
+            self.calls += 1
+            if self.samples >= 100:
+                return None
+            return cirq.CircuitSampleJob(circuit, repetitions=10, tag=None)
+
+        def on_job_result(self, job, result):
+            self.samples += result.repetitions
+
+    collector = TestCollector()
+    collector.collect(sampler=cirq.ZerosSampler(), concurrency=2)
+    assert 100 <= collector.samples <= 120
+    assert collector.calls <= 20
+
+
+def test_collect_coalescing_respects_max_total_samples():
+    q = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.measure(q))
+
+    class TestCollector(cirq.Collector):
+
+        def next_job(self):
+            return [
+                cirq.CircuitSampleJob(circuit, repetitions=10, tag=i)
+                for i in range(5)
+            ]
+
+        def on_job_result(self, job, result):
+            pass
+
+    sampler = _RecordingSampler()
+    TestCollector().collect(sampler=sampler,
+                            concurrency=5,
+                            max_total_samples=25)
+    assert [r for _, r in sampler.runs] == [30]
+
+
+def test_collect_batches_distinct_circuits():
+    qs = cirq.LineQubit.range(3)
+    circuits = [cirq.Circuit(cirq.measure(q, key='m')) for q in qs]
+    received = []
+    sent = False
+
+    class BatchingSampler(_RecordingSampler):
+
+        def run_batch(self, programs, params_list=None, repetitions=1):
+            self.batches.append((len(programs), repetitions))
+            return [
+                self.run_sweep(program, None, repetitions)
+                for program in programs
+            ]
+
+    class TestCollector(cirq.Collector):
+
+        def next_job(self):
+            nonlocal sent
+            if sent:
+                return None
+            sent = True
+            return [
+                cirq.CircuitSampleJob(circuits[0], repetitions=2, tag='a'),
+                cirq.CircuitSampleJob(circuits[1], repetitions=4, tag='b'),
+                cirq.CircuitSampleJob(circuits[0], repetitions=2, tag='c'),
+                cirq.CircuitSampleJob(circuits[2], repetitions=4, tag='d'),
+            ]
+
+        def on_job_result(self, job, result):
+            assert result.measurements['m'].shape == (job.repetitions, 1)
+            received.append(job.tag)
+
+    sampler = BatchingSampler()
+    TestCollector().collect(sampler=sampler, concurrency=5)
+    assert sorted(received) == ['a', 'b', 'c', 'd']
+    assert sampler.batches == [(3, 4)]
+    assert len(sampler.runs) == 3
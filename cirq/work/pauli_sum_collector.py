@@ -13,7 +13,8 @@
 # limitations under the License.
 
 import collections
-from typing import cast, Dict, Optional, Union, TYPE_CHECKING
+from typing import (cast, Dict, List, Optional, Sequence, Tuple, Union,
+                    TYPE_CHECKING)
 
 import numpy as np
 
@@ -25,14 +26,30 @@ if TYPE_CHECKING:
 
 
 class PauliSumCollector(collector.Collector):
-    """Estimates the energy of a linear combination of Pauli observables."""
+    """Estimates the energy of a linear combination of Pauli observables.
+
+    By default, every PauliString term is measured separately with the same
+    number of samples. If a `target_std_error` is given, the collector instead
+    works adaptively:
+
+    - Terms that commute qubit-wise (i.e. act with the same Pauli on every
+      qubit they share) are grouped, and each group is measured with a single
+      circuit.
+    - After `samples_per_term` initial samples of each group, the remaining
+      samples are allocated to the groups in proportion to the standard
+      deviation of their summed, coefficient weighted, observed values. For a
+      group with a single term this is |coefficient|·σ.
+    - The collector stops asking for samples once the estimated standard
+      error of `estimated_energy` is at most `target_std_error`.
+    """
 
     def __init__(self,
                  circuit: 'cirq.Circuit',
                  observable: 'cirq.PauliSumLike',
                  *,
                  samples_per_term: int,
-                 max_samples_per_job: int = 1000000):
+                 max_samples_per_job: int = 1000000,
+                 target_std_error: Optional[float] = None):
         """
         Args:
             circuit: Produces the state to be tested.
@@ -41,9 +58,21 @@ class PauliSumCollector(collector.Collector):
                 dictionary weights, and then added up to produce the final
                 result.
             samples_per_term: The number of samples to collect for each
-                PauliString term in order to estimate its expectation.
+                PauliString term in order to estimate its expectation. In
+                adaptive mode, the number of samples first collected for each
+                group of qubit-wise commuting terms, in order to estimate its
+                variance.
             max_samples_per_job: How many samples to request at a time.
+            target_std_error: If set, samples adaptively (see the class
+                docstring) until the estimated standard error of the energy is
+                at most this value.
+
+        Raises:
+            ValueError: `target_std_error` is not positive.
         """
+        if target_std_error is not None and target_std_error <= 0:
+            raise ValueError(
+                f'target_std_error must be positive: {target_std_error!r}')
         observable = ops.PauliSum.wrap(observable)
 
         self._circuit = circuit
@@ -64,7 +93,15 @@ class PauliSumCollector(collector.Collector):
         self._samples_per_term = samples_per_term
         self._total_samples_requested = 0
 
-    def next_job(self) -> Optional['cirq.CircuitSampleJob']:
+        self._target_std_error = target_std_error
+        self._groups: List[_TermGroup] = []
+        if target_std_error is not None:
+            self._groups = _group_qubit_wise_commuting(circuit,
+                                                       self._pauli_coef_terms)
+
+    def next_job(self) -> Optional[collector.CIRCUIT_SAMPLE_JOB_TREE]:
+        if self._target_std_error is not None:
+            return self._next_adaptive_jobs(self._target_std_error)
         i = self._total_samples_requested // self._samples_per_term
         if i >= len(self._pauli_coef_terms):
             return None
@@ -79,8 +116,45 @@ class PauliSumCollector(collector.Collector):
             repetitions=amount_to_request,
             tag=pauli)
 
+    def _next_adaptive_jobs(self, target_std_error: float
+                           ) -> List['cirq.CircuitSampleJob']:
+        # Every group first gets its initial samples.
+        amounts = [
+            max(0, self._samples_per_term - g.requested) for g in self._groups
+        ]
+        if not any(amounts):
+            # Allocate more samples only once all results are in.
+            if any(g.requested > g.samples for g in self._groups):
+                return []
+            if self.estimated_std_error() <= target_std_error:
+                return []
+            deviations = [g.std_dev() for g in self._groups]
+            total = sum(deviations)
+            variance = target_std_error**2
+            amounts = [
+                max(0,
+                    int(np.ceil(d * total / variance)) - g.requested)
+                for g, d in zip(self._groups, deviations)
+            ]
+
+        jobs = []
+        for i, (group, amount) in enumerate(zip(self._groups, amounts)):
+            amount = min(amount, self._samples_per_job)
+            if amount:
+                group.requested += amount
+                jobs.append(
+                    collector.CircuitSampleJob(circuit=cast(
+                        'cirq.Circuit', group.circuit),
+                                               repetitions=amount,
+                                               tag=i))
+        return jobs
+
     def on_job_result(self, job: 'cirq.CircuitSampleJob',
                       result: 'cirq.TrialResult'):
+        if self._target_std_error is not None:
+            self._groups[cast(int, job.tag)].add_samples(
+                result.measurements['out'])
+            return
         job_id = cast(ops.PauliString, job.tag)
         parities = result.histogram(key='out',
                                     fold_func=lambda bits: np.sum(bits) % 2)
@@ -90,6 +164,10 @@ class PauliSumCollector(collector.Collector):
     def estimated_energy(self) -> Union[float, complex]:
         """Sums up the sampled expectations, weighted by their coefficients."""
         energy = 0j
+        if self._target_std_error is not None:
+            for group in self._groups:
+                if group.samples:
+                    energy += group.total / group.samples
         for pauli_string, coef in self._pauli_coef_terms:
             a = self._zeros[pauli_string]
             b = self._ones[pauli_string]
@@ -101,6 +179,91 @@ class PauliSumCollector(collector.Collector):
         energy += self._identity_offset
         return energy
 
+    def estimated_std_error(self) -> float:
+        """Estimates the standard error of `estimated_energy`.
+
+        The variance of each sampled quantity is estimated from the samples
+        collected so far. Terms or groups without samples are ignored.
+        """
+        variance = 0.0
+        if self._target_std_error is not None:
+            for group in self._groups:
+                if group.samples:
+                    variance += group.std_dev()**2 / group.samples
+        for pauli_string, coef in self._pauli_coef_terms:
+            a = self._zeros[pauli_string]
+            b = self._ones[pauli_string]
+            if a + b:
+                mean = (a - b) / (a + b)
+                variance += abs(coef)**2 * (1 - mean**2) / (a + b)
+        return float(np.sqrt(variance))
+
+
+class _TermGroup:
+    """Qubit-wise commuting terms measured together, with their statistics."""
+
+    def __init__(self) -> None:
+        self.basis: Dict['cirq.Qid', 'cirq.Pauli'] = {}
+        self.terms: List[Tuple['cirq.PauliString', complex]] = []
+        self.circuit: Optional['cirq.Circuit'] = None
+        self.requested = 0
+        self.samples = 0
+        # Sums of the coefficient weighted observed values of the terms, and
+        # of their squared magnitudes.
+        self.total = 0j
+        self.total_squared = 0.0
+        self._columns: List[Tuple[Sequence[int], complex]] = []
+
+    def can_measure(self, pauli_string: 'cirq.PauliString') -> bool:
+        return all(
+            self.basis.get(q, p) == p for q, p in pauli_string.items())
+
+    def add_term(self, pauli_string: 'cirq.PauliString', coef: complex) -> None:
+        self.basis.update(pauli_string.items())
+        self.terms.append((pauli_string, coef))
+
+    def finalize(self, circuit: 'cirq.Circuit') -> None:
+        self.circuit = _circuit_plus_pauli_string_measurements(
+            circuit, ops.PauliString(qubit_pauli_map=self.basis))
+        index = {q: i for i, q in enumerate(sorted(self.basis.keys()))}
+        self._columns = [([index[q] for q in pauli_string.keys()],
+                          complex(coef)) for pauli_string, coef in self.terms]
+
+    def add_samples(self, bits: np.ndarray) -> None:
+        values = np.zeros(len(bits), dtype=complex)
+        for columns, coef in self._columns:
+            parities = np.sum(bits[:, columns], axis=1) % 2
+            values += coef * (1 - 2 * parities)
+        self.samples += len(bits)
+        self.total += complex(np.sum(values))
+        self.total_squared += float(np.sum(np.abs(values)**2))
+
+    def std_dev(self) -> float:
+        if not self.samples:
+            return 0.0
+        mean = self.total / self.samples
+        variance = self.total_squared / self.samples - abs(mean)**2
+        return float(np.sqrt(max(variance, 0.0)))
+
+
+def _group_qubit_wise_commuting(
+        circuit: 'cirq.Circuit',
+        terms: Sequence[Tuple['cirq.PauliString', complex]]
+) -> List[_TermGroup]:
+    """Greedily groups terms, largest coefficients first."""
+    groups: List[_TermGroup] = []
+    for pauli_string, coef in sorted(terms, key=lambda t: -abs(t[1])):
+        for group in groups:
+            if group.can_measure(pauli_string):
+                break
+        else:
+            group = _TermGroup()
+            groups.append(group)
+        group.add_term(pauli_string, coef)
+    for group in groups:
+        group.finalize(circuit)
+    return groups
+
 
 def _circuit_plus_pauli_string_measurements(circuit: 'cirq.Circuit',
                                             pauli_string: 'cirq.PauliString'
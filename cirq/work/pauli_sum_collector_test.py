@@ -67,3 +67,59 @@ def test_pauli_string_sample_collector_extra_qubit_x():
                                samples_per_term=10000)
     p.collect(sampler=cirq.Simulator())
     assert abs(p.estimated_energy()) < 0.5
+
+
+def test_pauli_sum_collector_adaptive():
+    a, b = cirq.LineQubit.range(2)
+    recorded = []
+
+    class RecordingSimulator(cirq.Simulator):
+
+        def run_sweep(self, program, params, repetitions=1):
+            recorded.append(repetitions)
+            return super().run_sweep(program, params, repetitions)
+
+    p = cirq.PauliSumCollector(circuit=cirq.Circuit(cirq.H(a)),
+                               observable=3 * cirq.Z(a) + cirq.Z(b) +
+                               cirq.X(a),
+                               samples_per_term=50,
+                               target_std_error=0.1)
+    p.collect(sampler=RecordingSimulator(seed=1))
+    assert p.estimated_std_error() <= 0.1
+    assert abs(p.estimated_energy() - 2) < 0.5
+    # Z(a) and Z(b) share a measurement setting, and X(a) has no variance, so
+    # only the first setting gets more than its initial samples.
+    assert recorded[:2] == [50, 50]
+    assert sum(recorded) < 1000
+
+
+def test_pauli_sum_collector_adaptive_no_variance():
+    a, b = cirq.LineQubit.range(2)
+    p = cirq.PauliSumCollector(circuit=cirq.Circuit(cirq.H(a), cirq.CNOT(a, b),
+                                                    cirq.X(a), cirq.Z(b)),
+                               observable=cirq.X(a) * cirq.X(b) -
+                               16 * cirq.Y(a) * cirq.Y(b) +
+                               4 * cirq.Z(a) * cirq.Z(b) + 1,
+                               samples_per_term=10,
+                               target_std_error=0.01)
+    p.collect(sampler=cirq.Simulator())
+    assert p.estimated_energy() == 12
+    assert p.estimated_std_error() == 0
+
+
+def test_pauli_sum_collector_std_error():
+    a = cirq.LineQubit(0)
+    p = cirq.PauliSumCollector(circuit=cirq.Circuit(cirq.H(a)),
+                               observable=2 * cirq.Z(a),
+                               samples_per_term=400)
+    assert p.estimated_std_error() == 0
+    p.collect(sampler=cirq.Simulator(seed=2))
+    assert abs(p.estimated_std_error() - 0.1) < 0.01
+
+
+def test_pauli_sum_collector_invalid_target():
+    with pytest.raises(ValueError, match='positive'):
+        _ = cirq.PauliSumCollector(circuit=cirq.Circuit(),
+                                   observable=cirq.Z(cirq.LineQubit(0)),
+                                   samples_per_term=10,
+                                   target_std_error=0)
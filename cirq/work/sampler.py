@@ -13,19 +13,33 @@
 # limitations under the License.
 """Abstract base class for things sampling quantum circuits."""
 
-from typing import List, TYPE_CHECKING
+from typing import List, Optional, Sequence, TYPE_CHECKING
 import abc
+import concurrent.futures
+import functools
 
 import pandas as pd
 
 from cirq import study
+from cirq._compat import get_running_loop
 
 if TYPE_CHECKING:
     import cirq
 
 
 class Sampler(metaclass=abc.ABCMeta):
-    """Something capable of sampling quantum circuits. Simulator or hardware."""
+    """Something capable of sampling quantum circuits. Simulator or hardware.
+
+    Attributes:
+        executor: The executor that `run_async` and `run_sweep_async` run the
+            synchronous `run` and `run_sweep` methods on by default. `None`
+            (the default) uses the event loop's default executor, which is a
+            thread pool. A `concurrent.futures.ProcessPoolExecutor` requires
+            the sampler and circuits to be picklable, and gives each process a
+            copy of the sampler (including any random number generator).
+    """
+
+    executor: Optional[concurrent.futures.Executor] = None
 
     def run(
             self,
@@ -49,6 +63,47 @@ class Sampler(metaclass=abc.ABCMeta):
         return self.run_sweep(program, study.ParamResolver(param_resolver),
                               repetitions)[0]
 
+    def run_counts(
+            self,
+            program: 'cirq.Circuit',
+            param_resolver: 'cirq.ParamResolverOrSimilarType' = None,
+            repetitions: int = 1,
+            *,
+            max_batch_repetitions: Optional[int] = None,
+    ) -> 'cirq.CountsTrialResult':
+        """Samples from the given Circuit, keeping only counts of the results.
+
+        Args:
+            program: The circuit to sample from.
+            param_resolver: Parameters to run with the program.
+            repetitions: The number of times to sample.
+            max_batch_repetitions: If set, the repetitions are sampled with
+                several calls to `run` of at most this many repetitions each,
+                so that only one batch of per-repetition results is held in
+                memory at a time.
+
+        Returns:
+            CountsTrialResult for a run.
+
+        Raises:
+            ValueError: `max_batch_repetitions` is not positive.
+        """
+        if max_batch_repetitions is None:
+            max_batch_repetitions = max(repetitions, 1)
+        if max_batch_repetitions < 1:
+            raise ValueError(
+                f'max_batch_repetitions must be positive, not '
+                f'{max_batch_repetitions}.')
+        result = None
+        remaining = repetitions
+        while result is None or remaining > 0:
+            batch = min(remaining, max_batch_repetitions)
+            counts = study.CountsTrialResult.from_trial_result(
+                self.run(program, param_resolver, batch))
+            result = counts if result is None else result + counts
+            remaining -= batch
+        return result
+
     def sample(
             self,
             program: 'cirq.Circuit',
@@ -159,13 +214,46 @@ class Sampler(metaclass=abc.ABCMeta):
             resolver.
         """
 
+    def run_batch(
+            self,
+            programs: Sequence['cirq.Circuit'],
+            params_list: Optional[Sequence['cirq.Sweepable']] = None,
+            repetitions: int = 1,
+    ) -> List[List['cirq.TrialResult']]:
+        """Samples from each of the given circuits.
+
+        By default, this method calls `run_sweep` once per circuit. Samplers
+        that can submit several circuits in a single request (e.g. to a remote
+        service with a per-request latency) should override it.
+
+        Args:
+            programs: The circuits to sample from.
+            params_list: Parameters to run with each circuit, paired in order
+                with `programs`. Defaults to no parameters for every circuit.
+            repetitions: The number of times to sample, for each parameter
+                resolver of each circuit.
+
+        Returns:
+            One list of TrialResults per circuit, with one TrialResult for each
+            parameter resolver of that circuit's sweep.
+
+        Raises:
+            ValueError: The number of circuits and sweeps don't match.
+        """
+        params_list = _params_list(programs, params_list)
+        return [
+            self.run_sweep(program, params=params, repetitions=repetitions)
+            for program, params in zip(programs, params_list)
+        ]
+
     async def run_async(self, program: 'cirq.Circuit', *,
                         repetitions: int) -> 'cirq.TrialResult':
         """Asynchronously samples from the given Circuit.
 
-        By default, this method invokes `run` synchronously and simply exposes
-        its result is an awaitable. Child classes that are capable of true
-        asynchronous sampling should override it to use other strategies.
+        By default, this method invokes `run` on `self.executor`, so that the
+        event loop keeps running and several calls can sample concurrently.
+        Child classes that are capable of true asynchronous sampling should
+        override it to use other strategies.
 
         Args:
             program: The circuit to sample from.
@@ -174,7 +262,9 @@ class Sampler(metaclass=abc.ABCMeta):
         Returns:
             An awaitable TrialResult.
         """
-        return self.run(program, repetitions=repetitions)
+        return await get_running_loop().run_in_executor(
+            self.executor,
+            functools.partial(self.run, program, repetitions=repetitions))
 
     async def run_sweep_async(
             self,
@@ -184,9 +274,10 @@ class Sampler(metaclass=abc.ABCMeta):
     ) -> List['cirq.TrialResult']:
         """Asynchronously sweeps and samples from the given Circuit.
 
-        By default, this method invokes `run_sweep` synchronously and simply
-        exposes its result is an awaitable. Child classes that are capable of
-        true asynchronous sampling should override it to use other strategies.
+        By default, this method invokes `run_sweep` on `self.executor`, so that
+        the event loop keeps running and several calls can sample
+        concurrently. Child classes that are capable of true asynchronous
+        sampling should override it to use other strategies.
 
         Args:
             program: The circuit to sample from.
@@ -198,4 +289,47 @@ class Sampler(metaclass=abc.ABCMeta):
         Returns:
             An awaitable TrialResult.
         """
-        return self.run_sweep(program, params=params, repetitions=repetitions)
+        return await get_running_loop().run_in_executor(
+            self.executor,
+            functools.partial(self.run_sweep,
+                              program,
+                              params=params,
+                              repetitions=repetitions))
+
+    async def run_batch_async(
+            self,
+            programs: Sequence['cirq.Circuit'],
+            params_list: Optional[Sequence['cirq.Sweepable']] = None,
+            repetitions: int = 1,
+    ) -> List[List['cirq.TrialResult']]:
+        """Asynchronously samples from each of the given circuits.
+
+        By default, this method invokes `run_batch` on `self.executor`.
+
+        Args:
+            programs: The circuits to sample from.
+            params_list: Parameters to run with each circuit, paired in order
+                with `programs`. Defaults to no parameters for every circuit.
+            repetitions: The number of times to sample, for each parameter
+                resolver of each circuit.
+
+        Returns:
+            An awaitable list of TrialResult lists, one per circuit.
+        """
+        return await get_running_loop().run_in_executor(
+            self.executor,
+            functools.partial(self.run_batch,
+                              programs,
+                              params_list=params_list,
+                              repetitions=repetitions))
+
+
+def _params_list(programs: Sequence['cirq.Circuit'],
+                 params_list: Optional[Sequence['cirq.Sweepable']]
+                ) -> Sequence['cirq.Sweepable']:
+    if params_list is None:
+        return [None] * len(programs)
+    if len(programs) != len(params_list):
+        raise ValueError(f'Got {len(programs)} circuits but '
+                         f'{len(params_list)} sweeps.')
+    return params_list
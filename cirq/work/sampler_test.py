@@ -12,6 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Tests for cirq.Sampler."""
+import collections
+import concurrent.futures
+import threading
+
 import pytest
 
 import pandas as pd
@@ -124,6 +128,27 @@ def test_sampler_sample_no_params():
         ]))
 
 
+def test_sampler_run_counts():
+    a, b = cirq.LineQubit.range(2)
+    sampler = cirq.Simulator()
+    circuit = cirq.Circuit(cirq.X(a), cirq.measure(a, b, key='out'))
+
+    result = sampler.run_counts(circuit, repetitions=10)
+    assert isinstance(result, cirq.CountsTrialResult)
+    assert result.repetitions == 10
+    assert result.histogram(key='out') == collections.Counter({2: 10})
+
+    batched = sampler.run_counts(circuit,
+                                 repetitions=10,
+                                 max_batch_repetitions=3)
+    assert batched == result
+    assert len(batched.counts) == 1
+
+    assert sampler.run_counts(circuit, repetitions=0).repetitions == 0
+    with pytest.raises(ValueError, match='max_batch_repetitions'):
+        _ = sampler.run_counts(circuit, max_batch_repetitions=0)
+
+
 def test_sampler_sample_inconsistent_keys():
     q = cirq.LineQubit(0)
     sampler = cirq.Simulator()
@@ -140,6 +165,29 @@ def test_sampler_sample_inconsistent_keys():
         ])
 
 
+@pytest.mark.asyncio
+async def test_sampler_async_runs_on_executor():
+    threads = []
+
+    class S(cirq.Sampler):
+
+        def run_sweep(self, program, params, repetitions: int = 1):
+            threads.append(threading.get_ident())
+            return [cirq.TrialResult(params=cirq.ParamResolver(params),
+                                     measurements={})]
+
+    await S().run_async(cirq.Circuit(), repetitions=1)
+    assert threads[-1] != threading.get_ident()
+
+    with concurrent.futures.ThreadPoolExecutor(1) as executor:
+        sampler = S()
+        sampler.executor = executor
+        executor_thread = executor.submit(threading.get_ident).result()
+        await sampler.run_async(cirq.Circuit(), repetitions=1)
+        await sampler.run_sweep_async(cirq.Circuit(), params=None)
+        assert threads[-2:] == [executor_thread] * 2
+
+
 @pytest.mark.asyncio
 async def test_sampler_async_not_run_inline():
     ran = False
@@ -155,3 +203,34 @@ async def test_sampler_async_not_run_inline():
     assert not ran
     assert await a == []
     assert ran
+
+
+def test_sampler_run_batch():
+    a, b = cirq.LineQubit.range(2)
+    circuit1 = cirq.Circuit(cirq.X(a)**sympy.Symbol('t'), cirq.measure(a))
+    circuit2 = cirq.Circuit(cirq.X(b), cirq.measure(b))
+    sampler = cirq.Simulator()
+    results = sampler.run_batch(
+        [circuit1, circuit2],
+        params_list=[cirq.Points('t', [0, 1]), None],
+        repetitions=3)
+    assert len(results) == 2
+    assert [r.histogram(key='0') for r in results[0]] == [{0: 3}, {1: 3}]
+    assert len(results[1]) == 1
+    assert results[1][0].histogram(key='1') == {1: 3}
+
+    results = sampler.run_batch([circuit2, circuit2], repetitions=2)
+    assert [len(r) for r in results] == [1, 1]
+    assert results[0][0].repetitions == 2
+
+    with pytest.raises(ValueError, match='sweeps'):
+        _ = sampler.run_batch([circuit1, circuit2], params_list=[None])
+
+
+@pytest.mark.asyncio
+async def test_sampler_run_batch_async():
+    q = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.X(q), cirq.measure(q))
+    results = await cirq.Simulator().run_batch_async([circuit, circuit],
+                                                     repetitions=4)
+    assert [r[0].histogram(key='0') for r in results] == [{1: 4}, {1: 4}]
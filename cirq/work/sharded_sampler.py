@@ -0,0 +1,243 @@
+# Copyright 2020 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A sampler that splits sweeps into shards sampled in parallel."""
+
+from typing import (Any, Callable, Dict, Iterator, List, Optional, Sequence,
+                    Tuple, TYPE_CHECKING)
+import asyncio
+import concurrent.futures
+import os
+import threading
+import uuid
+
+import numpy as np
+
+from cirq import study
+from cirq._compat import get_running_loop
+from cirq.work import sampler
+
+if TYPE_CHECKING:
+    import cirq
+
+
+class ShardedSampler(sampler.Sampler):
+    """Samples sweeps in parallel, by splitting them into shards.
+
+    Each call to `run_sweep` splits the sweep into consecutive shards with
+    `cirq.shard_sweep`, samples the shards on an executor, and merges the
+    results back in the order of the sweep. `stream_sweep` instead gives the
+    results of each shard as soon as it completes.
+
+    By default, the shards are sampled by a pool of worker processes. Each
+    worker (or each thread, for an executor with worker threads) creates its
+    own sampler by calling `sampler_factory` the first time it samples a
+    shard, and reuses it for later shards. So the factory
+    (e.g. `cirq.Simulator`, or a `functools.partial` of it) must be picklable,
+    but the samplers it creates don't need to be. The global numpy random
+    state is reseeded in each worker process before the factory is called, so
+    that unseeded simulators in different workers don't give the same
+    samples. Samplers created with an explicit seed will give the same samples
+    in every worker.
+
+    Any `concurrent.futures.Executor` can be given instead of the process
+    pool, e.g. one whose workers run on other machines. The asynchronous
+    methods sample the shards on the same executor, and await their results
+    without blocking the event loop.
+
+    Examples:
+
+        ```
+        sweep = cirq.Linspace('t', 0, 1, 10**5)
+        with cirq.ShardedSampler(cirq.Simulator, max_workers=8) as sampler:
+            results = sampler.run_sweep(circuit, sweep, repetitions=100)
+        ```
+    """
+
+    def __init__(self,
+                 sampler_factory: Callable[[], 'cirq.Sampler'],
+                 *,
+                 max_workers: Optional[int] = None,
+                 max_shard_size: Optional[int] = None,
+                 executor: Optional[concurrent.futures.Executor] = None):
+        """
+        Args:
+            sampler_factory: A picklable function that creates the sampler
+                used by a worker.
+            max_workers: The number of worker processes in the default process
+                pool. Defaults to the number of processors of the machine.
+                Each sweep is split into this many shards, unless
+                `max_shard_size` requires more.
+            max_shard_size: If set, the maximum number of sweep points in a
+                shard.
+            executor: The executor to sample the shards on, instead of a new
+                process pool. It is stored as the `executor` attribute, and
+                isn't shut down by `close`.
+
+        Raises:
+            ValueError: `max_workers` is not positive.
+        """
+        if max_workers is not None and max_workers <= 0:
+            raise ValueError(f'max_workers must be positive: {max_workers!r}')
+        self._sampler_factory = sampler_factory
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._max_shard_size = max_shard_size
+        self.executor = executor
+        self._own_pool: Optional[concurrent.futures.Executor] = None
+        # Identifies the samplers created for this object in the workers.
+        self._key = uuid.uuid4().hex
+
+    def _get_pool(self) -> concurrent.futures.Executor:
+        if self.executor is not None:
+            return self.executor
+        if self._own_pool is None:
+            self._own_pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self._max_workers)
+        return self._own_pool
+
+    def close(self) -> None:
+        """Shuts down the worker processes, if this sampler started them.
+
+        The samplers created for this object in this process (e.g. by the
+        workers of a thread pool executor) are also released. Those created in
+        the processes of a given executor live as long as the processes.
+        """
+        if self._own_pool is not None:
+            self._own_pool.shutdown()
+            self._own_pool = None
+        with _worker_samplers_lock:
+            for key in [k for k in _worker_samplers if k[0] == self._key]:
+                del _worker_samplers[key]
+
+    def __enter__(self) -> 'ShardedSampler':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def stream_sweep(
+            self,
+            program: 'cirq.Circuit',
+            params: 'cirq.Sweepable',
+            repetitions: int = 1,
+    ) -> Iterator[Tuple[int, List['cirq.TrialResult']]]:
+        """Samples the shards of a sweep, giving their results as they complete.
+
+        Args:
+            program: The circuit to sample from.
+            params: Parameters to run with the program.
+            repetitions: The number of times to sample, for each parameter
+                resolver.
+
+        Yields:
+            Tuples `(start, results)`, in the order in which the shards
+            complete, where `results` are the TrialResults of a shard and
+            `start` is the index (in the list returned by `run_sweep`) of its
+            first TrialResult.
+        """
+        futures: Dict[concurrent.futures.Future, int] = {}
+        try:
+            self._submit_shards(program, params, repetitions, out=futures)
+            for future in concurrent.futures.as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def run_sweep(
+            self,
+            program: 'cirq.Circuit',
+            params: 'cirq.Sweepable',
+            repetitions: int = 1,
+    ) -> List['cirq.TrialResult']:
+        shards = dict(self.stream_sweep(program, params, repetitions))
+        return [result for start in sorted(shards) for result in shards[start]]
+
+    async def run_async(self, program: 'cirq.Circuit', *,
+                        repetitions: int) -> 'cirq.TrialResult':
+        results = await self.run_sweep_async(program, study.ParamResolver(),
+                                             repetitions)
+        return results[0]
+
+    async def run_sweep_async(
+            self,
+            program: 'cirq.Circuit',
+            params: 'cirq.Sweepable',
+            repetitions: int = 1,
+    ) -> List['cirq.TrialResult']:
+        futures: Dict[concurrent.futures.Future, int] = {}
+        try:
+            self._submit_shards(program, params, repetitions, out=futures)
+            loop = get_running_loop()
+            shards = await asyncio.gather(
+                *[asyncio.wrap_future(future, loop=loop) for future in futures])
+        finally:
+            for future in futures:
+                future.cancel()
+        # The futures are in the order of their shards.
+        return [result for results in shards for result in results]
+
+    async def run_batch_async(
+            self,
+            programs: Sequence['cirq.Circuit'],
+            params_list: Optional[Sequence['cirq.Sweepable']] = None,
+            repetitions: int = 1,
+    ) -> List[List['cirq.TrialResult']]:
+        params_list = sampler._params_list(programs, params_list)
+        return list(await asyncio.gather(*[
+            self.run_sweep_async(program, params, repetitions)
+            for program, params in zip(programs, params_list)
+        ]))
+
+    def _submit_shards(self, program: 'cirq.Circuit', params: 'cirq.Sweepable',
+                       repetitions: int, *,
+                       out: Dict[concurrent.futures.Future, int]) -> None:
+        """Submits the shards of a sweep to the executor.
+
+        Adds the future of each shard to `out`, in order, with the index of
+        its first TrialResult.
+        """
+        pool = self._get_pool()
+        start = 0
+        for sweep in study.to_sweeps(params):
+            for shard in study.shard_sweep(sweep,
+                                           num_shards=self._max_workers,
+                                           max_shard_size=self._max_shard_size):
+                future = pool.submit(_run_shard,
+                                     self._key, self._sampler_factory,
+                                     os.getpid(), program, shard, repetitions)
+                out[future] = start
+                start += len(shard)
+
+
+# The samplers created in this (worker) process, by the key of their
+# ShardedSampler and the thread that uses them. Each thread has its own
+# sampler, since samplers (e.g. seeded simulators) needn't be thread safe.
+_worker_samplers: Dict[Tuple[str, int], 'cirq.Sampler'] = {}
+_worker_samplers_lock = threading.Lock()
+
+
+def _run_shard(key: str, sampler_factory: Callable[[], 'cirq.Sampler'],
+               parent_pid: int, program: 'cirq.Circuit', params: 'cirq.Sweep',
+               repetitions: int) -> List['cirq.TrialResult']:
+    worker_key = (key, threading.get_ident())
+    with _worker_samplers_lock:
+        worker_sampler = _worker_samplers.get(worker_key)
+    if worker_sampler is None:
+        if os.getpid() != parent_pid:
+            # Forked workers start with the global random state of the parent.
+            np.random.seed()
+        worker_sampler = sampler_factory()
+        with _worker_samplers_lock:
+            _worker_samplers[worker_key] = worker_sampler
+    return worker_sampler.run_sweep(program, params, repetitions)
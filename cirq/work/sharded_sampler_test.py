@@ -0,0 +1,124 @@
+# Copyright 2020 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import concurrent.futures
+import functools
+
+import pytest
+import sympy
+
+import cirq
+
+
+def _circuit():
+    q = cirq.LineQubit(0)
+    return cirq.Circuit(cirq.X(q)**sympy.Symbol('t'), cirq.measure(q, key='m'))
+
+
+def test_run_sweep_in_processes():
+    sweep = cirq.Points('t', [0, 1]) * cirq.Points('s', [0, 1, 2])
+    with cirq.ShardedSampler(cirq.Simulator, max_workers=2) as sampler:
+        results = sampler.run_sweep(_circuit(), sweep, repetitions=3)
+    assert [r.params for r in results] == list(sweep)
+    assert [r.histogram(key='m') for r in results] == [{0: 3}] * 3 + [{1: 3}
+                                                                     ] * 3
+
+
+def test_run_sweep_on_executor():
+    created = []
+
+    def factory():
+        created.append(1)
+        return cirq.Simulator()
+
+    sweep = cirq.Linspace('t', 0, 1, 2) + cirq.Points('s', [3, 4])
+    with concurrent.futures.ThreadPoolExecutor(2) as executor:
+        sampler = cirq.ShardedSampler(factory,
+                                      max_workers=3,
+                                      max_shard_size=1,
+                                      executor=executor)
+        results = sampler.run_sweep(_circuit(),
+                                    [sweep, {
+                                        't': 1,
+                                        's': 5
+                                    }],
+                                    repetitions=2)
+        assert sampler.executor is executor
+        sampler.close()
+        # The executor is still usable.
+        assert executor.submit(lambda: 1).result() == 1
+        # The samplers created in this process were released.
+        assert all(key != sampler._key
+                   for key, _ in cirq.work.sharded_sampler._worker_samplers)
+    assert [r.params for r in results] == list(sweep) + [
+        cirq.ParamResolver({
+            't': 1,
+            's': 5
+        })
+    ]
+    assert [r.histogram(key='m') for r in results] == [{0: 2}, {1: 2}, {1: 2}]
+    assert 1 <= len(created) <= 2
+
+
+def test_stream_sweep():
+    sweep = cirq.Points('t', [0, 0, 1, 1, 1])
+    with concurrent.futures.ThreadPoolExecutor(1) as executor:
+        sampler = cirq.ShardedSampler(functools.partial(cirq.Simulator,
+                                                        seed=1),
+                                      max_workers=2,
+                                      executor=executor)
+        shards = sorted(sampler.stream_sweep(_circuit(), sweep, repetitions=1))
+    assert [(start, len(results)) for start, results in shards] == [(0, 3),
+                                                                    (3, 2)]
+    assert shards[1][1][0].params == cirq.ParamResolver({'t': 1})
+
+
+@pytest.mark.asyncio
+async def test_async_on_executor():
+    created = []
+
+    def factory():
+        created.append(1)
+        return cirq.Simulator()
+
+    sweep = cirq.Points('t', [0, 1, 1])
+    with concurrent.futures.ThreadPoolExecutor(2) as executor:
+        with cirq.ShardedSampler(factory, max_workers=2,
+                                 executor=executor) as sampler:
+            results = await sampler.run_sweep_async(_circuit(),
+                                                    sweep,
+                                                    repetitions=2)
+            assert [r.params for r in results] == list(sweep)
+            histograms = [r.histogram(key='m') for r in results]
+            assert histograms == [{0: 2}, {1: 2}, {1: 2}]
+
+            result = await sampler.run_async(cirq.Circuit(
+                cirq.measure(cirq.LineQubit(0), key='m')),
+                                             repetitions=3)
+            assert result.histogram(key='m') == {0: 3}
+
+            batch = await sampler.run_batch_async(
+                [_circuit(), _circuit()],
+                params_list=[{
+                    't': 0
+                }, sweep],
+            )
+            assert [len(results) for results in batch] == [1, 3]
+            assert batch[1][2].histogram(key='m') == {1: 1}
+    assert created
+
+
+def test_invalid_max_workers():
+    with pytest.raises(ValueError, match='max_workers'):
+        _ = cirq.ShardedSampler(cirq.Simulator, max_workers=0)